@@ -0,0 +1,61 @@
+import csv
+import sqlite3
+from datetime import date, datetime, timedelta
+
+
+def open_db(path):
+    """Open a SQLite connection with the pragmas the helper scripts share."""
+    conn = sqlite3.connect(path)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA temp_store=MEMORY')
+    conn.execute('PRAGMA mmap_size=268435456')
+    return conn
+
+
+def day_bounds(day):
+    """(day, next_day) ISO strings for a `timestamp >= ? AND timestamp < ?` range scan."""
+    return day, (date.fromisoformat(day) + timedelta(days=1)).isoformat()
+
+
+class TradeLog:
+    """
+    Buffers trades closed by a script and writes them on exit: one append to
+    trades.csv and one transaction on the trades table. Rows logged before an
+    exception are still written. All rows of a batch share one timestamp, so
+    the batch can be selected with `WHERE timestamp = ?`.
+    """
+
+    def __init__(self, db_path, csv_path, source):
+        self.db_path = db_path
+        self.csv_path = csv_path
+        self.source = source
+        self.rows = []
+        self.conn = None
+        self.ts = None
+
+    def __enter__(self):
+        self.conn = open_db(str(self.db_path))
+        self.ts = datetime.utcnow().isoformat()
+        return self
+
+    def log(self, symbol, side, quantity, price, pnl):
+        self.rows.append((self.ts, symbol, side, quantity, price, pnl))
+
+    def __exit__(self, *exc):
+        try:
+            if self.rows:
+                with open(self.csv_path, 'a', newline='') as f:
+                    csv.writer(f).writerows([ts, sym, side, qty, price, '', pnl] for ts, sym, side, qty, price, pnl in self.rows)
+                try:
+                    with self.conn:
+                        self.conn.executemany(
+                            'INSERT INTO trades (timestamp, symbol, side, quantity, price, score, pnl, strategy_data) VALUES (?,?,?,?,?,?,?,?)',
+                            [(ts, sym, side, qty, price, 0.0, pnl, f'{{"source":"{self.source}"}}')
+                             for ts, sym, side, qty, price, pnl in self.rows]
+                        )
+                except sqlite3.Error as e:
+                    print(f'[{self.source}] DB log error: {e}')
+        finally:
+            self.conn.close()
+        return False
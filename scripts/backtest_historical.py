@@ -9,12 +9,11 @@ from typing import Dict, List, Tuple
 import pandas as pd
 import numpy as np
 import yfinance as yf
-import yaml
 
 # --- Import signal/exit agents (use existing logic) ---
 from trading_floor.agents.signal_momentum import MomentumSignalAgent
-from trading_floor.agents.signal_breakout import BreakoutSignalAgent
 from trading_floor.agents.exits import ExitManager
+from trading_floor.config import load as load_config
 
 
 # ----------------------------
@@ -63,10 +62,12 @@ class InMemoryPortfolio:
         initial_cash = cfg.get("risk", {}).get("equity", 5000.0)
         self.state = PortfolioState(cash=initial_cash, equity=initial_cash)
 
-    def mark_to_market(self, prices: Dict[str, float]):
+    def mark_to_market(self, prices: np.ndarray, sym_idx: Dict[str, int]):
+        """Mark positions from a price row indexed by `sym_idx` (0.0 = no price)."""
         pos_value = 0.0
         for sym, pos in self.state.positions.items():
-            price = prices.get(sym)
+            j = sym_idx.get(sym)
+            price = float(prices[j]) if j is not None else 0.0
             if price:
                 pos.current_price = price
                 if price > pos.highest_price:
@@ -208,21 +209,72 @@ def _to_eastern(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def _calc_atr_pct(df: pd.DataFrame, period: int, price: float) -> float | None:
-    if df is None or df.empty or len(df) < period + 1:
-        return None
-    h = df["high"]
-    l = df["low"]
-    c = df["close"]
-    tr = pd.concat([
-        h - l,
-        (h - c.shift(1)).abs(),
-        (l - c.shift(1)).abs()
-    ], axis=1).max(axis=1)
-    atr = tr.rolling(period).mean().iloc[-1]
-    if math.isnan(atr) or atr <= 0 or price <= 0:
-        return None
-    return float(atr / price)
+def _atr_series(df: pd.DataFrame, period: int) -> np.ndarray:
+    """Rolling ATR for every bar; NaN until `period + 1` bars are available."""
+    h = df["high"].to_numpy(dtype=np.float64)
+    l = df["low"].to_numpy(dtype=np.float64)
+    c = df["close"].to_numpy(dtype=np.float64)
+    atr = np.full(len(c), np.nan)
+    if len(c) < period + 1:
+        return atr
+    prev_c = np.empty_like(c)
+    prev_c[0] = c[0]
+    prev_c[1:] = c[:-1]
+    tr = np.maximum.reduce([h - l, np.abs(h - prev_c), np.abs(l - prev_c)])
+    atr[period - 1:] = np.lib.stride_tricks.sliding_window_view(tr, period).mean(axis=1)
+    atr[:period] = np.nan
+    return atr
+
+
+def _signal_series(
+    df: pd.DataFrame,
+    momentum_short: int,
+    breakout_lookback: int,
+    breakout_smooth: bool,
+    atr_period: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Momentum, breakout and ATR for every 30m bar of one symbol.
+
+    Value i equals what MomentumSignalAgent / BreakoutSignalAgent (or the
+    binary breakout) would return for ``df.iloc[:i + 1]``, so the simulation
+    can look signals up by bar cursor instead of re-scoring a slice per tick.
+    """
+    closes = df["close"]
+    c = closes.to_numpy(dtype=np.float64)
+
+    # Momentum: distance of last close from the `short`-bar SMA
+    sma = closes.rolling(momentum_short).mean().to_numpy(dtype=np.float64)
+    mom = np.zeros_like(c)
+    ok = np.isfinite(sma) & (sma != 0)
+    mom[ok] = (c[ok] - sma[ok]) / sma[ok]
+
+    # Breakout: rolling window including the current bar
+    lb = breakout_lookback
+    roll_max = closes.rolling(lb).max().to_numpy(dtype=np.float64)
+    roll_min = closes.rolling(lb).min().to_numpy(dtype=np.float64)
+    brk = np.zeros_like(c)
+    if len(c) >= lb:
+        if breakout_smooth:
+            # Prior range excludes the current bar once there is enough history
+            rmax = np.full(len(c), np.nan, dtype=np.float32)
+            rmin = np.full(len(c), np.nan, dtype=np.float32)
+            rmax[lb - 1] = roll_max[lb - 1]
+            rmin[lb - 1] = roll_min[lb - 1]
+            rmax[lb:] = roll_max[lb - 1:-1]
+            rmin[lb:] = roll_min[lb - 1:-1]
+            rng = rmax - rmin
+            ok = np.isfinite(rng) & (rng != 0) & (rmax != 0)
+            brk[ok] = np.clip((c[ok] - rmin[ok]) / rng[ok] * 2.0 - 1.0, -1.0, 1.0)
+        else:
+            brk = np.where(c >= roll_max, 1.0, np.where(c <= roll_min, -1.0, 0.0))
+            brk[:lb - 1] = 0.0
+
+    return mom, brk, _atr_series(df, atr_period)
+
+
+def _bar_cursor(index: pd.DatetimeIndex, ticks: pd.DatetimeIndex) -> np.ndarray:
+    """Position of the last bar at or before each tick (-1 if none)."""
+    return index.searchsorted(ticks, side="right") - 1
 
 
 def _binary_breakout_score(df: pd.DataFrame, lookback: int) -> float:
@@ -297,49 +349,97 @@ def simulate_system(
     cfg_local["signals"] = dict(cfg_local.get("signals", {}))
     cfg_local["signals"]["momentum_short"] = momentum_short
 
-    mom_agent = MomentumSignalAgent(cfg_local, tracer)
-    brk_agent = BreakoutSignalAgent(cfg_local, tracer)
     exit_mgr = ExitManager(cfg_local, tracer)
     portfolio = InMemoryPortfolio(cfg_local)
 
     trade_threshold = cfg.get("signals", {}).get("trade_threshold", 0.15)
+    breakout_lookback = cfg_local.get("signals", {}).get("breakout_lookback", 10)
     atr_period = cfg.get("risk", {}).get("atr_period", 14)
     min_atr = cfg.get("risk", {}).get("min_atr_pct", 0.005)
     max_atr = cfg.get("risk", {}).get("max_atr_pct", 0.10)
     max_positions = cfg.get("risk", {}).get("max_positions", 4)
     max_position_pct = cfg.get("risk", {}).get("max_position_pct", 0.20)
+    disagreement_threshold = cfg.get("challenges", {}).get("disagreement_threshold", 1.5)
+    max_consecutive_losses = cfg.get("challenges", {}).get("max_consecutive_losses", 3)
+
+    symbols = list(data_30m.keys())
+    sym_idx = {sym: j for j, sym in enumerate(symbols)}
+    n_sym = len(symbols)
+
+    # Every 5m tick of the run, plus which of them allow entries (9:30-11:30 @ :00/:15/:30/:45)
+    day_indexes = []
+    for day in trade_dates:
+        day_date = day.date()
+        start_dt = datetime.combine(day_date, time(9, 30), tzinfo=day.tzinfo)
+        end_dt = datetime.combine(day_date, time(15, 55), tzinfo=day.tzinfo)
+        day_indexes.append(pd.date_range(start_dt, end_dt, freq="5min", tz="America/New_York"))
+    all_ticks = day_indexes[0].append(day_indexes[1:]) if day_indexes else pd.DatetimeIndex([], tz="America/New_York")
+    tick_minutes = all_ticks.hour * 60 + all_ticks.minute
+    is_entry_ts = np.asarray((tick_minutes >= 9 * 60 + 30) & (tick_minutes <= 11 * 60 + 30) & (all_ticks.minute % 15 == 0))
+
+    # Signal matrices [tick, symbol], looked up from each symbol's last closed 30m bar.
+    # float32 halves the memory traffic of the per-tick row reads; accounting stays float64.
+    n_ticks = len(all_ticks)
+    M_mom = np.zeros((n_ticks, n_sym), dtype=np.float32)
+    M_brk = np.zeros((n_ticks, n_sym), dtype=np.float32)
+    M_atr = np.full((n_ticks, n_sym), np.nan, dtype=np.float32)
+    cursor30 = np.full((n_ticks, n_sym), -1, dtype=np.int64)
+    for j, sym in enumerate(symbols):
+        df30 = data_30m[sym]
+        if df30.empty:
+            continue
+        mom, brk, atr = _signal_series(df30, momentum_short, breakout_lookback, breakout_smooth, atr_period)
+        cur = _bar_cursor(df30.index, all_ticks)
+        has_bar = cur >= 0
+        cursor30[:, j] = cur
+        M_mom[has_bar, j] = mom[cur[has_bar]]
+        M_brk[has_bar, j] = brk[cur[has_bar]]
+        M_atr[has_bar, j] = atr[cur[has_bar]]
+
+    # Last 5m close per [tick, symbol] (0.0 before a symbol's first bar), plus the 5m bar cursor
+    # so exit checks can slice held symbols' history without a boolean mask over the frame.
+    M_px = np.zeros((n_ticks, n_sym), dtype=np.float64)
+    cursor5 = np.full((n_ticks, n_sym), -1, dtype=np.int64)
+    for j, sym in enumerate(symbols):
+        df5 = data_5m.get(sym)
+        if df5 is None or df5.empty:
+            continue
+        cur = _bar_cursor(df5.index, all_ticks)
+        has_bar = cur >= 0
+        cursor5[:, j] = cur
+        M_px[has_bar, j] = df5["close"].to_numpy(dtype=np.float64)[cur[has_bar]]
 
     # Tracking
     trades = []
     equity_curve = []
     daily_pnl = {}
     blocked_by_persistence = 0
-    consecutive_signal = {sym: {"dir": 0, "count": 0} for sym in data_30m.keys()}
+    consecutive_signal = {sym: {"dir": 0, "count": 0} for sym in symbols}
     open_trade_meta = {}  # sym -> (entry_time, entry_price, side)
-    consecutive_losses = {sym: 0 for sym in data_30m.keys()}
+    consecutive_losses = np.zeros(n_sym, dtype=np.int64)
 
-    for day in trade_dates:
+    k = -1
+    for day, time_index in zip(trade_dates, day_indexes):
         day_date = day.date()
-        start_dt = datetime.combine(day_date, time(9, 30), tzinfo=day.tzinfo)
-        end_dt = datetime.combine(day_date, time(15, 55), tzinfo=day.tzinfo)
-        time_index = pd.date_range(start_dt, end_dt, freq="5min", tz="America/New_York")
 
         for ts in time_index:
-            # Update prices for mark-to-market using 5m data
-            current_prices = {}
+            k += 1
+            # Flat and outside the entry window: nothing to mark, exit or enter.
+            # With no positions equity is just cash, so record it and move on.
+            if not portfolio.state.positions and not is_entry_ts[k]:
+                portfolio.state.equity = portfolio.state.cash
+                equity_curve.append((ts, portfolio.state.equity))
+                continue
+
+            # Mark-to-market using 5m data; ATR history is only needed for held symbols
+            current_prices_arr = M_px[k]
             price_data_for_atr = {}
-            for sym, df5 in data_5m.items():
-                if df5.empty:
-                    continue
-                df5_cut = df5[df5.index <= ts]
-                if df5_cut.empty:
-                    continue
-                last_row = df5_cut.iloc[-1]
-                price = float(last_row["close"])
-                current_prices[sym] = price
-                price_data_for_atr[sym] = df5_cut
+            for sym in portfolio.state.positions:
+                j = sym_idx.get(sym)
+                if j is not None and cursor5[k, j] >= 0:
+                    price_data_for_atr[sym] = data_5m[sym].iloc[:cursor5[k, j] + 1]
 
-            portfolio.mark_to_market(current_prices)
+            portfolio.mark_to_market(current_prices_arr, sym_idx)
             equity_curve.append((ts, portfolio.state.equity))
 
             # Exit checks
@@ -352,7 +452,7 @@ def simulate_system(
             for sym, side in exit_signals.items():
                 if sym not in portfolio.state.positions:
                     continue
-                price = current_prices.get(sym)
+                price = float(current_prices_arr[sym_idx[sym]])
                 if not price:
                     continue
                 pos = portfolio.state.positions[sym]
@@ -387,71 +487,52 @@ def simulate_system(
 
                 # Track consecutive losses per symbol
                 if pnl < 0:
-                    consecutive_losses[sym] += 1
+                    consecutive_losses[sym_idx[sym]] += 1
                 else:
-                    consecutive_losses[sym] = 0
+                    consecutive_losses[sym_idx[sym]] = 0
 
                 if sym in open_trade_meta:
                     del open_trade_meta[sym]
 
             # Entry checks only in 9:30-11:30 every 15 min
-            if not (time(9, 30) <= ts.time() <= time(11, 30)):
-                continue
-            if ts.minute % 15 != 0:
+            if not is_entry_ts[k]:
                 continue
 
             entry_plans = []
             signal_details = {}
 
-            for sym, df30 in data_30m.items():
-                if df30.empty:
-                    continue
-                df30_cut = df30[df30.index <= ts]
-                if df30_cut.empty:
-                    continue
+            mom_row = M_mom[k]
+            brk_row = M_brk[k]
+            atr_row = M_atr[k]
+            price_row = current_prices_arr
 
-                price = current_prices.get(sym)
-                if not price or math.isnan(price):
-                    continue
+            # News not available in backtest
+            news_row = np.zeros(n_sym, dtype=np.float32)
 
-                # Volatility filter (ATR)
-                atr_pct = _calc_atr_pct(df30_cut, atr_period, price)
-                if atr_pct is None or atr_pct < min_atr or atr_pct > max_atr:
-                    continue
+            # Weighted score
+            score_row = (0.90 * mom_row) + (0.10 * brk_row)
 
-                # Signals
-                if breakout_smooth:
-                    breakout_score = brk_agent.score(df30_cut)
-                else:
-                    breakout_score = _binary_breakout_score(df30_cut, cfg_local.get("signals", {}).get("breakout_lookback", 10))
-                momentum_score = mom_agent.score(df30_cut)
+            # Signal disagreement check (challenge subset): block if spread >= 1.8 similar to challenger
+            spread_row = np.maximum.reduce([mom_row, brk_row, news_row]) - np.minimum.reduce([mom_row, brk_row, news_row])
 
-                # News not available in backtest
-                news_score = 0.0
+            with np.errstate(divide="ignore", invalid="ignore"):
+                atr_pct_row = atr_row / price_row
+            mask = (cursor30[k] >= 0) & (price_row > 0)
+            # Volatility filter (ATR)
+            mask &= (atr_row > 0) & (atr_pct_row >= min_atr) & (atr_pct_row <= max_atr)
+            mask &= np.abs(score_row) >= trade_threshold
+            mask &= ~((spread_row >= disagreement_threshold) & (spread_row >= 1.8))
+            # Consecutive losses check
+            mask &= consecutive_losses < max_consecutive_losses
 
-                # Weighted score
-                if system_name == "new":
-                    score = (0.90 * momentum_score) + (0.10 * breakout_score)
-                else:
-                    score = (0.90 * momentum_score) + (0.10 * breakout_score)
-
-                if abs(score) < trade_threshold:
-                    continue
+            for j in np.nonzero(mask)[0]:
+                sym = symbols[j]
+                score = float(score_row[j])
+                price = float(price_row[j])
 
                 # Direction
                 side = "BUY" if score > 0 else "SELL"
-
-                # Signal disagreement check (challenge subset)
-                components = {"momentum": momentum_score, "breakout": breakout_score, "news": news_score}
-                spread = max(components.values()) - min(components.values())
-                if spread >= cfg.get("challenges", {}).get("disagreement_threshold", 1.5):
-                    # block if spread >= 1.8 similar to challenger
-                    if spread >= 1.8:
-                        continue
-
-                # Consecutive losses check
-                if consecutive_losses.get(sym, 0) >= cfg.get("challenges", {}).get("max_consecutive_losses", 3):
-                    continue
+                components = {"momentum": float(mom_row[j]), "breakout": float(brk_row[j]), "news": float(news_row[j])}
 
                 # Persistence filter
                 if use_persistence:
@@ -466,12 +547,11 @@ def simulate_system(
                     eligible_without_persistence = prev["count"] >= 1
                     if eligible_without_persistence and prev["count"] < 2:
                         # Check if old system would have entered here
-                        if old_system_checker is not None and old_system_checker(sym, df30_cut, price):
-                            blocked_by_persistence += 1
+                        if old_system_checker is not None:
+                            df30_cut = data_30m[sym].iloc[:cursor30[k, j] + 1]
+                            if old_system_checker(sym, df30_cut, price):
+                                blocked_by_persistence += 1
                         continue
-                else:
-                    # reset counts to avoid stale state
-                    pass
 
                 # Skip if already in position
                 if sym in portfolio.state.positions:
@@ -519,12 +599,12 @@ def simulate_system(
 
     # Max drawdown
     max_dd = 0.0
-    peak = -float("inf")
-    for _, eq in equity_curve:
-        peak = max(peak, eq)
-        if peak > 0:
-            dd = (peak - eq) / peak
-            max_dd = max(max_dd, dd)
+    if equity_curve:
+        equity_val = np.fromiter((eq for _, eq in equity_curve), dtype=np.float64, count=len(equity_curve))
+        peak = np.maximum.accumulate(equity_val)
+        dd = np.zeros_like(equity_val)
+        np.divide(peak - equity_val, peak, out=dd, where=peak > 0)
+        max_dd = max(0.0, float(dd.max()))
 
     # Best / worst trades
     best_trade = max(trades, key=lambda t: t["pnl"], default=None)
@@ -551,9 +631,7 @@ def simulate_system(
 
 
 def main():
-    cfg_path = "configs/workflow.yaml"
-    with open(cfg_path, "r", encoding="utf-8") as f:
-        cfg = yaml.safe_load(f)
+    cfg = load_config()
 
     universe = cfg.get("universe", [])
     if not universe:
@@ -602,20 +680,20 @@ def main():
 
     trade_dates = sorted(ref_df.index.normalize().unique())[-10:]
 
-    # Old system checker for persistence blocking (5-bar momentum, binary breakout, no persistence)
+    # Old system checker for persistence blocking (5-bar momentum, binary breakout, no persistence).
+    # Built once here; the checker runs inside the entry loop on every persistence block.
+    cfg_old = {**cfg, "signals": {**cfg.get("signals", {}), "momentum_short": 5}}
+    mom_old = MomentumSignalAgent(cfg_old, DummyTracer())
+    old_threshold = cfg.get("signals", {}).get("trade_threshold", 0.15)
+    old_brk_lookback = cfg_old["signals"].get("breakout_lookback", 10)
+
     def old_system_checker(sym: str, df30: pd.DataFrame, price: float) -> bool:
         if df30.empty:
             return False
-        # Old momentum (5-bar)
-        cfg_old = dict(cfg)
-        cfg_old.setdefault("signals", {})
-        cfg_old["signals"] = dict(cfg_old.get("signals", {}))
-        cfg_old["signals"]["momentum_short"] = 5
-        mom_old = MomentumSignalAgent(cfg_old, DummyTracer())
         mom_score = mom_old.score(df30)
-        brk_score = _binary_breakout_score(df30, cfg_old.get("signals", {}).get("breakout_lookback", 10))
+        brk_score = _binary_breakout_score(df30, old_brk_lookback)
         score = (0.90 * mom_score) + (0.10 * brk_score)
-        return abs(score) >= cfg.get("signals", {}).get("trade_threshold", 0.15)
+        return abs(score) >= old_threshold
 
     # Run simulations
     print("Running NEW system backtest...")
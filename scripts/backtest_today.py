@@ -1,12 +1,14 @@
 """Backtest: run the full workflow against today's data, bypassing time gate."""
 import sys, os
+from concurrent.futures import ThreadPoolExecutor
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-import yaml
 import numpy as np
-from trading_floor.data import YahooDataProvider, filter_trading_window, latest_timestamp
+from trading_floor.config import load as load_config
+from trading_floor.data import PriceCache, filter_trading_window, latest_timestamp
 from trading_floor.portfolio import Portfolio
 from trading_floor.agents.scout import ScoutAgent
+from trading_floor.agents.features import tail_panel, compute_panel
 from trading_floor.agents.signal_momentum import MomentumSignalAgent
 from trading_floor.agents.signal_meanreversion import MeanReversionSignalAgent
 from trading_floor.agents.signal_breakout import BreakoutSignalAgent
@@ -18,24 +20,22 @@ from trading_floor.signal_normalizer import SignalNormalizer
 from trading_floor.shadow import ShadowRunner
 from trading_floor.lightning import LightningTracer
 
-cfg_path = os.path.join(os.path.dirname(__file__), '..', 'configs', 'workflow.yaml')
-cfg = yaml.safe_load(open(cfg_path))
+cfg = load_config()
 tracer = LightningTracer(cfg)
 
 print("=" * 60)
 print("TRADING FLOOR — BACKTEST vs TODAY's DATA")
 print("=" * 60)
 
-data = YahooDataProvider(interval='5m', lookback='5d')
 fetch_list = list(set(cfg['universe'] + ['SPY', '^VIX']))
-md = data.fetch(fetch_list)
+md = PriceCache().get(fetch_list, interval='5m', lookback='5d')
 
 # Market regime
 market_regime = {'is_downtrend': False, 'is_fear': False}
 if 'SPY' in md and not md['SPY'].df.empty:
     spy_series = md['SPY'].df['close']
     if len(spy_series) >= 20:
-        ma20 = float(spy_series.rolling(20).mean().iloc[-1])
+        ma20 = float(spy_series.to_numpy()[-20:].mean())  # only the latest MA is needed
         spy_now = float(spy_series.iloc[-1])
         market_regime['is_downtrend'] = spy_now < ma20
         print(f"SPY: ${spy_now:.2f} vs MA20: ${ma20:.2f} -> downtrend={market_regime['is_downtrend']}")
@@ -58,13 +58,23 @@ for sym, m in md.items():
         m.df, tz=cfg['hours']['tz'],
         start=cfg['hours']['start'], end=cfg['hours']['end']
     )
+    # Scout/signal math is well within fp32 tolerance; halve the bytes the scan walks
+    price_cols = [c for c in ('open', 'high', 'low', 'close') if c in windowed[sym].columns]
+    windowed[sym] = windowed[sym].astype({c: np.float32 for c in price_cols})
     if not m.df.empty:
         current_prices[sym] = float(m.df['close'].iloc[-1])
         price_series[sym] = m.df['close']
 
 # Scout
+# One (T, N) close panel for the whole scan; Scout and the signal features both read it.
+# float64 like ScoutAgent.rank, so near-tie rankings match the live run
+scan_syms = [sym for sym, df in windowed.items() if len(df) >= 2]
+close_panel, bar_counts = tail_panel([windowed[sym] for sym in scan_syms], dtype=np.float64)
+avg_volume = np.array([
+    windowed[sym]['volume'].mean() if 'volume' in windowed[sym].columns else np.nan for sym in scan_syms
+])
 scout = ScoutAgent(cfg, tracer)
-ranked = scout.rank(windowed)
+ranked = scout.rank_panel(scan_syms, close_panel, bar_counts, avg_volume)
 print(f"\n--- Scout Top 10 ---")
 for r in ranked[:10]:
     sym = r['symbol']
@@ -86,30 +96,36 @@ normalizer = SignalNormalizer(lookback=cfg.get('signals', {}).get('norm_lookback
 
 signals = {}
 signal_details = {}
-for sym, df in windowed.items():
-    if df.empty or sym not in top_symbols:
-        continue
-    mom_raw = signal_mom.score(df)
-    mean_raw = signal_mean.score(df)
-    brk_raw = signal_break.score(df)
-    news_raw = signal_news.get_sentiment(sym)
-
-    mom = normalizer.normalize(sym, 'momentum', mom_raw)
-    mean = normalizer.normalize(sym, 'meanrev', mean_raw)
-    brk = normalizer.normalize(sym, 'breakout', brk_raw)
-
-    score = (
-        mom * weights.get('momentum', 0.25) +
-        mean * weights.get('meanrev', 0.25) +
-        brk * weights.get('breakout', 0.25) +
-        news_raw * weights.get('news', 0.25)
-    )
-    signals[sym] = score
-    signal_details[sym] = {
-        'momentum': mom, 'meanrev': mean, 'breakout': brk, 'news': news_raw,
-        'raw_mom': mom_raw, 'raw_mean': mean_raw, 'raw_brk': brk_raw,
-        'final': score
-    }
+to_score = [sym for sym in scan_syms if sym in top_symbols]
+# SMAs and breakout ranges for every scored symbol come out of one vectorized pass
+col_of = {sym: i for i, sym in enumerate(scan_syms)}
+score_cols = [col_of[sym] for sym in to_score]
+panel_feats = compute_panel(close_panel[:, score_cols], bar_counts[score_cols], cfg)
+# News is HTTP-bound: start every lookup up front so it overlaps the technical scoring below
+with ThreadPoolExecutor(max_workers=max(1, min(16, len(to_score)))) as news_pool:
+    news_futs = {sym: news_pool.submit(signal_news.get_sentiment, sym) for sym in to_score}
+    for sym, feats in zip(to_score, panel_feats):
+        mom_raw = signal_mom.score_from_features(feats)
+        mean_raw = signal_mean.score_from_features(feats)
+        brk_raw = signal_break.score_from_features(feats)
+        news_raw = news_futs[sym].result()
+
+        mom = normalizer.normalize(sym, 'momentum', mom_raw)
+        mean = normalizer.normalize(sym, 'meanrev', mean_raw)
+        brk = normalizer.normalize(sym, 'breakout', brk_raw)
+
+        score = (
+            mom * weights.get('momentum', 0.25) +
+            mean * weights.get('meanrev', 0.25) +
+            brk * weights.get('breakout', 0.25) +
+            news_raw * weights.get('news', 0.25)
+        )
+        signals[sym] = score
+        signal_details[sym] = {
+            'momentum': mom, 'meanrev': mean, 'breakout': brk, 'news': news_raw,
+            'raw_mom': mom_raw, 'raw_mean': mean_raw, 'raw_brk': brk_raw,
+            'final': score
+        }
 
 print(f"\n--- Signals (Scout Top {scout_top_n}) ---")
 for sym, det in sorted(signal_details.items(), key=lambda x: abs(x[1]['final']), reverse=True):
@@ -1,19 +1,23 @@
-import yfinance as yf
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 import pandas as pd
+from trading_floor.data import PriceCache
 
-for sym in ['NFLX', 'XYZ', 'MARA', 'IONQ', 'RDW', 'CRML', 'TMQ', 'BITF', 'ONDS', 'RGTI']:
+syms = ['NFLX', 'XYZ', 'MARA', 'IONQ', 'RDW', 'CRML', 'TMQ', 'BITF', 'ONDS', 'RGTI']
+
+# Completed days come from the on-disk cache; only missing days are downloaded, in one batch
+md = PriceCache().get(syms, interval='5m', lookback='5d')
+
+for sym in syms:
     try:
-        data = yf.download(sym, period='5d', interval='5m', progress=False)
-        if len(data) > 20:
-            atr_pct = ((data['High'] - data['Low']) / data['Close']).rolling(20).mean().iloc[-1]
-            price = data['Close'].iloc[-1]
-            if hasattr(price, 'item'):
-                price = price.item()
-            if hasattr(atr_pct, 'item'):
-                atr_pct = atr_pct.item()
+        d = md[sym].df.dropna(subset=['high', 'low', 'close'], how='all') if sym in md else pd.DataFrame()
+        if len(d) > 20:
+            # Only the latest 20-bar mean is needed, so reduce the tail instead of rolling the whole series
+            atr_pct = float(((d['high'] - d['low']) / d['close']).to_numpy()[-20:].mean())
+            price = float(d['close'].iloc[-1])
             status = 'PASS' if atr_pct >= 0.005 else 'FAIL'
             print(f'{sym:6s} price=${price:.2f} ATR%={atr_pct:.4f} ({atr_pct*100:.2f}%) {status} @ 0.50%')
         else:
-            print(f'{sym:6s} insufficient data ({len(data)} bars)')
+            print(f'{sym:6s} insufficient data ({len(d)} bars)')
     except Exception as e:
         print(f'{sym:6s} ERROR: {e}')
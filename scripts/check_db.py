@@ -1,6 +1,7 @@
-import sys, sqlite3
+import sys
 sys.path.insert(0, 'src')
-conn = sqlite3.connect('trading.db')
+from _db import open_db, day_bounds
+conn = open_db('trading.db')
 tables = [t[0] for t in conn.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()]
 print('Tables:', tables)
 for t in tables:
@@ -16,7 +17,7 @@ for t in tables:
 # Today's signals
 print("\n--- Signals today ---")
 try:
-    rows = conn.execute("SELECT * FROM signals WHERE timestamp LIKE '2026-02-19%'").fetchall()
+    rows = conn.execute("SELECT * FROM signals WHERE timestamp >= ? AND timestamp < ?", day_bounds('2026-02-19')).fetchall()
     print(f"Count: {len(rows)}")
     for r in rows[:5]: print(f"  {r}")
 except Exception as e:
@@ -1,5 +1,6 @@
 import sqlite3, json
-conn = sqlite3.connect('trading.db')
+from _db import open_db
+conn = open_db('trading.db')
 conn.row_factory = sqlite3.Row
 c = conn.cursor()
 
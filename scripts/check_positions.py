@@ -1,26 +1,31 @@
 import sys, os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-import yaml
-from trading_floor.data import YahooDataProvider
+import numpy as np
+import pandas as pd
+import yfinance as yf
+from trading_floor.config import load as load_config
 from trading_floor.portfolio import Portfolio
 
-cfg = yaml.safe_load(open(os.path.join(os.path.dirname(__file__), '..', 'configs', 'workflow.yaml')))
+cfg = load_config()
 portfolio = Portfolio(cfg)
 
-data = YahooDataProvider(interval='5m', lookback='1d')
 syms = list(portfolio.state.positions.keys())
 if not syms:
     print('No positions')
     exit()
 
-md = data.fetch(syms)
+# Only the last close per symbol is needed: one threaded download, then slice the Close tails
+raw = yf.download(syms, period='1d', interval='5m', group_by='ticker', threads=True, progress=False)
 current = {}
-for sym, m in md.items():
-    if not m.df.empty:
-        # Handle both 'close' and '{symbol}_close' column naming
-        close_col = next((c for c in m.df.columns if c.lower().endswith('close')), None)
-        if close_col:
-            current[sym] = float(m.df[close_col].iloc[-1])
+for sym in syms:
+    if isinstance(raw.columns, pd.MultiIndex):
+        if sym not in raw.columns.get_level_values(0):
+            continue
+        closes = raw[sym]['Close'].dropna()
+    else:
+        closes = raw['Close'].dropna()
+    if not closes.empty:
+        current[sym] = float(closes.iloc[-1])
 
 stop_loss = cfg.get('risk', {}).get('stop_loss', 0.02)
 take_profit = cfg.get('risk', {}).get('take_profit', 0.05)
@@ -29,25 +34,22 @@ print(f"Stop Loss: {stop_loss*100:.0f}% | Take Profit: {take_profit*100:.0f}%")
 print(f"{'Symbol':6s} {'Qty':>6s} {'Avg Entry':>10s} {'Current':>10s} {'SL Price':>10s} {'TP Price':>10s} {'Unreal PnL':>12s} {'PnL%':>8s}")
 print('-' * 75)
 
-total_pnl = 0
-for sym, pos in portfolio.state.positions.items():
-    qty = pos.quantity
-    avg = pos.avg_price
-    cur = current.get(sym, 0)
-    
-    if qty < 0:  # short
-        sl_price = avg * (1 + stop_loss)
-        tp_price = avg * (1 - take_profit)
-        pnl = (avg - cur) * abs(qty)
-        pnl_pct = (avg - cur) / avg * 100 if avg > 0 else 0
-    else:  # long
-        sl_price = avg * (1 - stop_loss)
-        tp_price = avg * (1 + take_profit)
-        pnl = (cur - avg) * qty
-        pnl_pct = (cur - avg) / avg * 100 if avg > 0 else 0
-    
-    total_pnl += pnl
-    print(f"{sym:6s} {qty:>6d} ${avg:>9.2f} ${cur:>9.2f} ${sl_price:>9.2f} ${tp_price:>9.2f} ${pnl:>+11.2f} {pnl_pct:>+7.2f}%")
+# One column per field; direction is +1 for longs, -1 for shorts
+positions = list(portfolio.state.positions.values())
+qty = np.array([p.quantity for p in positions], dtype=np.int64)
+avg = np.array([p.avg_price for p in positions], dtype=np.float64)
+cur = np.array([current.get(sym, 0) for sym in syms], dtype=np.float64)
+direction = np.where(qty < 0, -1.0, 1.0)
+
+sl_price = avg * (1 - direction * stop_loss)
+tp_price = avg * (1 + direction * take_profit)
+pnl = direction * (cur - avg) * np.abs(qty)
+pnl_pct = np.zeros_like(avg)
+np.divide(direction * (cur - avg) * 100, avg, out=pnl_pct, where=avg > 0)
+total_pnl = float(pnl.sum())
+
+for i, sym in enumerate(syms):
+    print(f"{sym:6s} {qty[i]:>6d} ${avg[i]:>9.2f} ${cur[i]:>9.2f} ${sl_price[i]:>9.2f} ${tp_price[i]:>9.2f} ${pnl[i]:>+11.2f} {pnl_pct[i]:>+7.2f}%")
 
 print('-' * 75)
 print(f"{'TOTAL':6s} {'':>6s} {'':>10s} {'':>10s} {'':>10s} {'':>10s} ${total_pnl:>+11.2f}")
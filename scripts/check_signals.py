@@ -1,26 +1,27 @@
-import sqlite3
-conn = sqlite3.connect('trading.db')
+from _db import open_db, day_bounds
+conn = open_db('trading.db')
 c = conn.cursor()
+today = day_bounds('2026-02-23')
 
-c.execute("SELECT symbol, score_mom, score_mean, score_break, score_news, final_score FROM signals WHERE timestamp LIKE '2026-02-23%' ORDER BY final_score DESC LIMIT 10")
+c.execute("SELECT symbol, score_mom, score_mean, score_break, score_news, final_score FROM signals WHERE timestamp >= ? AND timestamp < ? ORDER BY final_score DESC LIMIT 10", today)
 rows = c.fetchall()
 print("Today's signals (top 10 by score):")
 for r in rows:
     print(f"  {r[0]:6s} mom={r[1]:+.3f} mean={r[2]:+.3f} break={r[3]:+.3f} news={r[4]:+.3f} => final={r[5]:+.4f}")
 
-c.execute("SELECT COUNT(*) FROM signals WHERE timestamp LIKE '2026-02-23%' AND score_news != 0")
+c.execute("SELECT COUNT(*) FROM signals WHERE timestamp >= ? AND timestamp < ? AND score_news != 0", today)
 nz = c.fetchone()[0]
-c.execute("SELECT COUNT(*) FROM signals WHERE timestamp LIKE '2026-02-23%'")
+c.execute("SELECT COUNT(*) FROM signals WHERE timestamp >= ? AND timestamp < ?", today)
 tot = c.fetchone()[0]
 print(f"\nNews non-zero: {nz}/{tot}")
 
 # Check Feb 19 - the date reported as 0 rows
-c.execute("SELECT COUNT(*) FROM signals WHERE timestamp LIKE '2026-02-19%'")
+c.execute("SELECT COUNT(*) FROM signals WHERE timestamp >= ? AND timestamp < ?", day_bounds('2026-02-19'))
 feb19 = c.fetchone()[0]
 print(f"Feb 19 signals: {feb19}")
 
 # Check if signals are per-run or cumulative
-c.execute("SELECT DISTINCT timestamp FROM signals WHERE timestamp LIKE '2026-02-23%'")
+c.execute("SELECT DISTINCT timestamp FROM signals WHERE timestamp >= ? AND timestamp < ?", today)
 ts = c.fetchall()
 print(f"\nDistinct timestamps today: {len(ts)}")
 for t in ts:
@@ -1,39 +1,53 @@
-import sqlite3, os
-db = os.path.join(os.path.dirname(__file__), '..', 'data', 'trading.db')
-conn = sqlite3.connect(db)
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from _db import open_db
+from trading_floor.config import load as load_config
+from trading_floor.portfolio import Portfolio
+
+cfg = load_config()
+db = os.path.join(os.path.dirname(__file__), '..', cfg.get('logging', {}).get('db_path', 'trading.db'))
+conn = open_db(db)
 c = conn.cursor()
 
-print("=== RECENT TRADES (last 5) ===")
+# Trades and signals come back in one round-trip, tagged by kind
+recent = {'trade': [], 'signal': []}
 try:
-    c.execute("SELECT timestamp,action,symbol,quantity,price FROM trades ORDER BY timestamp DESC LIMIT 5")
+    c.execute("""
+        SELECT * FROM (SELECT 'trade' AS kind, timestamp, side, symbol, quantity, price
+                       FROM trades ORDER BY timestamp DESC LIMIT 5)
+        UNION ALL
+        SELECT * FROM (SELECT 'signal', timestamp, NULL, symbol, NULL, final_score
+                       FROM signals ORDER BY timestamp DESC LIMIT 5)
+    """)
     for r in c.fetchall():
-        print(f"  {r[0]} | {r[1]} | {r[2]} | qty={r[3]} | ${r[4]}")
+        recent[r[0]].append(r[1:])
+    db_error = None
 except Exception as e:
-    print(f"  Error: {e}")
+    db_error = e
+
+print("=== RECENT TRADES (last 5) ===")
+if db_error:
+    print(f"  Error: {db_error}")
+for ts, side, sym, qty, price in recent['trade']:
+    print(f"  {ts} | {side} | {sym} | qty={qty} | ${price}")
+
+# Positions and cash are already held by the portfolio state; no table to query
+portfolio = Portfolio(cfg)
+positions = portfolio.state.positions
 
 print("\n=== ACTIVE POSITIONS ===")
-try:
-    c.execute("SELECT symbol,quantity,avg_price FROM positions WHERE quantity != 0")
-    for r in c.fetchall():
-        print(f"  {r[0]}: qty={r[1]} @ ${r[2]:.2f}")
-except Exception as e:
-    print(f"  Error: {e}")
+for sym, pos in positions.items():
+    if pos.quantity != 0:
+        print(f"  {sym}: qty={pos.quantity} @ ${pos.avg_price:.2f}")
 
 print("\n=== RECENT SIGNALS (last 5) ===")
-try:
-    c.execute("SELECT timestamp,symbol,signal,score FROM signals ORDER BY timestamp DESC LIMIT 5")
-    for r in c.fetchall():
-        print(f"  {r[0]} | {r[1]} | {r[2]} | score={r[3]}")
-except Exception as e:
-    print(f"  Error: {e}")
+if db_error:
+    print(f"  Error: {db_error}")
+for ts, _, sym, _, score in recent['signal']:
+    print(f"  {ts} | {sym} | {'BUY' if (score or 0) > 0 else 'SELL'} | score={score}")
 
 print("\n=== PORTFOLIO ===")
-try:
-    c.execute("SELECT cash,equity,timestamp FROM portfolio ORDER BY timestamp DESC LIMIT 1")
-    r = c.fetchone()
-    if r:
-        print(f"  Cash: ${r[0]:,.2f} | Equity: ${r[1]:,.2f} | As of: {r[2]}")
-except Exception as e:
-    print(f"  Error: {e}")
+cost_basis = sum(pos.quantity * pos.avg_price for pos in positions.values())
+print(f"  Cash: ${portfolio.state.cash:,.2f} | Equity (at cost): ${portfolio.state.cash + cost_basis:,.2f}")
 
 conn.close()
@@ -1,9 +1,10 @@
-import yaml
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 from datetime import datetime
-from zoneinfo import ZoneInfo
+from trading_floor import config
 
-cfg = yaml.safe_load(open("configs/workflow.yaml"))
-now = datetime.now(ZoneInfo("America/New_York"))
+cfg = config.load()
+now = datetime.now(config.tz())
 end_h, end_m = cfg["hours"]["end"].split(":")
 end_time = now.replace(hour=int(end_h), minute=int(end_m), second=0)
 start_h, start_m = cfg["hours"]["start"].split(":")
@@ -1,4 +1,5 @@
 import json, sqlite3
+from _db import open_db, day_bounds
 
 p = json.load(open("portfolio.json"))
 print(f"Equity: ${p['equity']:.2f}")
@@ -7,10 +8,11 @@ print(f"Positions: {len(p['positions'])}")
 print(f"From $5000 start: ${p['equity']-5000:.2f} ({(p['equity']-5000)/5000*100:.1f}%)")
 print()
 
-conn = sqlite3.connect("trading.db")
+conn = open_db("trading.db")
 conn.row_factory = sqlite3.Row
+today = day_bounds("2026-02-23")
 
-rows = conn.execute("SELECT * FROM trades WHERE timestamp LIKE '2026-02-23%' ORDER BY timestamp").fetchall()
+rows = conn.execute("SELECT * FROM trades WHERE timestamp >= ? AND timestamp < ? ORDER BY timestamp", today).fetchall()
 print("=== Today's Trades ===")
 total_pnl = 0
 for r in rows:
@@ -18,18 +20,24 @@ for r in rows:
     total_pnl += r['pnl']
 print(f"  Net: ${total_pnl:.2f}")
 
-sigs = conn.execute("SELECT * FROM signals WHERE timestamp LIKE '2026-02-23%' ORDER BY final_score DESC LIMIT 8").fetchall()
+sigs = conn.execute("SELECT * FROM signals WHERE timestamp >= ? AND timestamp < ? ORDER BY final_score DESC LIMIT 8", today).fetchall()
 print(f"\n=== Top Signals (of {len(sigs)}) ===")
 for s in sigs:
     print(f"  {s['symbol']:6s} score={s['final_score']:.3f}")
 
-all_t = conn.execute("SELECT pnl FROM trades WHERE pnl IS NOT NULL AND pnl != 0").fetchall()
-wins = [t['pnl'] for t in all_t if t['pnl'] > 0]
-losses = [t['pnl'] for t in all_t if t['pnl'] < 0]
+# Aggregate in SQLite instead of pulling every trade row into Python
+agg = conn.execute("""
+    SELECT COUNT(CASE WHEN pnl > 0 THEN 1 END) AS n_wins,
+           TOTAL(CASE WHEN pnl > 0 THEN pnl END) AS win_sum,
+           COUNT(CASE WHEN pnl < 0 THEN 1 END) AS n_losses,
+           TOTAL(CASE WHEN pnl < 0 THEN pnl END) AS loss_sum
+    FROM trades WHERE pnl IS NOT NULL AND pnl != 0
+""").fetchone()
+n_wins, win_sum, n_losses, loss_sum = agg['n_wins'], agg['win_sum'], agg['n_losses'], agg['loss_sum']
 print(f"\n=== All-Time ===")
-print(f"Wins: {len(wins)} (${sum(wins):.2f})" if wins else "Wins: 0")
-print(f"Losses: {len(losses)} (${sum(losses):.2f})" if losses else "Losses: 0")
-if wins or losses:
-    print(f"Win rate: {len(wins)/(len(wins)+len(losses))*100:.0f}%")
-    print(f"Profit factor: {abs(sum(wins))/abs(sum(losses)):.2f}" if losses else "Inf")
+print(f"Wins: {n_wins} (${win_sum:.2f})" if n_wins else "Wins: 0")
+print(f"Losses: {n_losses} (${loss_sum:.2f})" if n_losses else "Losses: 0")
+if n_wins or n_losses:
+    print(f"Win rate: {n_wins/(n_wins+n_losses)*100:.0f}%")
+    print(f"Profit factor: {abs(win_sum)/abs(loss_sum):.2f}" if n_losses else "Inf")
 conn.close()
@@ -3,16 +3,15 @@ import sys, math
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
 
-import yaml
-import yfinance as yf
-import pandas as pd
+from trading_floor.config import load as load_config
+from trading_floor.data import PriceCache
 from trading_floor.agents.signal_momentum import MomentumSignalAgent
 from trading_floor.agents.signal_meanreversion import MeanReversionSignalAgent
 from trading_floor.agents.signal_breakout import BreakoutSignalAgent
 from trading_floor.agents.news import NewsSentimentAgent
 from trading_floor.signal_normalizer import SignalNormalizer
 
-cfg = yaml.safe_load(open(Path(__file__).resolve().parent.parent / "configs" / "workflow.yaml"))
+cfg = load_config()
 
 class FakeTracer:
     def emit_span(self, *a, **kw): pass
@@ -32,17 +31,14 @@ threshold = cfg.get("signals", {}).get("trade_threshold", 0.05)
 test_syms = ["NVDA", "TSLA", "META", "SPY", "IONQ", "VRT", "ONDS", "RKLB", "CRWD", "AMD"]
 print(f"Threshold: {threshold} | Weights: {weights}\n")
 
+# One batched (and disk-cached) fetch instead of a download per symbol
+md = PriceCache().get(test_syms, interval="5m", lookback="5d")
+
 for sym in test_syms:
     try:
-        raw = yf.download(sym, period="5d", interval="5m", progress=False)
-        if raw.empty:
+        if sym not in md:
             print(f"{sym}: NO DATA"); continue
-        
-        # Flatten multi-level columns
-        if isinstance(raw.columns, pd.MultiIndex):
-            raw.columns = [c[0].lower() if isinstance(c, tuple) else c.lower() for c in raw.columns]
-        else:
-            raw.columns = [c.lower() for c in raw.columns]
+        raw = md[sym].df
         
         mom_raw = mom_agent.score(raw)
         mean_raw = mean_agent.score(raw)
@@ -1,45 +1,41 @@
 """Exit-only monitor: checks stops/TP/kill switch without running signals or entering new trades."""
-import sys, csv, sqlite3
-import yaml
+import sys
+from concurrent.futures import ThreadPoolExecutor
 import yfinance as yf
 from pathlib import Path
+from _db import TradeLog
+from trading_floor import config
+from trading_floor.data import PriceCache
 from trading_floor.portfolio import Portfolio
 from trading_floor.agents.exits import ExitManager
 from trading_floor.lightning import LightningTracer
-from datetime import datetime
-from zoneinfo import ZoneInfo
+from datetime import datetime, time
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 DB_PATH = PROJECT_ROOT / "trading.db"
 CSV_PATH = PROJECT_ROOT / "trading_logs" / "trades.csv"
+# Regular session (market tz); outside it quotes are stale and nothing can fill
+SESSION_OPEN = time(9, 30)
+SESSION_CLOSE = time(16, 0)
 
-def log_trade(symbol, side, quantity, price, pnl):
-    """Log exit trade to both CSV and DB."""
-    ts = datetime.utcnow().isoformat()
-    # CSV
-    with open(CSV_PATH, "a", newline="") as f:
-        csv.writer(f).writerow([ts, symbol, side, quantity, price, "", pnl])
-    # DB
+
+def _last_price(sym):
+    """Last trade from the quote snapshot (a few KB) instead of a bar download."""
     try:
-        conn = sqlite3.connect(str(DB_PATH))
-        conn.execute(
-            "INSERT INTO trades (timestamp, symbol, side, quantity, price, score, pnl, strategy_data) VALUES (?,?,?,?,?,?,?,?)",
-            (ts, symbol, side, quantity, price, 0.0, pnl, '{"source":"exit_monitor"}')
-        )
-        conn.commit()
-        conn.close()
-    except Exception as e:
-        print(f"[ExitMonitor] DB log error: {e}")
+        price = float(yf.Ticker(sym).fast_info["last_price"])
+        return price if price > 0 else None
+    except Exception:
+        return None
 
 
 def main():
-    cfg = yaml.safe_load(open("configs/workflow.yaml"))
+    cfg = config.load()
     portfolio = Portfolio(cfg)
     tracer = LightningTracer(cfg)
     exit_mgr = ExitManager(cfg, tracer)
 
     # Check if market is open (weekday, not holiday)
-    tz = ZoneInfo(cfg["hours"]["tz"])
+    tz = config.tz()
     now = datetime.now(tz)
     if now.weekday() >= 5:
         print("[ExitMonitor] Weekend. Skipping.")
@@ -48,6 +44,9 @@ def main():
     if now.strftime("%Y-%m-%d") in holidays:
         print("[ExitMonitor] Holiday. Skipping.")
         return
+    if not (SESSION_OPEN <= now.time() < SESSION_CLOSE):
+        print("[ExitMonitor] Market closed. Skipping.")
+        return
 
     positions = portfolio.state.positions
     if not positions:
@@ -57,20 +56,24 @@ def main():
     symbols = list(positions.keys())
     print(f"[ExitMonitor] Checking {len(symbols)} positions: {symbols}")
 
-    # Fetch current prices
-    data = yf.download(symbols + ["SPY", "^VIX"], period="5d", interval="5m", progress=False)
-    
+    # ExitManager only reads the close series (ATR proxy over the last atr_period returns),
+    # so 2 days of position bars are enough and SPY/^VIX are not needed. Yesterday's bars
+    # come from the on-disk day cache, so each cron run only downloads today's.
+    bars = PriceCache().get(symbols, interval="5m", lookback="2d")
+    closes = {sym: md.df.set_index("datetime")["close"].dropna() for sym, md in bars.items()}
+
+    # Live quotes in parallel; fall back to the last 5m close if a snapshot fails
+    with ThreadPoolExecutor(max_workers=min(8, len(symbols))) as pool:
+        quotes = dict(zip(symbols, pool.map(_last_price, symbols)))
+
     current_prices = {}
     price_series = {}
     for sym in symbols:
         try:
-            if len(symbols) == 1 and "SPY" not in symbols:
-                # Multi-download always has multi-level columns
-                current_prices[sym] = float(data["Close"][sym].iloc[-1])
-                price_series[sym] = data["Close"][sym].dropna()
-            else:
-                current_prices[sym] = float(data["Close"][sym].iloc[-1])
-                price_series[sym] = data["Close"][sym].dropna()
+            if sym in closes:
+                price_series[sym] = closes[sym]
+            price = quotes[sym] if quotes[sym] is not None else float(closes[sym].iloc[-1])
+            current_prices[sym] = price
         except Exception as e:
             print(f"[ExitMonitor] Price error for {sym}: {e}")
 
@@ -99,19 +102,20 @@ def main():
 
     # Execute exits
     print(f"[ExitMonitor] EXIT TRIGGERED: {forced_exits}")
-    for sym, side in forced_exits.items():
-        pos = positions.get(sym)
-        if not pos:
-            continue
-        price = current_prices.get(sym)
-        if not price or price <= 0:
-            print(f"[ExitMonitor] No price for {sym}, skipping exit")
-            continue
+    with TradeLog(DB_PATH, CSV_PATH, "exit_monitor") as trade_log:
+        for sym, side in forced_exits.items():
+            pos = positions.get(sym)
+            if not pos:
+                continue
+            price = current_prices.get(sym)
+            if not price or price <= 0:
+                print(f"[ExitMonitor] No price for {sym}, skipping exit")
+                continue
         
-        qty = abs(pos.quantity)
-        pnl = portfolio.execute(sym, side, price, quantity=qty)
-        log_trade(sym, side, qty, price, pnl)
-        print(f"[ExitMonitor] CLOSED {sym}: {side} {qty} shares @ ${price:.2f} | PnL: ${pnl:.2f}")
+            qty = abs(pos.quantity)
+            pnl = portfolio.execute(sym, side, price, quantity=qty)
+            trade_log.log(sym, side, qty, price, pnl)
+            print(f"[ExitMonitor] CLOSED {sym}: {side} {qty} shares @ ${price:.2f} | PnL: ${pnl:.2f}")
 
     portfolio.save()
     
@@ -1,30 +1,27 @@
 """Force close specified positions with current market price."""
-import sys, csv, sqlite3
-import yaml
+import sys
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
 import yfinance as yf
 from pathlib import Path
-from datetime import datetime
+from _db import TradeLog
+from trading_floor import config
 from trading_floor.portfolio import Portfolio
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 DB_PATH = PROJECT_ROOT / "trading.db"
 CSV_PATH = PROJECT_ROOT / "trading_logs" / "trades.csv"
 
-def log_trade(symbol, side, quantity, price, pnl):
-    ts = datetime.utcnow().isoformat()
-    with open(CSV_PATH, "a", newline="") as f:
-        csv.writer(f).writerow([ts, symbol, side, quantity, price, "", pnl])
+
+def _last_price(sym):
+    """Last trade from the quote snapshot (a few KB) instead of a bar download."""
     try:
-        conn = sqlite3.connect(str(DB_PATH))
-        conn.execute(
-            "INSERT INTO trades (timestamp, symbol, side, quantity, price, score, pnl, strategy_data) VALUES (?,?,?,?,?,?,?,?)",
-            (ts, symbol, side, quantity, price, 0.0, pnl, '{"source":"force_close"}')
-        )
-        conn.commit(); conn.close()
-    except Exception as e:
-        print(f"DB log error: {e}")
+        price = float(yf.Ticker(sym).fast_info["last_price"])
+        return price if price > 0 else None
+    except Exception:
+        return None
 
-cfg = yaml.safe_load(open("configs/workflow.yaml"))
+cfg = config.load()
 p = Portfolio(cfg)
 
 symbols = sys.argv[1:] if len(sys.argv) > 1 else list(p.state.positions.keys())
@@ -35,38 +32,39 @@ if not symbols:
 
 # Fetch current prices
 print("Fetching current prices...")
-data = yf.download(symbols, period="1d", interval="1m", progress=False)
-prices = {}
-for sym in symbols:
-    try:
-        if len(symbols) == 1:
-            val = data["Close"].iloc[-1]
-            if hasattr(val, '__iter__'):
-                val = list(val)[0]
-            prices[sym] = float(val)
-        else:
-            prices[sym] = float(data["Close"][sym].iloc[-1])
-    except Exception as e:
-        print(f"  {sym}: price fetch error: {e}")
+with ThreadPoolExecutor(max_workers=min(8, len(symbols))) as pool:
+    prices = {sym: price for sym, price in zip(symbols, pool.map(_last_price, symbols)) if price}
+
+# Snapshot failures fall back to the last 1m close, fetched in one batch
+missing = [sym for sym in symbols if sym not in prices]
+if missing:
+    data = yf.download(missing, period="1d", interval="1m", group_by="ticker", threads=True, progress=False)
+    for sym in missing:
+        try:
+            bars = data[sym] if isinstance(data.columns, pd.MultiIndex) else data
+            prices[sym] = float(bars["Close"].dropna().iloc[-1])
+        except Exception as e:
+            print(f"  {sym}: price fetch error: {e}")
 
 print(f"Prices: {prices}\n")
 
-for sym in symbols:
-    pos = p.state.positions.get(sym)
-    if not pos:
-        print(f"{sym}: no position found")
-        continue
+with TradeLog(DB_PATH, CSV_PATH, "force_close") as trade_log:
+    for sym in symbols:
+        pos = p.state.positions.get(sym)
+        if not pos:
+            print(f"{sym}: no position found")
+            continue
     
-    price = prices.get(sym)
-    if not price:
-        print(f"{sym}: no price available, skipping")
-        continue
+        price = prices.get(sym)
+        if not price:
+            print(f"{sym}: no price available, skipping")
+            continue
     
-    qty = abs(pos.quantity)
-    side = "BUY" if pos.quantity < 0 else "SELL"
-    pnl = p.execute(sym, side, price, quantity=qty)
-    log_trade(sym, side, qty, price, pnl)
-    print(f"CLOSED {sym}: {side} {qty} shares @ ${price:.2f} | PnL: ${pnl:.2f}")
+        qty = abs(pos.quantity)
+        side = "BUY" if pos.quantity < 0 else "SELL"
+        pnl = p.execute(sym, side, price, quantity=qty)
+        trade_log.log(sym, side, qty, price, pnl)
+        print(f"CLOSED {sym}: {side} {qty} shares @ ${price:.2f} | PnL: ${pnl:.2f}")
 
 p.save()
 
@@ -1,4 +1,7 @@
+import numpy as np
 import pandas as pd
+import matplotlib
+matplotlib.use("Agg")  # headless PNG output; skips interactive backend probing
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 from pathlib import Path
@@ -9,6 +12,26 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 EVENTS_CSV = REPO_ROOT / "trading_logs" / "events.csv"
 TRADES_CSV = REPO_ROOT / "trading_logs" / "trades.csv"
 OUTPUT_IMG = REPO_ROOT / "web" / "chart_pnl.png"
+MAX_POINTS = 2000  # more than the 10in x 100dpi plot can show
+
+
+def decimate(x, y, max_points=MAX_POINTS):
+    """
+    Thin a long curve for plotting: keep the min and max of each bucket (plus
+    the endpoints) so peaks and drawdowns survive at screen resolution.
+    """
+    n = len(y)
+    if n <= max_points:
+        return x, y
+    edges = np.linspace(0, n, max_points // 2 + 1).astype(int)
+    keep = [0, n - 1]
+    for a, b in zip(edges[:-1], edges[1:]):
+        if b > a:
+            seg = y[a:b]
+            keep += [a + int(np.argmin(seg)), a + int(np.argmax(seg))]
+    keep = np.unique(keep)
+    return x[keep], y[keep]
+
 
 def generate_chart():
     if not TRADES_CSV.exists():
@@ -16,7 +39,7 @@ def generate_chart():
         return
 
     # Load trades
-    trades = pd.read_csv(TRADES_CSV)
+    trades = pd.read_csv(TRADES_CSV, usecols=['timestamp', 'pnl'])
     if trades.empty:
         print("Trades file empty.")
         return
@@ -40,7 +63,8 @@ def generate_chart():
     fig, ax = plt.subplots(figsize=(10, 6))
     
     # Plot Equity Curve
-    ax.plot(trades['timestamp'], trades['equity'], color='#00ff00', linewidth=2, label='Equity')
+    ts, equity = decimate(trades['timestamp'].to_numpy(), trades['equity'].to_numpy())
+    ax.plot(ts, equity, color='#00ff00', linewidth=2, label='Equity')
     
     # Highlight Trades?
     # Maybe scatter points for Buy vs Sell?
@@ -3,12 +3,13 @@ Daily Trading Journal Generator
 Reads from trading.db, events.csv, trades.csv, and shadow_predictions
 to produce a structured daily journal entry with reasoning.
 """
-import sys, json, csv, sqlite3
+import sys, json, csv, io, mmap, re, sqlite3
 from datetime import datetime, date
 from pathlib import Path
 from collections import defaultdict
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+from _db import open_db, day_bounds
 
 PROJECT = Path(__file__).resolve().parent.parent
 DB = PROJECT / "trading.db"
@@ -17,41 +18,41 @@ EVENTS_CSV = PROJECT / "trading_logs" / "events.csv"
 JOURNAL_DIR = PROJECT / "trading_logs" / "journals"
 PORTFOLIO_JSON = PROJECT / "portfolio.json"
 
+# A CSV record starts on a line that begins with its ISO timestamp; free-text
+# notes may contain newlines, so a bare newline is not a row boundary
+_ROW_START = re.compile(rb"\n(?=\d{4}-\d\d-\d\d)")
+
 
 def get_shadow_summary(conn, day: str):
     """Summarize shadow predictions for the day."""
+    # SQLite aggregates per symbol; only one small row per symbol comes back
     rows = conn.execute(
-        "SELECT symbol, kalman_signal, hmm_state, hmm_bull_prob, hmm_bear_prob, timestamp "
-        "FROM shadow_predictions WHERE timestamp LIKE ? ORDER BY timestamp",
-        (f"{day}%",)
+        "SELECT symbol, COUNT(*), "
+        "COUNT(CASE WHEN hmm_state = 'bull' THEN 1 END), "
+        "COUNT(CASE WHEN hmm_state = 'bear' THEN 1 END), "
+        "TOTAL(hmm_bull_prob), COUNT(hmm_bull_prob), "
+        "TOTAL(hmm_bear_prob), COUNT(hmm_bear_prob) "
+        "FROM shadow_predictions WHERE timestamp >= ? AND timestamp < ? "
+        "GROUP BY symbol ORDER BY MIN(timestamp), MIN(id)",
+        day_bounds(day)
     ).fetchall()
     if not rows:
         return None
 
-    symbols = defaultdict(list)
-    for sym, kal, hmm_st, bull_p, bear_p, ts in rows:
-        symbols[sym].append({
-            "kalman": kal, "hmm_state": hmm_st,
-            "bull_prob": bull_p, "bear_prob": bear_p, "time": ts
-        })
-
-    # Aggregate
-    hmm_states = [r[2] for r in rows]
-    bull_probs = [r[3] for r in rows if r[3] is not None]
-    bear_probs = [r[4] for r in rows if r[4] is not None]
-
-    bull_count = sum(1 for s in hmm_states if s == "bull")
-    bear_count = sum(1 for s in hmm_states if s == "bear")
-    neutral_count = len(hmm_states) - bull_count - bear_count
+    total = sum(r[1] for r in rows)
+    bull_count = sum(r[2] for r in rows)
+    bear_count = sum(r[3] for r in rows)
+    bull_sum, bull_n = sum(r[4] for r in rows), sum(r[5] for r in rows)
+    bear_sum, bear_n = sum(r[6] for r in rows), sum(r[7] for r in rows)
 
     return {
-        "total_predictions": len(rows),
-        "unique_symbols": len(symbols),
-        "hmm_bull_pct": round(bull_count / len(hmm_states) * 100, 1) if hmm_states else 0,
-        "hmm_bear_pct": round(bear_count / len(hmm_states) * 100, 1) if hmm_states else 0,
-        "avg_bull_prob": round(sum(bull_probs) / len(bull_probs) * 100, 1) if bull_probs else 0,
-        "avg_bear_prob": round(sum(bear_probs) / len(bear_probs) * 100, 1) if bear_probs else 0,
-        "symbols": {k: len(v) for k, v in symbols.items()},
+        "total_predictions": total,
+        "unique_symbols": len(rows),
+        "hmm_bull_pct": round(bull_count / total * 100, 1),
+        "hmm_bear_pct": round(bear_count / total * 100, 1),
+        "avg_bull_prob": round(bull_sum / bull_n * 100, 1) if bull_n else 0,
+        "avg_bear_prob": round(bear_sum / bear_n * 100, 1) if bear_n else 0,
+        "symbols": {r[0]: r[1] for r in rows},
     }
 
 
@@ -59,8 +60,8 @@ def get_agent_memory(conn, day: str):
     """Get agent memory entries for the day."""
     rows = conn.execute(
         "SELECT agent_name, symbol, signal_type, signal_value, outcome, confidence, timestamp "
-        "FROM agent_memory WHERE timestamp LIKE ? ORDER BY timestamp",
-        (f"{day}%",)
+        "FROM agent_memory WHERE timestamp >= ? AND timestamp < ? ORDER BY timestamp",
+        day_bounds(day)
     ).fetchall()
     agents = defaultdict(list)
     for name, sym, sig_type, sig_val, outcome, conf, ts in rows:
@@ -72,35 +73,58 @@ def get_agent_memory(conn, day: str):
     return dict(agents)
 
 
-def get_trades(day: str):
-    """Get trades from CSV for the day."""
-    trades = []
-    if TRADES_CSV.exists():
-        with open(TRADES_CSV, "r") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if row.get("timestamp", "").startswith(day):
-                    trades.append(row)
-    return trades
+def get_trades(conn, day: str):
+    """Get trades for the day (range scan on idx_trades_ts_pnl_sym); numeric columns come back typed."""
+    rows = conn.execute(
+        "SELECT timestamp, symbol, side, quantity, price, score, pnl "
+        "FROM trades WHERE timestamp >= ? AND timestamp < ? ORDER BY timestamp",
+        day_bounds(day)
+    ).fetchall()
+    return [dict(row) for row in rows]
+
+
+def _next_row(mm, pos: int, first: int) -> int:
+    """Offset of the first CSV record starting at or after pos."""
+    if pos <= first:
+        return first
+    m = _ROW_START.search(mm, pos - 1)
+    return m.end() if m else len(mm)
+
+
+def _bisect_day(mm, day: bytes, first: int) -> int:
+    """Offset of the first record whose timestamp is >= day (file is time-ordered)."""
+    lo, hi = first, len(mm)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        row = _next_row(mm, mid, first)
+        if row == len(mm) or mm[row:row + len(day)] >= day:
+            hi = mid
+        else:
+            lo = mid + 1
+    return _next_row(mm, lo, first)
 
 
 def get_events(day: str):
-    """Get events from CSV for the day."""
-    events = []
-    if EVENTS_CSV.exists():
-        with open(EVENTS_CSV, "r") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if row.get("timestamp", "").startswith(day):
-                    events.append(row)
-    return events
+    """Get events from CSV for the day, bisecting the file instead of scanning it."""
+    if not EVENTS_CSV.exists() or EVENTS_CSV.stat().st_size == 0:
+        return []
+    with open(EVENTS_CSV, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        header_line = mm.readline()
+        first = len(header_line)
+        start, end = (_bisect_day(mm, d.encode(), first) for d in day_bounds(day))
+        block = mm[start:end].decode("utf-8")
+    header = next(csv.reader([header_line.decode("utf-8")]), None)
+    if not header:
+        return []
+    reader = csv.DictReader(io.StringIO(block, newline=""), fieldnames=header)
+    return [row for row in reader if row.get("timestamp", "").startswith(day)]
 
 
 def get_portfolio():
     """Get current portfolio state."""
     if PORTFOLIO_JSON.exists():
         try:
-            return json.loads(PORTFOLIO_JSON.read_text())
+            return json.loads(PORTFOLIO_JSON.read_bytes())
         except:
             pass
     return None
@@ -111,16 +135,23 @@ def generate_journal(day: str = None):
     if day is None:
         day = date.today().isoformat()
 
-    conn = sqlite3.connect(str(DB))
-
-    shadow = get_shadow_summary(conn, day)
-    agent_mem = get_agent_memory(conn, day)
-    trades = get_trades(day)
+    conn = open_db(str(DB))
+    conn.execute("PRAGMA query_only=1")  # the journal only reads
+    conn.execute("PRAGMA cache_size=-20000")
+    conn.row_factory = sqlite3.Row
+
+    # One read transaction: the three queries share a snapshot and a single lock
+    try:
+        conn.execute("BEGIN")
+        shadow = get_shadow_summary(conn, day)
+        agent_mem = get_agent_memory(conn, day)
+        trades = get_trades(conn, day)
+        conn.commit()
+    finally:
+        conn.close()
     events = get_events(day)
     portfolio = get_portfolio()
 
-    conn.close()
-
     # Build the journal
     entry = {
         "date": day,
@@ -225,9 +256,9 @@ def generate_journal(day: str = None):
     parts.append("## Trades")
     if entry["trades_executed"]:
         for t in entry["trades_executed"]:
-            pnl_str = f"${float(t['pnl']):+,.2f}" if t.get("pnl") else "pending"
+            pnl_str = f"${t['pnl']:+,.2f}" if t.get("pnl") is not None else "pending"
             parts.append(f"- **{t['side']} {t['symbol']}** — qty: {t['quantity']}, "
-                        f"price: ${float(t['price']):,.2f}, score: {t['score']}, PnL: {pnl_str}")
+                        f"price: ${t['price']:,.2f}, score: {t['score']}, PnL: {pnl_str}")
     else:
         parts.append("No trades executed today.")
     parts.append("")
@@ -1,46 +1,104 @@
 import csv
+import io
 import json
+import os
+import re
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
 EVENTS = ROOT / "trading_logs" / "events.csv"
 TRADES = ROOT / "trading_logs" / "trades.csv"
 OUT_JSON = ROOT / "web" / "report.json"
+TAIL_BYTES = 64 * 1024
+_ROW_START = re.compile(rb"\n(?=\d{4}-\d\d-\d\d)")
+
+
+def _read_tail(path: Path, enough):
+    """
+    Header and trailing rows of a CSV without reading the whole log. Starts
+    with the last TAIL_BYTES and doubles the window until enough(header, rows)
+    holds or the window reaches the header.
+    """
+    size = path.stat().st_size
+    with path.open("rb") as f:
+        header_line = f.readline()
+        header = next(csv.reader([header_line.decode("utf-8")]), None)
+        if not header:
+            return None, []
+        window = TAIL_BYTES
+        while True:
+            start = max(len(header_line), size - window)
+            if start > len(header_line):
+                # Free-text notes may span lines, so only cut where a new row's
+                # timestamp begins (backing up one byte keeps a row starting at `start`)
+                f.seek(start - 1)
+                blob = f.read()
+                cut = _ROW_START.search(blob)
+                blob = blob[cut.end():] if cut else b""
+            else:
+                f.seek(start)
+                blob = f.read()
+            rows = [row for row in csv.reader(io.StringIO(blob.decode("utf-8"), newline="")) if row]
+            if start == len(header_line) or enough(header, rows):
+                return header, rows
+            window *= 2
+
+
+def _read_latest(path: Path):
+    """TradeLogger's JSON snapshot of the log's newest rows, if it is still current."""
+    try:
+        snap = json.loads(path.with_suffix(".last.json").read_bytes())
+        if snap.get("csv_size") == path.stat().st_size:
+            return snap
+    except (OSError, ValueError):
+        pass
+    return None
 
 
 def read_last_row(path: Path):
     if not path.exists():
         return None
-    with path.open("r", encoding="utf-8", newline="") as f:
-        reader = csv.reader(f)
-        header = next(reader, None)
-        if not header:
-            return None
-        last = None
-        for row in reader:
-            if not row:
-                continue
-            if len(row) > len(header):
-                if "plan_notes" not in header and len(row) == len(header) + 1:
-                    header = header + ["plan_notes"]
-                else:
-                    header = header + [f"extra_{i}" for i in range(1, len(row) - len(header) + 1)]
-            last = row
-        if last is None:
-            return None
-        last = last + [""] * max(0, len(header) - len(last))
-        return dict(zip(header, last))
-
-
-def read_trades(path: Path):
+    snap = _read_latest(path)
+    if snap:
+        return snap["row"]
+    header, rows = _read_tail(path, lambda header, rows: bool(rows))
+    if not header or not rows:
+        return None
+    for row in rows:
+        if len(row) > len(header):
+            if "plan_notes" not in header and len(row) == len(header) + 1:
+                header = header + ["plan_notes"]
+            else:
+                header = header + [f"extra_{i}" for i in range(1, len(row) - len(header) + 1)]
+    last = rows[-1]
+    last = last + [""] * max(0, len(header) - len(last))
+    return dict(zip(header, last))
+
+
+def read_recent_trades(path: Path, last_ts: str):
+    """Trades logged at last_ts, or the last 5 when there is no run timestamp."""
     if not path.exists():
         return []
-    with path.open("r", encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
-        return [row for row in reader if row]
+    snap = _read_latest(path)
+    if snap and last_ts != "—" and snap["timestamp"] == last_ts:
+        return snap["rows"]
 
+    def enough(header, rows):
+        # Rows are appended in time order, so stop once the window reaches a row older than the run
+        if last_ts == "—" or "timestamp" not in header:
+            return len(rows) >= 5
+        ts_col = header.index("timestamp")
+        return bool(rows) and len(rows[0]) > ts_col and rows[0][ts_col] < last_ts
 
-def main():
+    header, rows = _read_tail(path, enough)
+    if not header:
+        return []
+    trades = [dict(zip(header, row + [None] * (len(header) - len(row)))) for row in rows]
+    return [t for t in trades if t.get("timestamp") == last_ts] if last_ts != "—" else trades[-5:]
+
+
+def build_payload() -> dict:
+    """Dashboard payload for web/report.json from the latest event and its trades."""
     payload = {
         "timestamp": "—",
         "status": "No runs yet",
@@ -63,21 +121,32 @@ def main():
                 notes.append(str(val))
         payload["notes"] = notes
 
-    trades = read_trades(TRADES)
-    if trades:
-        last_ts = payload["timestamp"]
-        recent = [t for t in trades if t.get("timestamp") == last_ts] if last_ts != "—" else trades[-5:]
+    recent = read_recent_trades(TRADES, payload["timestamp"])
+    if recent:
         payload["plans"] = [
             {
                 "symbol": r.get("symbol"),
                 "side": r.get("side"),
-                "score": float(r.get("score")) if r.get("score") else 0.0,
+                "score": float(r.get("score") or 0.0),
             }
             for r in recent
         ]
+    return payload
+
 
+def main():
+    data = json.dumps(build_payload()).encode("utf-8")
+    # serve_report calls this every 30s; leave the file alone when nothing changed
+    try:
+        if OUT_JSON.read_bytes() == data:
+            return
+    except OSError:
+        pass
     OUT_JSON.parent.mkdir(parents=True, exist_ok=True)
-    OUT_JSON.write_text(json.dumps(payload), encoding="utf-8")
+    # Swap the new file in whole so serve_report never loads a partial write
+    tmp = OUT_JSON.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, OUT_JSON)
     print(f"Wrote {OUT_JSON}")
 
 
@@ -19,35 +19,39 @@ candidates = [
     ('CRML', 'SELL', '10:00', 0.48),
 ]
 
+def _split(data, symbols):
+    """Per-symbol OHLC frames from a group_by='ticker' download."""
+    out = {}
+    tickers = set(data.columns.get_level_values(0)) if isinstance(data.columns, pd.MultiIndex) else set()
+    for sym in symbols:
+        out[sym] = data[sym].dropna(how='all') if sym in tickers else pd.DataFrame()
+    return out
+
+# One request for every distinct symbol; period='1d' retry only for the ones that came back empty
+symbols = sorted({c[0] for c in candidates})
+frames = {sym: pd.DataFrame() for sym in symbols}
+try:
+    frames.update(_split(yf.download(symbols, start='2026-02-27', end='2026-02-28', interval='5m',
+                                     group_by='ticker', threads=True, progress=False), symbols))
+    missing = [sym for sym in symbols if frames[sym].empty]
+    if missing:
+        frames.update(_split(yf.download(missing, period='1d', interval='5m',
+                                         group_by='ticker', threads=True, progress=False), missing))
+except Exception as e:
+    print(f'Download ERROR: {e}\n')
+
 for sym, side, signal_time, score in candidates:
     try:
-        data = yf.download(sym, start='2026-02-27', end='2026-02-28', interval='5m', progress=False)
-        if len(data) == 0:
-            data = yf.download(sym, period='1d', interval='5m', progress=False)
+        data = frames[sym]
         
         if len(data) < 5:
             print(f'{sym:6s} — insufficient intraday data')
             continue
 
-        # Find entry price near signal time
-        # Use open price around 9:30-9:45 for morning signals
-        opens = data.head(3)
-        entry_price = data['Open'].iloc[0]
-        if hasattr(entry_price, 'item'):
-            entry_price = entry_price.item()
-        
-        # Current/EOD price
-        exit_price = data['Close'].iloc[-1]
-        if hasattr(exit_price, 'item'):
-            exit_price = exit_price.item()
-        
-        # High and low of day for best/worst case
-        day_high = data['High'].max()
-        day_low = data['Low'].min()
-        if hasattr(day_high, 'item'):
-            day_high = day_high.item()
-        if hasattr(day_low, 'item'):
-            day_low = day_low.item()
+        # Entry at the first open, exit at the last close, best/worst at the day's range
+        entry_price, exit_price, day_high, day_low = (
+            float(v) for v in (data['Open'].iloc[0], data['Close'].iloc[-1],
+                               data['High'].max(), data['Low'].min()))
         
         # Calculate hypothetical P&L per $500 position
         position_size = 500
@@ -1,15 +1,21 @@
 import sqlite3, os, glob
+from itertools import groupby
+from pathlib import Path
 
 # Find all .db files
 for db_path in glob.glob(os.path.join(os.path.dirname(__file__), '..', 'data', '*.db')):
     print(f"\nDB: {db_path}")
-    c = sqlite3.connect(db_path)
-    tables = c.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()
-    for t in tables:
-        print(f"  Table: {t[0]}")
-        cols = c.execute(f"PRAGMA table_info({t[0]})").fetchall()
-        print(f"    Cols: {[col[1] for col in cols]}")
-        row = c.execute(f"SELECT * FROM {t[0]} ORDER BY rowid DESC LIMIT 1").fetchone()
+    # Read-only, autocommit: inspection never needs a write lock or a transaction
+    c = sqlite3.connect(f"{Path(db_path).resolve().as_uri()}?mode=ro", uri=True, isolation_level=None)
+    # Every table with its columns in one statement
+    cols = c.execute(
+        "SELECT m.name, p.name FROM sqlite_master m, pragma_table_info(m.name) p "
+        "WHERE m.type = 'table' ORDER BY m.rowid, p.cid"
+    ).fetchall()
+    for table, rows in groupby(cols, key=lambda r: r[0]):
+        print(f"  Table: {table}")
+        print(f"    Cols: {[col for _, col in rows]}")
+        row = c.execute(f"SELECT * FROM {table} ORDER BY rowid DESC LIMIT 1").fetchone()
         print(f"    Last: {row}")
     c.close()
 
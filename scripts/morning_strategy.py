@@ -10,19 +10,25 @@ Output:
   - Recommended focus list (highest confidence stocks)
   - Strategy for the day (long-biased, short-biased, mixed, or sit-out)
 """
-import sys, os, io, json, sqlite3
+import sys, os, io, json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from collections import defaultdict
 
+import numpy as np
+
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from trading_floor.sector_filter import get_all_sector_sentiments, check_sector_filter
 from trading_floor.sector_map import SECTOR_MAP, get_all_sectors
+from _db import open_db
 
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) if '__file__' in dir() else os.getcwd()
 DB_PATH = os.path.join(PROJECT_ROOT, 'trading.db')
 PORTFOLIO_PATH = os.path.join(PROJECT_ROOT, 'portfolio.json')
+# symbol -> sector, bound as one JSON parameter so the stats query can join it
+SECTOR_JSON = json.dumps({sym: info['sector'] for sym, info in SECTOR_MAP.items()})
 
 
 def load_portfolio():
@@ -33,38 +39,54 @@ def load_portfolio():
         return {"cash": 0, "equity": 0, "positions": {}}
 
 
-def get_historical_stats(db):
-    """Get win rate by symbol from past trades."""
-    rows = db.execute('''
-        SELECT symbol, side,
-               COUNT(*) as trades,
-               SUM(CASE WHEN pnl > 0 THEN 1 ELSE 0 END) as wins,
-               SUM(CASE WHEN pnl < 0 THEN 1 ELSE 0 END) as losses,
-               SUM(pnl) as total_pnl,
-               AVG(pnl) as avg_pnl
-        FROM trades
-        WHERE pnl != 0
-        GROUP BY symbol
-        ORDER BY SUM(pnl) DESC
-    ''').fetchall()
-    return rows
-
-
-def get_recent_signal_performance(db, days=5):
-    """Which stocks had strong signals that led to wins?"""
-    rows = db.execute('''
-        SELECT s.symbol,
-               AVG(s.final_score) as avg_signal,
-               AVG(s.score_news) as avg_news,
-               AVG(s.score_mom) as avg_mom,
-               COUNT(*) as signal_count
-        FROM signals s
-        WHERE date(s.timestamp) >= date('now', ? || ' days')
-        GROUP BY s.symbol
-        HAVING COUNT(*) >= 2
-        ORDER BY AVG(s.final_score) DESC
-    ''', (str(-days),)).fetchall()
-    return rows
+def get_symbol_stats(db, days=5):
+    """
+    Per-symbol trade history (win/loss, total P&L) and recent signal quality
+    (averages over the last `days`, symbols with 2+ signals) in one query.
+    A symbol present on only one side has NULLs for the other. Each row also
+    carries its SECTOR_MAP sector ('???' if unmapped); rows come back ordered
+    by symbol.
+    """
+    # Plain ISO cutoff (UTC, like date('now')) so the range seeks idx_signals_ts
+    since = (datetime.utcnow().date() - timedelta(days=days)).isoformat()
+    cur = db.execute('''
+        WITH sm AS (
+            SELECT key AS symbol, value AS sector FROM json_each(?)
+        ), t AS (
+            SELECT symbol,
+                   COUNT(*) AS trades,
+                   SUM(CASE WHEN pnl > 0 THEN 1 ELSE 0 END) AS wins,
+                   SUM(CASE WHEN pnl < 0 THEN 1 ELSE 0 END) AS losses,
+                   SUM(pnl) AS total_pnl
+            FROM trades
+            WHERE pnl != 0
+            GROUP BY symbol
+        ), s AS (
+            SELECT symbol,
+                   AVG(final_score) AS avg_signal,
+                   AVG(score_news) AS avg_news,
+                   AVG(score_mom) AS avg_mom,
+                   COUNT(*) AS signal_count
+            FROM signals
+            WHERE timestamp >= ?
+            GROUP BY symbol
+            HAVING COUNT(*) >= 2
+        )
+        SELECT u.*, COALESCE(sm.sector, '???') AS sector
+        FROM (
+            SELECT symbol, t.trades, t.wins, t.losses, t.total_pnl,
+                   s.avg_signal, s.avg_news, s.avg_mom, s.signal_count
+            FROM t LEFT JOIN s USING (symbol)
+            UNION ALL
+            SELECT symbol, NULL, NULL, NULL, NULL,
+                   avg_signal, avg_news, avg_mom, signal_count
+            FROM s WHERE symbol NOT IN (SELECT symbol FROM t)
+        ) u LEFT JOIN sm USING (symbol)
+        ORDER BY symbol
+    ''', (SECTOR_JSON, since))
+    cols = [c[0] for c in cur.description]
+    # Build the dicts straight off the cursor; no intermediate tuple list
+    return [dict(zip(cols, row)) for row in cur]
 
 
 def get_premarket_movers():
@@ -75,8 +97,8 @@ def get_premarket_movers():
         symbols = [s for s in SECTOR_MAP.keys() if SECTOR_MAP[s]['sector'] != 'ETF']
         # Just check a few key ones for pre-market
         key_symbols = ['SPY', 'QQQ', 'NVDA', 'TSLA', 'AMD', 'IREN', 'RGTI', 'RKLB', 'JPM', 'COIN']
-        movers = []
-        for sym in key_symbols:
+
+        def _fetch_one(sym):
             try:
                 t = yf.Ticker(sym)
                 info = t.fast_info
@@ -84,31 +106,40 @@ def get_premarket_movers():
                 current = getattr(info, 'last_price', None) or getattr(info, 'open', None)
                 if prev_close and current and prev_close > 0:
                     change_pct = (current - prev_close) / prev_close * 100
-                    movers.append((sym, change_pct, current, prev_close))
+                    return (sym, change_pct, current, prev_close)
             except Exception:
                 pass
+            return None
+
+        # One quote round-trip per symbol, all in flight at once
+        with ThreadPoolExecutor(max_workers=len(key_symbols)) as pool:
+            movers = [m for m in pool.map(_fetch_one, key_symbols) if m]
         movers.sort(key=lambda x: abs(x[1]), reverse=True)
         return movers
     except Exception:
         return []
 
 
-def compute_confidence_score(sym, sector_score, avg_signal, historical_pnl, news_score):
+def compute_confidence_scores(sector_score, avg_signal, historical_pnl, news_score):
     """
-    Composite confidence score for daily planning.
+    Composite confidence score for daily planning, for every candidate at
+    once. Arguments are equal-length arrays; NaN marks a missing value.
     Higher = more confident in a profitable trade.
     """
-    score = 0.0
-    # Sector sentiment (25% weight)
-    score += sector_score * 0.25
-    # Recent signal strength (30% weight)
-    score += (avg_signal or 0) * 0.30
-    # Historical profitability (25% weight)
-    if historical_pnl is not None:
-        score += (0.25 if historical_pnl > 0 else -0.25)
-    # News quality (20% weight)
-    score += (news_score or 0) * 0.20
-    return score
+    return (
+        # Sector sentiment (25% weight)
+        sector_score * 0.25
+        # Recent signal strength (30% weight)
+        + np.nan_to_num(avg_signal) * 0.30
+        # Historical profitability (25% weight); no history adds nothing
+        + np.where(np.isnan(historical_pnl), 0.0, np.where(historical_pnl > 0, 0.25, -0.25))
+        # News quality (20% weight)
+        + np.nan_to_num(news_score) * 0.20
+    )
+
+
+def _as_array(values):
+    return np.array([np.nan if v is None else v for v in values], dtype=float)
 
 
 def run_morning_strategy():
@@ -123,6 +154,11 @@ def run_morning_strategy():
     positions = portfolio.get('positions', {})
     print(f"\nPortfolio: ${equity:,.2f} equity | ${cash:,.2f} cash | {len(positions)} positions")
 
+    db = open_db(DB_PATH)
+    db.execute("PRAGMA query_only=1")  # the planner only reads
+    # Nothing funded and nothing ever traded: only the sector scan is useful
+    cold_start = equity == 0 and db.execute("SELECT 1 FROM trades LIMIT 1").fetchone() is None
+
     # 1. Sector Sentiments
     print("\n" + "=" * 70)
     print("1. SECTOR SENTIMENT SCAN")
@@ -138,6 +174,18 @@ def run_morning_strategy():
         elif score > 0.05:
             green_sectors.append(sector)
 
+    if cold_start:
+        print("\n  Cold start — no equity and no trade history; skipping movers, history and watchlist")
+        print("\n" + "=" * 70)
+        db.close()
+        return {
+            'strategy': "COLD START",
+            'focus_longs': [],
+            'focus_shorts': [],
+            'blocked_sectors': blocked_sectors,
+            'green_sectors': green_sectors,
+        }
+
     # 2. Pre-market movers
     print("\n" + "=" * 70)
     print("2. PRE-MARKET MOVERS")
@@ -154,14 +202,17 @@ def run_morning_strategy():
     print("\n" + "=" * 70)
     print("3. HISTORICAL WIN RATE BY STOCK")
     print("=" * 70)
-    db = sqlite3.connect(DB_PATH)
-    hist_stats = get_historical_stats(db)
+    stats = get_symbol_stats(db)
+    # Stable sorts over the symbol-ordered rows, so ties stay alphabetical
+    hist_stats = sorted((r for r in stats if r['trades'] is not None),
+                        key=lambda r: r['total_pnl'], reverse=True)
     hist_pnl_map = {}
     if hist_stats:
         print(f"  {'Symbol':8s} {'Trades':>6s} {'Wins':>5s} {'Losses':>6s} {'WinRate':>8s} {'TotalPnL':>10s}")
-        for sym, side, trades, wins, losses, total_pnl, avg_pnl in hist_stats:
-            wins = wins or 0
-            losses = losses or 0
+        for r in hist_stats:
+            sym, trades, total_pnl = r['symbol'], r['trades'], r['total_pnl']
+            wins = r['wins'] or 0
+            losses = r['losses'] or 0
             wr = wins / trades * 100 if trades > 0 else 0
             hist_pnl_map[sym] = total_pnl
             print(f"  {sym:8s} {trades:6d} {wins:5d} {losses:6d} {wr:7.0f}% ${total_pnl:+9.2f}")
@@ -172,52 +223,53 @@ def run_morning_strategy():
     print("\n" + "=" * 70)
     print("4. RECENT SIGNAL QUALITY (last 5 days)")
     print("=" * 70)
-    recent = get_recent_signal_performance(db)
+    recent = sorted((r for r in stats if r['signal_count'] is not None),
+                    key=lambda r: (r['avg_signal'] is not None, r['avg_signal'] or 0), reverse=True)
     signal_map = {}
     news_map = {}
     if recent:
         print(f"  {'Symbol':8s} {'AvgSignal':>10s} {'AvgNews':>8s} {'AvgMom':>8s} {'Signals':>8s} {'Sector':>20s}")
-        for sym, avg_sig, avg_news, avg_mom, count in recent:
-            sector = SECTOR_MAP.get(sym, {}).get('sector', '???')
-            signal_map[sym] = avg_sig
-            news_map[sym] = avg_news
-            print(f"  {sym:8s} {avg_sig:+10.3f} {avg_news:+8.3f} {avg_mom:+8.3f} {count:8d} {sector:>20s}")
+        for r in recent:
+            sym, sector = r['symbol'], r['sector']
+            signal_map[sym] = r['avg_signal']
+            news_map[sym] = r['avg_news']
+            print(f"  {sym:8s} {r['avg_signal']:+10.3f} {r['avg_news']:+8.3f} {r['avg_mom']:+8.3f} {r['signal_count']:8d} {sector:>20s}")
 
     # 5. Build confidence-ranked watchlist
     print("\n" + "=" * 70)
     print("5. HIGH-CONFIDENCE WATCHLIST")
     print("=" * 70)
     
-    candidates = []
-    for sym, info in SECTOR_MAP.items():
-        sector = info['sector']
-        if sector == 'ETF':
-            continue
-        if sector in blocked_sectors:
-            continue
-        
-        sector_score = sentiments.get(sector, 0)
-        avg_signal = signal_map.get(sym)
-        historical_pnl = hist_pnl_map.get(sym)
-        news_score = news_map.get(sym)
-        
-        confidence = compute_confidence_score(sym, sector_score, avg_signal, historical_pnl, news_score)
-        candidates.append({
-            'symbol': sym,
-            'sector': sector,
-            'confidence': confidence,
-            'sector_score': sector_score,
-            'avg_signal': avg_signal,
-            'hist_pnl': historical_pnl,
-            'news_score': news_score,
-        })
-    
-    # Sort by confidence
-    candidates.sort(key=lambda x: x['confidence'], reverse=True)
+    skip_sectors = set(blocked_sectors) | {'ETF'}
+    universe = [(sym, info['sector']) for sym, info in SECTOR_MAP.items() if info['sector'] not in skip_sectors]
+    sector_scores = [sentiments.get(sector, 0) for _, sector in universe]
+    avg_signals = [signal_map.get(sym) for sym, _ in universe]
+    hist_pnls = [hist_pnl_map.get(sym) for sym, _ in universe]
+    news_scores = [news_map.get(sym) for sym, _ in universe]
+    confidence = compute_confidence_scores(
+        np.array(sector_scores, dtype=float), _as_array(avg_signals),
+        _as_array(hist_pnls), _as_array(news_scores),
+    )
+
+    # Sort by confidence (stable, so ties keep universe order)
+    candidates = [
+        {
+            'symbol': universe[i][0],
+            'sector': universe[i][1],
+            'confidence': float(confidence[i]),
+            'sector_score': sector_scores[i],
+            'avg_signal': avg_signals[i],
+            'hist_pnl': hist_pnls[i],
+            'news_score': news_scores[i],
+        }
+        for i in np.argsort(-confidence, kind='stable')
+    ]
     
-    # Top longs
-    longs = [c for c in candidates if c['confidence'] > 0.10]
-    shorts = [c for c in candidates if c['confidence'] < -0.10]
+    # Top longs / shorts: candidates is sorted high to low, so they are a prefix and a suffix
+    n_longs = int(np.count_nonzero(confidence > 0.10))
+    n_shorts = int(np.count_nonzero(confidence < -0.10))
+    longs = candidates[:n_longs]
+    shorts = candidates[len(candidates) - n_shorts:]
     
     print(f"\n  TOP LONG CANDIDATES ({len(longs)} stocks):")
     print(f"  {'Rank':4s} {'Symbol':6s} {'Sector':20s} {'Conf':>7s} {'SectorSent':>10s} {'AvgSig':>7s} {'HistPnL':>8s}")
@@ -1,4 +1,6 @@
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 import yaml
 from pathlib import Path
 import numpy as np
@@ -9,17 +11,30 @@ TRADES_CSV = REPO_ROOT / "trading_logs" / "trades.csv"
 SIGNALS_CSV = REPO_ROOT / "trading_logs" / "signals.csv"
 CONFIG_YAML = REPO_ROOT / "configs" / "workflow.yaml"
 
+# Join keys, kept as the exact logged text on both sides
+KEYS = ["timestamp", "symbol", "side"]
+SCORE_COLS = ["score_mom", "score_mean", "score_break", "score_news"]
+
+def _read_log(path, cols):
+    """Only the columns the optimizer uses, parsed by pyarrow's multithreaded reader."""
+    try:
+        opts = pa_csv.ConvertOptions(include_columns=cols, column_types={k: pa.string() for k in KEYS})
+        return pa_csv.read_csv(path, convert_options=opts).to_pandas()
+    except pa.ArrowInvalid:
+        # Ragged rows (e.g. short rows appended by the helper scripts) need pandas' parser
+        return pd.read_csv(path, usecols=cols, dtype={k: str for k in KEYS})
+
 def load_data():
     if not TRADES_CSV.exists() or not SIGNALS_CSV.exists():
         print("[Optimizer] Missing logs. Need trades.csv and signals.csv.")
         return None, None
     
-    trades = pd.read_csv(TRADES_CSV)
-    signals = pd.read_csv(SIGNALS_CSV)
+    trades = _read_log(TRADES_CSV, [*KEYS, "pnl"])
+    signals = _read_log(SIGNALS_CSV, [*KEYS, *SCORE_COLS])
     
     # Simple join on symbol + timestamp (approximate matching might be needed in real high-freq, 
     # but here timestamps should align as they come from the same run loop).
-    merged = pd.merge(trades, signals, on=["timestamp", "symbol", "side"], how="inner")
+    merged = pd.merge(trades, signals, on=KEYS, how="inner")
     return merged
 
 def optimize_weights(df):
@@ -59,34 +74,19 @@ def optimize_weights(df):
     
     # We want to reward the component that had the 'strongest' signal in the 'correct' direction.
     
-    scores = {"momentum": 0.0, "meanrev": 0.0, "breakout": 0.0, "news": 0.0}
+    # This is fuzzy because we are looking at the CLOSE signal, not the OPEN signal.
+    # For this MVP, we assume the signal type persists (Trend strategies stay trend):
+    # the signal logged at the *Closing* event is a proxy for the regime.
     
-    for _, row in closing_trades.iterrows():
-        pnl = row["pnl"]
-        # Analyze which component pushed for this trade?
-        # This is fuzzy because we are looking at the CLOSE signal, not the OPEN signal.
-        # Ideally we'd look up the OPEN signal. 
-        # For this MVP, we assume the signal type persists (Trend strategies stay trend).
-        
-        # Simple Regime Check:
-        # If Momentum Score was high magnitude matching the trade side, and trade won -> Boost Mom.
-        
-        # Let's simplify: Just adjust based on aggregate performance of the *strategy types*.
-        # We'll rely on the signal logged at the *Closing* event as a proxy for the regime.
-        # (If Momentum is still screaming BUY when we sold for profit, maybe Momentum was right).
-        
-        # Let's accumulate 'votes' for weights.
-        
-        # Impact = Magnitude of Score * Sign of PnL
-        # If PnL > 0, we reinforce the strong signals.
-        # If PnL < 0, we penalize the strong signals.
-        
-        direction = 1.0 if pnl > 0 else -1.0
-        
-        scores["momentum"] += abs(row["score_mom"]) * direction
-        scores["meanrev"] += abs(row["score_mean"]) * direction
-        scores["breakout"] += abs(row["score_break"]) * direction
-        scores["news"] += abs(row["score_news"]) * direction # News is 0-1 scaled usually
+    # Impact = Magnitude of Score * Sign of PnL
+    # If PnL > 0, we reinforce the strong signals.
+    # If PnL < 0, we penalize the strong signals.
+    direction = np.where(closing_trades["pnl"].to_numpy() > 0, 1.0, -1.0)
+    
+    components = [("momentum", "score_mom"), ("meanrev", "score_mean"),
+                  ("breakout", "score_break"), ("news", "score_news")]  # News is 0-1 scaled usually
+    scores = {k: float((np.abs(closing_trades[col].to_numpy(dtype=float)) * direction).sum())
+              for k, col in components}
 
     # Normalize scores to 0-1 range sum
     # Softmax or simple ratio?
@@ -16,6 +16,8 @@ from trading_floor.sector_filter import get_all_sector_sentiments, _scrape_secto
 from trading_floor.sector_map import SECTOR_MAP, get_all_sectors
 from trading_floor.agents.news import _keyword_score, _scrape_google_news
 import json
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 def run_prep():
@@ -25,19 +27,21 @@ def run_prep():
 
     # 1. Broad market check
     print("\n📊 BROAD MARKET SENTIMENT")
-    for query_name, query in [
+    market_queries = [
         ("US Market", "US stock market today premarket futures"),
         ("S&P 500", "S&P 500 futures premarket today"),
         ("Nasdaq", "Nasdaq futures tech stocks premarket today"),
-    ]:
-        headlines = _scrape_sector_news(query, max_headlines=5)
+    ]
+    # Fetch all three at once, print in order
+    with ThreadPoolExecutor(max_workers=len(market_queries)) as pool:
+        fetched = list(pool.map(lambda q: _scrape_sector_news(q[1], max_headlines=5), market_queries))
+    for (query_name, query), headlines in zip(market_queries, fetched):
         if headlines:
             scores = [_keyword_score(h) for h in headlines]
             avg = sum(scores) / len(scores)
             emoji = "🟢" if avg > 0.05 else "🔴" if avg < -0.05 else "⚪"
             print(f"  {emoji} {query_name}: {avg:+.3f}")
-            for h in headlines[:3]:
-                s = _keyword_score(h)
+            for h, s in zip(headlines[:3], scores):
                 print(f"      [{s:+.2f}] {h[:80]}")
         else:
             print(f"  ⚪ {query_name}: no data")
@@ -55,28 +59,29 @@ def run_prep():
         elif score > 0.05:
             green.append(sector)
 
-    # 3. Count stocks per sector
+    # 3. Count stocks per sector (one pass over the universe, reused below)
     print("\n📋 UNIVERSE BY SECTOR")
-    from collections import Counter
-    sector_counts = Counter(info["sector"] for info in SECTOR_MAP.values())
-    for sector, count in sorted(sector_counts.items(), key=lambda x: -x[1]):
+    sector_to_syms = defaultdict(list)
+    for s, info in SECTOR_MAP.items():
+        sector_to_syms[info["sector"]].append(s)
+    for sector, stocks in sorted(sector_to_syms.items(), key=lambda x: -len(x[1])):
         status = "🔴 BLOCKED" if sector in blocked else "🟢 ACTIVE" if sector in green else "⚪ NEUTRAL"
-        print(f"  {sector:25s} {count:3d} stocks  {status}")
+        print(f"  {sector:25s} {len(stocks):3d} stocks  {status}")
 
     # 4. Summary
     print("\n" + "=" * 60)
-    total_stocks = len([s for s, info in SECTOR_MAP.items() if info["sector"] != "ETF"])
-    blocked_stocks = len([s for s, info in SECTOR_MAP.items() if info["sector"] in blocked])
-    print(f"UNIVERSE: {total_stocks} stocks across {len(sector_counts)} sectors")
+    total_stocks = len(SECTOR_MAP) - len(sector_to_syms.get("ETF", ()))
+    blocked_stocks = sum(len(sector_to_syms.get(b, ())) for b in blocked)
+    print(f"UNIVERSE: {total_stocks} stocks across {len(sector_to_syms)} sectors")
     print(f"BLOCKED SECTORS: {len(blocked)} ({blocked_stocks} stocks affected)")
     if blocked:
         for b in blocked:
-            stocks = [s for s, info in SECTOR_MAP.items() if info["sector"] == b]
+            stocks = sector_to_syms.get(b, [])
             print(f"  🔴 {b}: {', '.join(stocks)}")
     print(f"GREEN SECTORS: {len(green)}")
     if green:
         for g in green:
-            stocks = [s for s, info in SECTOR_MAP.items() if info["sector"] == g]
+            stocks = sector_to_syms.get(g, [])
             print(f"  🟢 {g}: {', '.join(stocks[:8])}{'...' if len(stocks) > 8 else ''}")
     print("=" * 60)
 
@@ -1,5 +1,7 @@
-import sqlite3
-db = sqlite3.connect('trading.db')
-print('Signals today:', db.execute("SELECT COUNT(*) FROM signals WHERE timestamp LIKE '2026-02-20%'").fetchone()[0])
-print('Trades today:', db.execute("SELECT COUNT(*) FROM trades WHERE timestamp LIKE '2026-02-20%'").fetchone()[0])
+from _db import open_db, day_bounds
+db = open_db('trading.db')
+db.execute("PRAGMA query_only=1")  # read-only check, safe alongside the live trader
+day = day_bounds('2026-02-20')
+print('Signals today:', db.execute("SELECT COUNT(*) FROM signals WHERE timestamp >= ? AND timestamp < ?", day).fetchone()[0])
+print('Trades today:', db.execute("SELECT COUNT(*) FROM trades WHERE timestamp >= ? AND timestamp < ?", day).fetchone()[0])
 print('Last signal:', db.execute("SELECT timestamp, symbol, side FROM signals ORDER BY timestamp DESC LIMIT 1").fetchone())
@@ -9,7 +9,9 @@ Output: configs/regime_state.json
 """
 from __future__ import annotations
 
+import hashlib
 import json
+import pickle
 import sys
 import os
 from datetime import datetime
@@ -23,12 +25,13 @@ sys.path.insert(0, str(PROJECT_ROOT / "src"))
 import numpy as np
 import yaml
 
-from trading_floor.data import YahooDataProvider
+from trading_floor.data import PriceCache
 from trading_floor.hmm import HMMRegimeDetector
 from trading_floor.regime import detect_regime
 
 ET = ZoneInfo("America/New_York")
 STATE_FILE = PROJECT_ROOT / "configs" / "regime_state.json"
+HMM_FIT_CACHE = PROJECT_ROOT / "cache" / "regime_hmm_fit.pkl"
 
 
 def load_config():
@@ -37,16 +40,45 @@ def load_config():
         return yaml.safe_load(f)
 
 
+def _fit_hmm(hmm: HMMRegimeDetector, obs: np.ndarray) -> None:
+    """
+    Baum-Welch on obs. The fit is deterministic, so when the observations
+    match the previous run's (market closed, no new bars) its parameters
+    are reused instead of re-running EM.
+    """
+    key = hashlib.sha1(f"{hmm.n_states}|{hmm.n_bins}|".encode() + obs.astype(np.int64).tobytes()).hexdigest()
+    try:
+        with open(HMM_FIT_CACHE, "rb") as f:
+            cached_key, params = pickle.load(f)
+        if cached_key == key:
+            hmm.pi, hmm.A, hmm.B = params
+            hmm._fitted = True
+            return
+    except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+        pass
+
+    hmm.fit(obs)
+    try:
+        HMM_FIT_CACHE.parent.mkdir(exist_ok=True)
+        tmp = HMM_FIT_CACHE.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump((key, (hmm.pi, hmm.A, hmm.B)), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, HMM_FIT_CACHE)
+    except OSError:
+        pass
+
+
 def run():
     cfg = load_config()
     now = datetime.now(ET)
 
-    # Fetch SPY + VIX data (lightweight, cached)
-    provider = YahooDataProvider(
+    # Fetch SPY + VIX data: completed days come from the on-disk bar cache,
+    # so each 5-minute run only downloads today's bars
+    data = PriceCache().get(
+        ["SPY", "^VIX", "BTC-USD"],
         interval=cfg.get("data", {}).get("interval", "5m"),
         lookback=cfg.get("data", {}).get("lookback", "5d"),
     )
-    data = provider.fetch(["SPY", "^VIX", "BTC-USD"])
 
     result = {
         "timestamp": now.isoformat(),
@@ -65,7 +97,7 @@ def run():
         spy_closes = spy_md.df["close"].dropna().values
         obs = hmm._discretize(spy_closes)
         if len(obs) > 10:
-            hmm.fit(obs)
+            _fit_hmm(hmm, obs)
         hmm_result = hmm.predict(observations=obs)
         result["hmm"] = {
             "state_label": hmm_result["state_label"],
@@ -84,8 +116,9 @@ def run():
     # --- Simple regime (SMA + VIX) ---
     vix_md = data.get("^VIX")
     if spy_md and vix_md:
-        spy_closes_list = spy_md.df["close"].dropna().tolist()
-        vix_closes_list = vix_md.df["close"].dropna().tolist()
+        # detect_regime reads only the 20-bar SMA window and the latest VIX
+        spy_closes_list = spy_md.df["close"].dropna().iloc[-20:].tolist()
+        vix_closes_list = vix_md.df["close"].dropna().iloc[-1:].tolist()
         simple = detect_regime(spy_closes_list, vix_closes_list)
         result["simple_regime"] = simple
     else:
@@ -94,7 +127,7 @@ def run():
     # --- BTC momentum (for crypto correlation) ---
     btc_md = data.get("BTC-USD")
     if btc_md is not None and not btc_md.df.empty:
-        btc_closes = btc_md.df["close"].dropna().values
+        btc_closes = btc_md.df["close"].dropna().iloc[-11:].to_numpy()
         if len(btc_closes) >= 11:
             momentum = float((btc_closes[-1] - btc_closes[-10]) / btc_closes[-10])
             result["btc"] = {
@@ -137,10 +170,12 @@ def run():
     else:
         result["regime_change"] = None
 
-    # Write state file
+    # Write state file: the trader reads it mid-session, so swap it in
+    # atomically rather than truncating and rewriting in place
     STATE_FILE.parent.mkdir(exist_ok=True)
-    with open(STATE_FILE, "w") as f:
-        json.dump(result, f, indent=2)
+    tmp = STATE_FILE.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(result, indent=2))
+    os.replace(tmp, STATE_FILE)
 
     # Print summary for cron output
     hmm_info = result.get("hmm")
@@ -1,17 +1,35 @@
-import io, sys, sqlite3
+import io, sys, json
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 sys.path.insert(0, 'src')
 
+import numpy as np
+import pandas as pd
+
 from trading_floor.sector_map import SECTOR_MAP
+from _db import open_db, day_bounds
+
+db = open_db('trading.db')
+db.execute("PRAGMA query_only=1")  # report only
 
-db = sqlite3.connect('trading.db')
+# symbol -> sector, flattened once per run
+SYM_TO_SECTOR = {sym: info.get('sector', '???') for sym, info in SECTOR_MAP.items()}
 
-# Feb 24 signals by sector
-rows = db.execute('''
-    SELECT symbol, score_mom, score_mean, score_break, score_news, final_score, timestamp
-    FROM signals WHERE date(timestamp) = '2026-02-24'
-    ORDER BY final_score DESC
-''').fetchall()
+# Feb 24 signals tagged with their sector; the lookup goes in as one JSON
+# parameter so grouping by sector happens in SQL
+DAY_SIGNALS = '''
+    WITH sm AS (SELECT key AS symbol, value AS sector FROM json_each(?)),
+    day AS (
+        SELECT s.*, COALESCE(sm.sector, '???') AS sector
+        FROM signals s LEFT JOIN sm USING (symbol)
+        WHERE s.timestamp >= ? AND s.timestamp < ?
+    )
+'''
+PARAMS = (json.dumps(SYM_TO_SECTOR), *day_bounds('2026-02-24'))
+
+rows = db.execute(DAY_SIGNALS + '''
+    SELECT sector, symbol, score_mom, score_mean, score_break, score_news, final_score, timestamp
+    FROM day ORDER BY final_score DESC
+''', PARAMS)
 
 print("Feb 24 Signals by Sector")
 print("=" * 85)
@@ -19,22 +37,16 @@ header = f"{'Sector':20s} {'Sym':6s} {'Mom':>7s} {'Mean':>7s} {'Break':>7s} {'Ne
 print(header)
 print("-" * 85)
 
-from collections import defaultdict
-sector_scores = defaultdict(list)
-
-for r in rows:
-    sym, mom, mean, brk, news, final, ts = r
-    sector = SECTOR_MAP.get(sym, {}).get('sector', '???')
-    sector_scores[sector].append(final)
+for sector, sym, mom, mean, brk, news, final, ts in rows:
     time_str = ts[11:16] if len(ts) > 16 else ts
     print(f"{sector:20s} {sym:6s} {mom:+.3f}  {mean:+.3f}  {brk:+.3f}  {news:+.3f}  {final:+.3f}  {time_str}")
 
 print()
 print("Sector Avg Scores:")
 print("=" * 40)
-for sector, scores in sorted(sector_scores.items(), key=lambda x: -sum(x[1])/len(x[1])):
-    avg = sum(scores) / len(scores)
-    n = len(scores)
+for sector, avg, n in db.execute(DAY_SIGNALS + '''
+    SELECT sector, AVG(final_score), COUNT(*) FROM day GROUP BY sector ORDER BY 2 DESC
+''', PARAMS):
     emoji = "UP" if avg > 0.05 else "DOWN" if avg < -0.05 else "FLAT"
     print(f"  {sector:20s} avg={avg:+.3f}  n={n:2d}  [{emoji}]")
 
@@ -42,40 +54,25 @@ for sector, scores in sorted(sector_scores.items(), key=lambda x: -sum(x[1])/len
 print()
 print("Cross-Sector Signal Correlation (same timestamp)")
 print("=" * 50)
-# Group by timestamp
-from collections import defaultdict
-ts_sectors = defaultdict(lambda: defaultdict(list))
-for r in rows:
-    sym, mom, mean, brk, news, final, ts = r
-    sector = SECTOR_MAP.get(sym, {}).get('sector', '???')
-    ts_sectors[ts[:16]][sector].append(final)
+# Per-minute sector means pivoted to a (minute, sector) frame; a sector
+# with no signal that minute counts as 0
+ts_means = pd.read_sql_query(DAY_SIGNALS + '''
+    SELECT substr(timestamp, 1, 16) AS ts, sector, AVG(final_score) AS avg FROM day GROUP BY 1, 2
+''', db, params=PARAMS)
+sector_ts = ts_means.pivot(index='ts', columns='sector', values='avg').fillna(0)
 
 # Check if sectors move together
-timestamps = sorted(ts_sectors.keys())
-if len(timestamps) >= 2:
-    sector_names = sorted(set(s for ts_data in ts_sectors.values() for s in ts_data.keys()))
-    # Build per-timestamp avg by sector
-    sector_ts = {s: [] for s in sector_names}
-    for ts in timestamps:
-        for s in sector_names:
-            vals = ts_sectors[ts].get(s, [])
-            sector_ts[s].append(sum(vals)/len(vals) if vals else 0)
-    
-    # Simple correlation pairs
-    import numpy as np
+if len(sector_ts) >= 2:
+    sector_names = list(sector_ts.columns)
+    # All pairwise correlations at once; flat sectors come back as NaN
+    corr_matrix = sector_ts.corr().to_numpy()
     print(f"\nSector pairs with |corr| > 0.5:")
     pairs_found = False
-    for i, s1 in enumerate(sector_names):
-        for s2 in sector_names[i+1:]:
-            a = np.array(sector_ts[s1])
-            b = np.array(sector_ts[s2])
-            if np.std(a) == 0 or np.std(b) == 0:
-                continue
-            corr = float(np.corrcoef(a, b)[0, 1])
-            if abs(corr) > 0.5:
-                direction = "same direction" if corr > 0 else "OPPOSITE"
-                print(f"  {s1:20s} <-> {s2:20s}  corr={corr:+.2f}  [{direction}]")
-                pairs_found = True
+    for i, j in zip(*np.nonzero(np.triu(np.abs(corr_matrix) > 0.5, k=1))):
+        corr = float(corr_matrix[i, j])
+        direction = "same direction" if corr > 0 else "OPPOSITE"
+        print(f"  {sector_names[i]:20s} <-> {sector_names[j]:20s}  corr={corr:+.2f}  [{direction}]")
+        pairs_found = True
     if not pairs_found:
         print("  (none found with single day data)")
 
@@ -83,14 +80,12 @@ if len(timestamps) >= 2:
 print()
 print("Strong Short Candidates (final < -0.10):")
 print("=" * 50)
-short_rows = db.execute('''
-    SELECT symbol, final_score, score_mom, score_news, timestamp
-    FROM signals WHERE date(timestamp) = '2026-02-24' AND final_score < -0.10
+short_rows = db.execute(DAY_SIGNALS + '''
+    SELECT sector, symbol, final_score, score_mom, score_news, timestamp
+    FROM day WHERE final_score < -0.10
     ORDER BY final_score
-''').fetchall()
-for r in short_rows:
-    sym, final, mom, news, ts = r
-    sector = SECTOR_MAP.get(sym, {}).get('sector', '???')
+''', PARAMS).fetchall()
+for sector, sym, final, mom, news, ts in short_rows:
     print(f"  {ts[11:16]} {sym:6s} {sector:20s} final={final:+.3f} mom={mom:+.3f} news={news:+.3f}")
 if not short_rows:
     print("  (none)")
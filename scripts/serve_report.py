@@ -1,12 +1,13 @@
+import atexit
 import http.server
 import os
-import socketserver
 import subprocess
 import threading
 import time
+from collections import deque
 from pathlib import Path
 
-from generate_report import main as generate
+from generate_report import EVENTS, TRADES, main as generate
 
 ROOT = Path(__file__).resolve().parents[1]
 WEB = ROOT / "web"
@@ -15,14 +16,54 @@ LOGS_DIR = ROOT / "logs" / "watchdog"
 PORT = 8000
 REFRESH_SECONDS = 30
 LOG_TAIL_LINES = 200
+# generate_report reads only these (the CSVs and TradeLogger's snapshots)
+REPORT_INPUTS = [EVENTS, TRADES, EVENTS.with_suffix(".last.json"), TRADES.with_suffix(".last.json")]
 
 
-def tail_lines(path: Path, max_lines: int) -> list[str]:
+# Files the refresher rewrites; their bytes are kept in memory for the handler
+CACHED_FILES = ["report.json", "logs.txt"]
+_cache: dict[str, tuple] = {}  # URL path -> (file_stamp, bytes)
+
+
+def file_stamp(paths) -> tuple:
+    """(mtime_ns, size) per path, None for missing files; changes whenever any of them is written."""
+    stamp = []
+    for path in paths:
+        try:
+            st = path.stat()
+            stamp.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            stamp.append(None)
+    return tuple(stamp)
+
+
+def tail_lines(path: Path, max_lines: int, chunk: int = 64 * 1024) -> list[str]:
+    """
+    Last max_lines lines of a log, as readlines() would return them, reading
+    only a window at the end of the file. The window starts at 64 KiB and
+    doubles until it holds enough complete lines (or reaches the start).
+    """
     if not path.exists():
         return []
-    with path.open("r", encoding="utf-8", errors="replace") as f:
-        lines = f.readlines()
-    return lines[-max_lines:]
+    with path.open("rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        window = chunk
+        while True:
+            start = max(0, size - window)
+            f.seek(start)
+            # Same newline translation as text mode
+            text = f.read().decode("utf-8", errors="replace").replace("\r\n", "\n").replace("\r", "\n")
+            lines = text.split("\n")
+            last = lines.pop()
+            lines = [line + "\n" for line in lines]
+            if last:
+                lines.append(last)
+            if start == 0:
+                return lines[-max_lines:]
+            # The first line of the window may be cut off
+            if len(lines) > max_lines:
+                return lines[-max_lines:]
+            window *= 2
 
 
 def read_openclaw_logs(max_lines: int) -> list[str]:
@@ -42,6 +83,47 @@ def read_openclaw_logs(max_lines: int) -> list[str]:
         return [f"(openclaw logs unavailable: {e})\n"]
 
 
+# Newest lines of one long-running `openclaw logs --follow`, filled by a reader thread
+_openclaw_lines = deque(maxlen=LOG_TAIL_LINES)
+_openclaw_lock = threading.Lock()
+_openclaw_proc = None
+
+
+def follow_openclaw_logs():
+    """Start streaming openclaw logs into _openclaw_lines instead of re-running the CLI each refresh."""
+    global _openclaw_proc
+    try:
+        proc = subprocess.Popen(
+            ["openclaw", "logs", "--follow", "--limit", str(LOG_TAIL_LINES), "--plain"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            bufsize=1,
+        )
+    except OSError:
+        return
+
+    def reader():
+        for line in proc.stdout:
+            with _openclaw_lock:
+                _openclaw_lines.append(line)
+
+    threading.Thread(target=reader, daemon=True).start()
+    atexit.register(proc.terminate)
+    _openclaw_proc = proc
+
+
+def openclaw_log_lines() -> list[str]:
+    # Falls back to a one-shot read when the follower is not running
+    if _openclaw_proc is None or _openclaw_proc.poll() is not None:
+        return read_openclaw_logs(LOG_TAIL_LINES)
+    with _openclaw_lock:
+        lines = list(_openclaw_lines)
+    return lines or ["(no openclaw logs)\n"]
+
+
 def write_combined_logs():
     sections = [
         ("report", LOGS_DIR / "report.log"),
@@ -55,25 +137,85 @@ def write_combined_logs():
         parts.append("\n")
 
     parts.append("===== openclaw (gateway logs) =====\n")
-    parts.extend(read_openclaw_logs(LOG_TAIL_LINES))
+    parts.extend(openclaw_log_lines())
     parts.append("\n")
 
-    (WEB / "logs.txt").write_text("".join(parts), encoding="utf-8")
+    out = WEB / "logs.txt"
+    text = "".join(parts)
+    try:
+        if out.read_text(encoding="utf-8") == text:
+            return
+    except OSError:
+        pass
+    # Atomic swap, as generate_report does for report.json
+    tmp = out.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, out)
+
+
+def refresh_cache():
+    """Re-read the cached files that changed on disk since they were last loaded."""
+    for name in CACHED_FILES:
+        path = WEB / name
+        stamp = file_stamp([path])
+        key = "/" + name
+        cached = _cache.get(key)
+        if cached is not None and cached[0] == stamp:
+            continue
+        try:
+            _cache[key] = (stamp, path.read_bytes())
+        except OSError:
+            _cache.pop(key, None)
 
 
 def refresher():
+    # Rebuild report.json only when its inputs change. logs.txt is rebuilt
+    # every tick from the log tails (and rewritten only if it differs).
+    last_stamp = None
     while True:
         try:
-            generate()
+            stamp = file_stamp(REPORT_INPUTS)
+            if stamp != last_stamp:
+                generate()
+                last_stamp = stamp
             write_combined_logs()
+            refresh_cache()
         except Exception as e:
             print(f"[report] generate error: {e}")
         time.sleep(REFRESH_SECONDS)
 
 
+class SendfileHandler(http.server.SimpleHTTPRequestHandler):
+    """
+    Static handler that serves the refresher's files from memory and hands
+    other file bodies to the kernel with sendfile(2).
+    """
+
+    def do_GET(self):
+        cached = _cache.get(self.path.split("?", 1)[0])
+        if cached is None:
+            return super().do_GET()
+        data = cached[1]
+        self.send_response(200)
+        self.send_header("Content-Type", self.guess_type(self.path.split("?", 1)[0]))
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def copyfile(self, source, outputfile):
+        try:
+            source.fileno()
+        except (AttributeError, OSError):
+            return super().copyfile(source, outputfile)
+        # Page cache straight to the socket; socket.sendfile falls back to
+        # plain send() where os.sendfile is unavailable
+        outputfile.flush()
+        self.connection.sendfile(source)
+
+
 def run_server():
-    handler = http.server.SimpleHTTPRequestHandler
-    with socketserver.TCPServer(("", PORT), handler) as httpd:
+    # One thread per request, so a slow client cannot stall the others
+    with http.server.ThreadingHTTPServer(("", PORT), SendfileHandler) as httpd:
         print(f"Serving on http://localhost:{PORT}")
         httpd.serve_forever()
 
@@ -85,11 +227,12 @@ def main():
         WEB.mkdir(parents=True, exist_ok=True)
         # initial generate
         generate()
+        refresh_cache()
+        follow_openclaw_logs()
         # start refresher thread
         t = threading.Thread(target=refresher, daemon=True)
         t.start()
         # serve from web dir
-        import os
         os.chdir(str(WEB))
         run_server()
     finally:
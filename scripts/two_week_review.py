@@ -1,20 +1,27 @@
-import sqlite3, json
-conn = sqlite3.connect('trading.db')
-post_fix = conn.execute("SELECT symbol, side, quantity, price, pnl FROM trades WHERE timestamp >= '2026-02-20' AND pnl != 0").fetchall()
-wins = [t for t in post_fix if t[4] > 0]
-losses = [t for t in post_fix if t[4] < 0]
-avg_win = sum(t[4] for t in wins) / len(wins)
-avg_loss = sum(t[4] for t in losses) / len(losses)
-total_win = sum(t[4] for t in wins)
-total_loss = sum(abs(t[4]) for t in losses)
+import json
+from _db import open_db
+
+conn = open_db('trading.db')
+conn.execute("PRAGMA query_only=1")  # report only
+# Every post-fix figure in one pass over the closed trades
+(n, n_wins, n_losses, total_win, total_loss, net, max_win, max_loss) = conn.execute("""
+    SELECT COUNT(*),
+           SUM(CASE WHEN pnl > 0 THEN 1 ELSE 0 END),
+           SUM(CASE WHEN pnl < 0 THEN 1 ELSE 0 END),
+           SUM(CASE WHEN pnl > 0 THEN pnl ELSE 0 END),
+           SUM(CASE WHEN pnl < 0 THEN -pnl ELSE 0 END),
+           SUM(pnl), MAX(pnl), MIN(pnl)
+    FROM trades WHERE timestamp >= '2026-02-20' AND pnl != 0
+""").fetchone()
+avg_win = total_win / n_wins
+avg_loss = -total_loss / n_losses
 pf = total_win / total_loss
-net = sum(t[4] for t in post_fix)
-exp = net / len(post_fix)
+exp = net / n
 print("POST-FIX (Feb 20-25):")
-print(f"Trades: {len(post_fix)} | Wins: {len(wins)} | Losses: {len(losses)} | Win Rate: {len(wins)*100/len(post_fix):.0f}%")
+print(f"Trades: {n} | Wins: {n_wins} | Losses: {n_losses} | Win Rate: {n_wins*100/n:.0f}%")
 print(f"Avg Win: +${avg_win:.2f} | Avg Loss: ${avg_loss:.2f} | Ratio: {abs(avg_win/avg_loss):.2f}x")
 print(f"Profit Factor: {pf:.2f} | Net: ${net:+.2f} | Expectancy: ${exp:+.2f}/trade")
-print(f"Max Win: +${max(t[4] for t in wins):.2f} | Max Loss: ${min(t[4] for t in losses):.2f}")
+print(f"Max Win: +${max_win:.2f} | Max Loss: ${max_loss:.2f}")
 p = json.load(open("portfolio.json"))
 print(f"Equity: ${p['equity']:.2f} | From $5000: ${p['equity']-5000:+.2f} ({(p['equity']-5000)/5000*100:+.1f}%)")
 print(f"Open positions: {len(p.get('positions', {}))}")
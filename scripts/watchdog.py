@@ -4,6 +4,8 @@ import time
 import json
 import signal
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
 from urllib.request import urlopen
 from urllib.error import URLError
@@ -75,6 +77,12 @@ class Managed:
         return self.proc is not None and self.proc.poll() is None
 
 
+def restart(svc: Managed):
+    svc.stop()
+    time.sleep(RESTART_GRACE)
+    svc.start()
+
+
 def healthy(url: str) -> bool:
     try:
         with urlopen(url, timeout=HEALTH_TIMEOUT) as resp:
@@ -90,32 +98,57 @@ def write_state(state: dict):
 def main():
     managed = {key: Managed(spec) for key, spec in SERVICES.items()}
 
+    # SIGTERM/Ctrl-C (Ctrl-Break on Windows) end the loop at once instead of
+    # waiting for the next STOP_FILE check
+    stop = threading.Event()
+    for name in ("SIGTERM", "SIGINT", "SIGBREAK"):
+        if hasattr(signal, name):
+            signal.signal(getattr(signal, name), lambda signum, frame: stop.set())
+
     for svc in managed.values():
         svc.start()
         time.sleep(1)
 
-    while True:
-        if STOP_FILE.exists():
-            for svc in managed.values():
-                svc.stop()
-            break
-
-        state = {"services": {}, "timestamp": time.time()}
-        for key, svc in managed.items():
-            spec = svc.spec
-            ok = svc.running() and healthy(spec["url"])
-            if not ok:
-                svc.stop()
-                time.sleep(RESTART_GRACE)
-                svc.start()
-            state["services"][key] = {
-                "running": svc.running(),
-                "url": spec["url"],
-                "last_start": svc.last_start,
-            }
-
-        write_state(state)
-        time.sleep(CHECK_INTERVAL)
+    # Probes and restarts run on worker threads, so a tick waits for the
+    # slowest probe and never for a restart's grace period. A service is
+    # either being probed or being restarted, so one worker each is enough.
+    probe = lambda svc: svc.running() and healthy(svc.spec["url"])
+    restarting = {}  # key -> Future of an in-flight restart
+    with ThreadPoolExecutor(max_workers=len(managed)) as pool:
+        while True:
+            if stop.is_set() or STOP_FILE.exists():
+                # Let in-flight restarts finish so nothing starts after the stop
+                wait(restarting.values())
+                for svc in managed.values():
+                    svc.stop()
+                break
+
+            idle = []
+            for key, svc in managed.items():
+                future = restarting.get(key)
+                if future is not None:
+                    if not future.done():
+                        continue
+                    del restarting[key]
+                    # A restart that raised (bad command, missing binary) is
+                    # reported here; the next probe retries it
+                    if future.exception() is not None:
+                        print(f"[watchdog] restart of {key} failed: {future.exception()}", flush=True)
+                idle.append((key, svc))
+            for (key, svc), ok in zip(idle, pool.map(probe, [svc for _, svc in idle])):
+                if not ok:
+                    restarting[key] = pool.submit(restart, svc)
+
+            state = {"services": {}, "timestamp": time.time()}
+            for key, svc in managed.items():
+                state["services"][key] = {
+                    "running": svc.running(),
+                    "url": svc.spec["url"],
+                    "last_start": svc.last_start,
+                }
+
+            write_state(state)
+            stop.wait(CHECK_INTERVAL)
 
 
 if __name__ == "__main__":
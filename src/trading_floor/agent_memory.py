@@ -3,10 +3,13 @@ from __future__ import annotations
 
 import logging
 import math
+import atexit
 import sqlite3
+import threading
+import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
 
 logger = logging.getLogger(__name__)
 
@@ -19,82 +22,234 @@ _DEFAULT_CONFIG = {
     "underperform_threshold": 0.10,
     "decay_halflife_days": 14,
     "regime_matching": True,
+    # record() buffers observations; they are written in one transaction once
+    # this many are pending or this many seconds passed since the last write
+    "flush_rows": 50,
+    "flush_seconds": 5.0,
 }
 
+# This connection checkpoints its own WAL writes in batches (see _flush)
+_CHECKPOINT_ROWS = 1000
+_CHECKPOINT_SECONDS = 60.0
+
+_INSERT_SQL = """INSERT INTO agent_memory
+   (agent_name, symbol, signal_type, signal_value, outcome, pnl,
+    regime_spy, regime_vix, regime_label, confidence,
+    memory_influenced, timestamp)
+   VALUES (?,?,?,?,?,?,?,?,?,?,?,?)"""
+
+_OUTCOME = 4  # position of outcome in an _INSERT_SQL row
+
+_PRUNE_AGE_SQL = "DELETE FROM agent_memory WHERE agent_name=? AND timestamp < ?"
+
+# The subquery selects just the rows past the window, so the DELETE touches
+# only those; id breaks timestamp ties in favour of the newest insert
+_PRUNE_WINDOW_SQL = """DELETE FROM agent_memory WHERE id IN (
+    SELECT id FROM agent_memory WHERE agent_name=?
+    ORDER BY timestamp DESC, id DESC LIMIT -1 OFFSET ?
+)"""
+
+
+# Optional filters only switch clauses on or off, so each query has a handful
+# of exact texts; building them once keeps the text identical between calls
+# and sqlite3's per-connection statement cache reuses the prepared statement.
+@lru_cache(maxsize=None)
+def _recall_sql(by_symbol: bool, by_regime: bool) -> str:
+    return (
+        "SELECT * FROM agent_memory WHERE agent_name = ?"
+        + (" AND symbol = ?" if by_symbol else "")
+        + (" AND regime_label = ?" if by_regime else "")
+        + " ORDER BY timestamp DESC LIMIT ?"
+    )
+
+
+@lru_cache(maxsize=None)
+def _accuracy_sql(by_signal_type: bool, by_regime: bool) -> str:
+    # One aggregate row: age in days from julianday (unparseable or future
+    # timestamps count as age 0), weighted by decay() in the same pass
+    return (
+        """SELECT COUNT(*), SUM(w), SUM(CASE WHEN outcome = 'win' THEN w ELSE 0 END),
+                  SUM(COALESCE(pnl, 0) * w)
+           FROM (SELECT outcome, pnl,
+                        decay(COALESCE(MAX(julianday('now') - julianday(timestamp), 0), 0), ?) AS w
+                 FROM agent_memory WHERE agent_name = ? AND outcome IN ('win','loss')"""
+        + (" AND signal_type = ?" if by_signal_type else "")
+        + (" AND regime_label = ?" if by_regime else "")
+        + ")"
+    )
+
+
+@lru_cache(maxsize=4096)
+def _parse_ts(ts: str) -> datetime:
+    # Signals land on the same minute in bursts, so recall() sees the same
+    # timestamp text many times over
+    return datetime.fromisoformat(ts)
+
+
+def _decay(age_days: float, halflife: float) -> float:
+    """Exponential-decay weight of an observation age_days old."""
+    return 2 ** (-age_days / halflife)
 
-class AgentMemory:
-    """Persistent per-agent memory with safety guardrails."""
 
-    def __init__(self, agent_name: str, db_path: str, config: dict | None = None):
+class AgentMemory:
+    """
+    Persistent per-agent memory with safety guardrails.
+
+    One connection is held for the instance's lifetime and shared by the
+    signal-scoring threads, so every use goes through self._lock.
+    Observations from record() are buffered and written in batches. Reads
+    flush the buffer first, except the win/loss aggregates while everything
+    buffered is still pending; flush() runs at interpreter exit.
+    Pass conn= to reuse a caller's connection instead; it is not
+    reconfigured, checkpointed or closed here.
+    """
+
+    def __init__(
+        self,
+        agent_name: str,
+        db_path: str,
+        config: dict | None = None,
+        conn: sqlite3.Connection | None = None,
+    ):
         self.agent_name = agent_name
         self.db_path = Path(db_path)
         self.cfg = {**_DEFAULT_CONFIG, **(config or {})}
         self._disabled = False
+        self._lock = threading.Lock()
+        self._owns_conn = conn is None
+        self._db = self._connect() if conn is None else self._adopt(conn)
         self._ensure_table()
+        self._pending: list[tuple] = []
+        self._last_flush = time.monotonic()
+        self._unchecked_rows = 0
+        self._last_checkpoint = time.monotonic()
+        atexit.register(self.flush)
 
     # ------------------------------------------------------------------
     # DB helpers
     # ------------------------------------------------------------------
-    def _conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
         conn.row_factory = sqlite3.Row
+        conn.create_function("decay", 2, _decay, deterministic=True)
+        conn.execute("PRAGMA journal_mode=WAL")
+        # WAL makes NORMAL sync safe: fsync per checkpoint, not per commit
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA wal_autocheckpoint=0")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")  # 64 MiB page cache
+        conn.execute("PRAGMA mmap_size=268435456")
+        return conn
+
+    @staticmethod
+    def _adopt(conn: sqlite3.Connection) -> sqlite3.Connection:
+        # A borrowed connection keeps its owner's pragmas and row_factory; it
+        # only gains the SQL function the accuracy query relies on
+        conn.create_function("decay", 2, _decay, deterministic=True)
         return conn
 
+    def _query(self, sql: str, params=()) -> sqlite3.Cursor:
+        # Rows are set per cursor so the connection's own factory is untouched
+        cur = self._db.cursor()
+        cur.row_factory = sqlite3.Row
+        return cur.execute(sql, params)
+
+    def flush(self):
+        """Write any buffered observations now."""
+        with self._lock:
+            self._flush()
+
+    def close(self):
+        atexit.unregister(self.flush)
+        with self._lock:
+            self._flush()
+            if self._owns_conn:
+                self._checkpoint()
+                self._db.close()
+
+    def _flush(self):
+        # Caller holds self._lock. Insert and prune land in one transaction;
+        # on error it rolls back and the rows stay pending for the next flush
+        self._last_flush = time.monotonic()
+        if not self._pending:
+            return
+        with self._db:
+            self._db.executemany(_INSERT_SQL, self._pending)
+            self._prune()
+        self._unchecked_rows += len(self._pending)
+        self._pending.clear()
+        # Checkpointing is left to the owner of a borrowed connection
+        if self._owns_conn and (self._unchecked_rows >= _CHECKPOINT_ROWS
+                or time.monotonic() - self._last_checkpoint >= _CHECKPOINT_SECONDS):
+            self._checkpoint("PASSIVE")
+
+    def _flush_scored(self):
+        # Caller holds self._lock. The accuracy reads only count win/loss
+        # rows, so while every buffered observation is still pending they
+        # can read the table as-is and leave the batch to fill up
+        if any(row[_OUTCOME] != "pending" for row in self._pending):
+            self._flush()
+
+    def _checkpoint(self, mode: str = "TRUNCATE"):
+        # Caller holds self._lock. The periodic one is PASSIVE: it copies
+        # what it can without waiting on readers (the rest goes next time),
+        # so an open report query never stalls record(). close() uses
+        # TRUNCATE to also reset the WAL file
+        self._db.execute(f"PRAGMA wal_checkpoint({mode})").fetchone()
+        self._unchecked_rows = 0
+        self._last_checkpoint = time.monotonic()
+
     def _ensure_table(self):
-        conn = self._conn()
-        conn.executescript("""
-            CREATE TABLE IF NOT EXISTS agent_memory (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                agent_name TEXT NOT NULL,
-                symbol TEXT,
-                signal_type TEXT,
-                signal_value REAL,
-                outcome TEXT,
-                pnl REAL DEFAULT 0,
-                regime_spy TEXT,
-                regime_vix TEXT,
-                regime_label TEXT,
-                confidence REAL,
-                memory_influenced BOOLEAN DEFAULT 0,
-                timestamp TEXT NOT NULL,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP
-            );
-            CREATE INDEX IF NOT EXISTS idx_agent_memory_agent ON agent_memory(agent_name);
-            CREATE INDEX IF NOT EXISTS idx_agent_memory_regime ON agent_memory(regime_label);
-            CREATE INDEX IF NOT EXISTS idx_agent_memory_timestamp ON agent_memory(timestamp);
-        """)
-        conn.close()
+        with self._lock:
+            self._db.executescript("""
+                CREATE TABLE IF NOT EXISTS agent_memory (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    agent_name TEXT NOT NULL,
+                    symbol TEXT,
+                    signal_type TEXT,
+                    signal_value REAL,
+                    outcome TEXT,
+                    pnl REAL DEFAULT 0,
+                    regime_spy TEXT,
+                    regime_vix TEXT,
+                    regime_label TEXT,
+                    confidence REAL,
+                    memory_influenced BOOLEAN DEFAULT 0,
+                    timestamp TEXT NOT NULL,
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+                );
+                CREATE INDEX IF NOT EXISTS idx_agent_memory_agent ON agent_memory(agent_name);
+                CREATE INDEX IF NOT EXISTS idx_agent_memory_regime ON agent_memory(regime_label);
+                CREATE INDEX IF NOT EXISTS idx_agent_memory_timestamp ON agent_memory(timestamp);
+                -- Covering indexes for the accuracy and memory-vs-default aggregates
+                CREATE INDEX IF NOT EXISTS idx_agent_memory_outcome ON agent_memory(agent_name, outcome, timestamp, pnl);
+                CREATE INDEX IF NOT EXISTS idx_agent_memory_influenced ON agent_memory(agent_name, memory_influenced, outcome, pnl);
+            """)
 
     # ------------------------------------------------------------------
     # Core API
     # ------------------------------------------------------------------
     def record(self, observation: dict, regime: dict):
-        """Store an observation tagged with current market regime and prune."""
-        conn = self._conn()
-        conn.execute(
-            """INSERT INTO agent_memory
-               (agent_name, symbol, signal_type, signal_value, outcome, pnl,
-                regime_spy, regime_vix, regime_label, confidence,
-                memory_influenced, timestamp)
-               VALUES (?,?,?,?,?,?,?,?,?,?,?,?)""",
-            (
-                self.agent_name,
-                observation.get("symbol"),
-                observation.get("signal"),
-                observation.get("signal_value"),
-                observation.get("outcome", "pending"),
-                observation.get("pnl", 0.0),
-                regime.get("spy_trend"),
-                regime.get("vix_level"),
-                regime.get("label"),
-                observation.get("confidence"),
-                1 if observation.get("memory_influenced") else 0,
-                observation.get("timestamp", datetime.utcnow().isoformat()),
-            ),
+        """Queue an observation tagged with current market regime; written (and pruned) on flush."""
+        row = (
+            self.agent_name,
+            observation.get("symbol"),
+            observation.get("signal"),
+            observation.get("signal_value"),
+            observation.get("outcome", "pending"),
+            observation.get("pnl", 0.0),
+            regime.get("spy_trend"),
+            regime.get("vix_level"),
+            regime.get("label"),
+            observation.get("confidence"),
+            1 if observation.get("memory_influenced") else 0,
+            observation.get("timestamp", datetime.utcnow().isoformat()),
         )
-        conn.commit()
-        conn.close()
-        self.prune()
+        with self._lock:
+            self._pending.append(row)
+            if (len(self._pending) >= self.cfg["flush_rows"]
+                    or time.monotonic() - self._last_flush >= self.cfg["flush_seconds"]):
+                self._flush()
 
     def recall(
         self,
@@ -104,26 +259,13 @@ class AgentMemory:
     ) -> list[dict]:
         """Retrieve recent observations with exponential-decay weights."""
         limit = limit or self.cfg["rolling_window"]
-        clauses = ["agent_name = ?"]
-        params: list[Any] = [self.agent_name]
-
-        if symbol:
-            clauses.append("symbol = ?")
-            params.append(symbol)
-        if regime and self.cfg["regime_matching"]:
-            if regime.get("label"):
-                clauses.append("regime_label = ?")
-                params.append(regime["label"])
-
-        sql = (
-            f"SELECT * FROM agent_memory WHERE {' AND '.join(clauses)} "
-            f"ORDER BY timestamp DESC LIMIT ?"
-        )
-        params.append(limit)
+        label = regime.get("label") if regime and self.cfg["regime_matching"] else None
+        sql = _recall_sql(bool(symbol), bool(label))
+        params = [self.agent_name, *([symbol] if symbol else []), *([label] if label else []), limit]
 
-        conn = self._conn()
-        rows = conn.execute(sql, params).fetchall()
-        conn.close()
+        with self._lock:
+            self._flush()
+            rows = self._query(sql, params).fetchall()
 
         now = datetime.utcnow()
         halflife = self.cfg["decay_halflife_days"]
@@ -131,7 +273,7 @@ class AgentMemory:
         for r in rows:
             d = dict(r)
             try:
-                ts = datetime.fromisoformat(d["timestamp"])
+                ts = _parse_ts(d["timestamp"])
                 age_days = max((now - ts).total_seconds() / 86400, 0)
             except Exception:
                 age_days = 0
@@ -143,53 +285,28 @@ class AgentMemory:
         self, signal_type: str | None = None, regime: dict | None = None
     ) -> dict | None:
         """Win rate and avg PnL. Returns None if sample_size < min_samples."""
-        clauses = ["agent_name = ?", "outcome IN ('win','loss')"]
-        params: list[Any] = [self.agent_name]
-
-        if signal_type:
-            clauses.append("signal_type = ?")
-            params.append(signal_type)
-        if regime and self.cfg["regime_matching"]:
-            if regime.get("label"):
-                clauses.append("regime_label = ?")
-                params.append(regime["label"])
-
-        conn = self._conn()
-        rows = conn.execute(
-            f"SELECT * FROM agent_memory WHERE {' AND '.join(clauses)} "
-            "ORDER BY timestamp DESC",
-            params,
-        ).fetchall()
-        conn.close()
-
-        if len(rows) < self.cfg["min_samples"]:
+        label = regime.get("label") if regime and self.cfg["regime_matching"] else None
+        params = [
+            self.cfg["decay_halflife_days"], self.agent_name,
+            *([signal_type] if signal_type else []), *([label] if label else []),
+        ]
+
+        with self._lock:
+            self._flush_scored()
+            sample_size, total_w, win_w, pnl_weighted = self._query(
+                _accuracy_sql(bool(signal_type), bool(label)), params,
+            ).fetchone()
+
+        if sample_size < self.cfg["min_samples"]:
             return None
 
-        now = datetime.utcnow()
-        halflife = self.cfg["decay_halflife_days"]
-        total_w = 0.0
-        win_w = 0.0
-        pnl_weighted = 0.0
-
-        for r in rows:
-            try:
-                ts = datetime.fromisoformat(r["timestamp"])
-                age = max((now - ts).total_seconds() / 86400, 0)
-            except Exception:
-                age = 0
-            w = 2 ** (-age / halflife)
-            total_w += w
-            if r["outcome"] == "win":
-                win_w += w
-            pnl_weighted += (r["pnl"] or 0) * w
-
         win_rate = win_w / total_w if total_w else 0
         avg_pnl = pnl_weighted / total_w if total_w else 0
 
         return {
             "win_rate": round(win_rate, 4),
             "avg_pnl": round(avg_pnl, 4),
-            "sample_size": len(rows),
+            "sample_size": sample_size,
         }
 
     def suggest_weight_adjustment(self, current_weight: float) -> dict | None:
@@ -206,22 +323,22 @@ class AgentMemory:
         if accuracy is None:
             return None
 
-        # Compare memory-influenced vs default trades
-        conn = self._conn()
-        mem_rows = conn.execute(
-            "SELECT pnl FROM agent_memory WHERE agent_name=? AND memory_influenced=1 AND outcome IN ('win','loss')",
-            (self.agent_name,),
-        ).fetchall()
-        def_rows = conn.execute(
-            "SELECT pnl FROM agent_memory WHERE agent_name=? AND memory_influenced=0 AND outcome IN ('win','loss')",
-            (self.agent_name,),
-        ).fetchall()
-        conn.close()
+        # Compare memory-influenced vs default trades: (count, avg PnL) per flag
+        with self._lock:
+            self._flush_scored()
+            groups = {
+                flag: (n, avg_pnl)
+                for flag, n, avg_pnl in self._query(
+                    "SELECT memory_influenced, COUNT(*), AVG(COALESCE(pnl, 0)) FROM agent_memory "
+                    "WHERE agent_name=? AND outcome IN ('win','loss') GROUP BY memory_influenced",
+                    (self.agent_name,),
+                )
+            }
+        mem_n, mem_avg = groups.get(1, (0, 0.0))
+        def_n, def_avg = groups.get(0, (0, 0.0))
 
         # Auto-disable check
-        if len(mem_rows) >= self.cfg["min_samples"] and len(def_rows) >= self.cfg["min_samples"]:
-            mem_avg = sum(r["pnl"] or 0 for r in mem_rows) / len(mem_rows)
-            def_avg = sum(r["pnl"] or 0 for r in def_rows) / len(def_rows)
+        if mem_n >= self.cfg["min_samples"] and def_n >= self.cfg["min_samples"]:
             if def_avg > 0 and (def_avg - mem_avg) / abs(def_avg) > self.cfg["underperform_threshold"]:
                 self._disabled = True
                 logger.warning(
@@ -248,30 +365,29 @@ class AgentMemory:
 
     def get_stats(self) -> dict:
         """Return memory stats for auditing."""
-        conn = self._conn()
-        total = conn.execute(
-            "SELECT COUNT(*) FROM agent_memory WHERE agent_name=?",
-            (self.agent_name,),
-        ).fetchone()[0]
-
-        regime_dist = conn.execute(
-            "SELECT regime_label, COUNT(*) as cnt FROM agent_memory "
-            "WHERE agent_name=? GROUP BY regime_label",
-            (self.agent_name,),
-        ).fetchall()
-
-        outcomes = conn.execute(
-            "SELECT outcome, COUNT(*) as cnt, AVG(pnl) as avg_pnl FROM agent_memory "
-            "WHERE agent_name=? GROUP BY outcome",
-            (self.agent_name,),
-        ).fetchall()
-
-        mem_influenced = conn.execute(
-            "SELECT COUNT(*) FROM agent_memory WHERE agent_name=? AND memory_influenced=1",
-            (self.agent_name,),
-        ).fetchone()[0]
-
-        conn.close()
+        with self._lock:
+            self._flush()
+            total = self._query(
+                "SELECT COUNT(*) FROM agent_memory WHERE agent_name=?",
+                (self.agent_name,),
+            ).fetchone()[0]
+
+            regime_dist = self._query(
+                "SELECT regime_label, COUNT(*) as cnt FROM agent_memory "
+                "WHERE agent_name=? GROUP BY regime_label",
+                (self.agent_name,),
+            ).fetchall()
+
+            outcomes = self._query(
+                "SELECT outcome, COUNT(*) as cnt, AVG(pnl) as avg_pnl FROM agent_memory "
+                "WHERE agent_name=? GROUP BY outcome",
+                (self.agent_name,),
+            ).fetchall()
+
+            mem_influenced = self._query(
+                "SELECT COUNT(*) FROM agent_memory WHERE agent_name=? AND memory_influenced=1",
+                (self.agent_name,),
+            ).fetchone()[0]
 
         return {
             "agent": self.agent_name,
@@ -287,22 +403,15 @@ class AgentMemory:
 
     def prune(self):
         """Remove old observations and enforce rolling window."""
-        conn = self._conn()
+        with self._lock:
+            self._flush()
+            with self._db:
+                self._prune()
+
+    def _prune(self):
         # Age-based prune
         cutoff = (datetime.utcnow() - timedelta(days=self.cfg["max_age_days"])).isoformat()
-        conn.execute(
-            "DELETE FROM agent_memory WHERE agent_name=? AND timestamp < ?",
-            (self.agent_name, cutoff),
-        )
+        self._db.execute(_PRUNE_AGE_SQL, (self.agent_name, cutoff))
 
         # Rolling window prune: keep only the most recent N
-        window = self.cfg["rolling_window"]
-        conn.execute(
-            """DELETE FROM agent_memory WHERE agent_name=? AND id NOT IN (
-                SELECT id FROM agent_memory WHERE agent_name=?
-                ORDER BY timestamp DESC LIMIT ?
-            )""",
-            (self.agent_name, self.agent_name, window),
-        )
-        conn.commit()
-        conn.close()
+        self._db.execute(_PRUNE_WINDOW_SQL, (self.agent_name, self.cfg["rolling_window"]))
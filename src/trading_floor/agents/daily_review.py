@@ -9,6 +9,7 @@ from pathlib import Path
 import yaml
 
 from trading_floor.agent_memory import AgentMemory
+from trading_floor.db import day_bounds
 from trading_floor.shadow import ShadowRunner
 
 
@@ -23,33 +24,62 @@ class DailyReviewAgent:
         self.db_path = Path(db_path)
         self.report_dir = Path("trading_logs/daily_reviews")
         self.report_dir.mkdir(parents=True, exist_ok=True)
+        # One connection for every run() and the memory audit
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        # WAL makes NORMAL sync safe: fsync per checkpoint, not per commit
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA mmap_size=268435456")
+        try:
+            # Same indexes Database creates; the day queries in run()
+            # range-scan them (the trades one covers pnl and symbol)
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_signals_ts ON signals(timestamp)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_trades_ts_pnl_sym ON trades(timestamp, pnl, symbol)")
+            self.conn.commit()
+        except sqlite3.OperationalError:
+            pass  # tables not created yet
 
     def _conn(self):
-        return sqlite3.connect(self.db_path)
+        return self.conn
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
 
     def run(self, date_str: str | None = None) -> dict:
         """Run the daily review for a given date (default: today)."""
         if date_str is None:
             date_str = datetime.now().strftime("%Y-%m-%d")
+        day = datetime.strptime(date_str, "%Y-%m-%d")
+        day_range = day_bounds(date_str)
 
-        # Query trades for the date
+        # Query trades for the date. Row order is pinned because drawdown and
+        # the latest-signal-per-symbol attribution depend on it
         conn = self._conn()
-        conn.row_factory = sqlite3.Row
 
         trades = conn.execute(
-            "SELECT * FROM trades WHERE timestamp LIKE ?", (f"{date_str}%",)
+            "SELECT symbol, pnl FROM trades WHERE timestamp >= ? AND timestamp < ? ORDER BY id",
+            day_range,
         ).fetchall()
 
         signals = conn.execute(
-            "SELECT * FROM signals WHERE timestamp LIKE ?", (f"{date_str}%",)
+            "SELECT symbol, score_mom, score_mean, score_break, score_news FROM signals"
+            " WHERE timestamp >= ? AND timestamp < ? ORDER BY id",
+            day_range,
         ).fetchall()
 
         # Also get recent trades (last 30 days) for broader analysis
-        cutoff = (datetime.strptime(date_str, "%Y-%m-%d") - timedelta(days=30)).strftime("%Y-%m-%d")
+        cutoff = (day - timedelta(days=30)).strftime("%Y-%m-%d")
         recent_trades = conn.execute(
-            "SELECT * FROM trades WHERE timestamp >= ?", (cutoff,)
+            "SELECT symbol, pnl FROM trades WHERE timestamp >= ? ORDER BY timestamp, id", (cutoff,)
         ).fetchall()
-        conn.close()
 
         # --- Metrics ---
         metrics = self._calc_metrics(recent_trades)
@@ -396,12 +426,15 @@ class DailyReviewAgent:
         audit = {"agents": {}, "recommendations": []}
 
         for agent_name in agents:
-            mem = AgentMemory(agent_name, db_path, mem_cfg)
-            stats = mem.get_stats()
+            mem = AgentMemory(agent_name, db_path, mem_cfg, conn=self.conn)
+            try:
+                stats = mem.get_stats()
+                # Check for disable recommendation
+                suggestion = mem.suggest_weight_adjustment(0.25)
+            finally:
+                mem.close()
             audit["agents"][agent_name] = stats
 
-            # Check for disable recommendation
-            suggestion = mem.suggest_weight_adjustment(0.25)
             if suggestion and suggestion.get("action") == "disable":
                 audit["recommendations"].append(
                     f"⚠️ {agent_name}: memory should be DISABLED (underperforming default)"
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+
+def compute(df: pd.DataFrame, cfg: dict) -> dict:
+    """
+    One pass over the close series for the momentum, mean-reversion and
+    breakout agents. Window lengths come from cfg["signals"] with the same
+    defaults the agents use, so scores match calling each agent's score(df).
+    float32 closes are kept as-is (no upcast copy); SMAs accumulate in float64.
+
+    Returns {close, n, sma_s, sma_l, prior_high, prior_low}; the SMA/range
+    entries are None when there is not enough history for that window.
+    """
+    sig = cfg.get("signals", {})
+    short = sig.get("momentum_short", 10)
+    long = sig.get("meanrev_long", 20)
+    lookback = sig.get("breakout_lookback", 10)
+
+    close = df["close"].to_numpy() if not df.empty else np.empty(0)
+    if close.dtype.kind != "f":
+        close = close.astype(np.float64)
+    n = len(close)
+
+    feats = {"close": close, "n": n, "sma_s": None, "sma_l": None,
+             "prior_high": None, "prior_low": None}
+    if n >= short:
+        feats["sma_s"] = float(np.nanmean(close[-short:], dtype=np.float64))
+    if n >= long:
+        feats["sma_l"] = float(np.nanmean(close[-long:], dtype=np.float64))
+    if n >= lookback:
+        # Range EXCLUDES the current bar once there is enough history
+        prior = close[-lookback:] if n < lookback + 1 else close[-lookback - 1:-1]
+        feats["prior_high"] = float(np.nanmax(prior))
+        feats["prior_low"] = float(np.nanmin(prior))
+    return feats
+
+
+def tail_panel(frames: list[pd.DataFrame], col: str = "close", dtype=np.float32) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Stack one column of several frames into a (T, N) matrix, right-aligned so
+    row -1 is every symbol's latest bar. Shorter histories are NaN-padded at
+    the top; `lengths[j]` is the real bar count of column j.
+    """
+    lengths = np.array([len(f) for f in frames], dtype=np.int64)
+    panel = np.full((int(lengths.max(initial=0)), len(frames)), np.nan, dtype=dtype)
+    for j, f in enumerate(frames):
+        if lengths[j]:
+            panel[-lengths[j]:, j] = f[col].to_numpy()
+    return panel, lengths
+
+
+def compute_panel(panel: np.ndarray, lengths: np.ndarray, cfg: dict) -> list[dict]:
+    """
+    compute() for every column of a tail_panel at once. Returns one feature
+    dict per column, interchangeable with compute() on that symbol's frame.
+    """
+    sig = cfg.get("signals", {})
+    short = sig.get("momentum_short", 10)
+    long = sig.get("meanrev_long", 20)
+    lookback = sig.get("breakout_lookback", 10)
+    n_cols = panel.shape[1]
+
+    def tail_stat(fn, rows, mask):
+        out = np.full(n_cols, np.nan)
+        if mask.any() and rows.shape[0]:
+            out[mask] = fn(rows[:, mask], axis=0)
+        return out
+
+    sma_s = tail_stat(lambda a, axis: np.nanmean(a, axis=axis, dtype=np.float64), panel[-short:], lengths >= short)
+    sma_l = tail_stat(lambda a, axis: np.nanmean(a, axis=axis, dtype=np.float64), panel[-long:], lengths >= long)
+    # Range EXCLUDES the current bar once there is enough history
+    exact = lengths == lookback
+    full = lengths >= lookback + 1
+    prior_high = tail_stat(np.nanmax, panel[-lookback:], exact)
+    prior_low = tail_stat(np.nanmin, panel[-lookback:], exact)
+    if full.any():
+        prior_high[full] = tail_stat(np.nanmax, panel[-lookback - 1:-1], full)[full]
+        prior_low[full] = tail_stat(np.nanmin, panel[-lookback - 1:-1], full)[full]
+
+    T = panel.shape[0]
+    feats = []
+    for j in range(n_cols):
+        n = int(lengths[j])
+        feats.append({
+            "close": panel[T - n:, j], "n": n,
+            "sma_s": float(sma_s[j]) if n >= short else None,
+            "sma_l": float(sma_l[j]) if n >= long else None,
+            "prior_high": float(prior_high[j]) if n >= lookback else None,
+            "prior_low": float(prior_low[j]) if n >= lookback else None,
+        })
+    return feats
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
 import hashlib
+import json
 import logging
 import re
+import sqlite3
+import threading
+import time
 import urllib.request
 import urllib.parse
+from contextlib import closing
 from html import unescape
+from pathlib import Path
+from typing import Dict
 
 import yfinance as yf
 
@@ -80,12 +87,18 @@ def _build_weight_map(strong: set[str], medium: set[str], weak: set[str]) -> dic
 _POSITIVE_WEIGHTS = _build_weight_map(_POS_STRONG, _POS_MEDIUM, _POS_WEAK)
 _NEGATIVE_WEIGHTS = _build_weight_map(_NEG_STRONG, _NEG_MEDIUM, _NEG_WEAK)
 _AMBIGUOUS_KEYWORDS = set(_POSITIVE_WEIGHTS) & set(_NEGATIVE_WEIGHTS)
+# One lookup per token: weight signed by polarity, ambiguous words left out
+_SIGNED_WEIGHTS = {
+    **{word: -weight for word, weight in _NEGATIVE_WEIGHTS.items() if word not in _AMBIGUOUS_KEYWORDS},
+    **{word: weight for word, weight in _POSITIVE_WEIGHTS.items() if word not in _AMBIGUOUS_KEYWORDS},
+}
+_TOKEN_RE = re.compile(r"[a-z]+")
 
 
 def _keyword_score(text: str) -> float:
     """Score text from -1 to +1 using weighted keyword matching."""
     normalized = text.lower().replace("n't", " not")
-    tokens = re.findall(r"[a-z]+", normalized)
+    tokens = _TOKEN_RE.findall(normalized)
     if not tokens:
         return 0.0
 
@@ -93,24 +106,18 @@ def _keyword_score(text: str) -> float:
     neg_weight = 0.0
 
     for idx, word in enumerate(tokens):
-        if word in _AMBIGUOUS_KEYWORDS:
-            continue
-        weight = _POSITIVE_WEIGHTS.get(word)
-        polarity = 1
-        if weight is None:
-            weight = _NEGATIVE_WEIGHTS.get(word)
-            polarity = -1
+        weight = _SIGNED_WEIGHTS.get(word)
         if weight is None:
             continue
 
         window = tokens[max(0, idx - 3):idx]
         if any(w in _NEGATORS for w in window):
-            polarity *= -1
+            weight = -weight
 
-        if polarity > 0:
+        if weight > 0:
             pos_weight += weight
         else:
-            neg_weight += weight
+            neg_weight -= weight
 
     total = pos_weight + neg_weight
     if total == 0.0:
@@ -268,6 +275,13 @@ def get_macro_sentiment() -> dict:
 
 
 class NewsSentimentAgent:
+    # Scores are shared across instances for CACHE_TTL seconds and mirrored to
+    # CACHE_PATH so separate script runs (and restarts) reuse them too.
+    _cache: Dict[str, Dict] = {}  # {symbol: {"ts": float, "score": float, "flags": dict}}
+    _cache_lock = threading.Lock()
+    CACHE_TTL = 300  # seconds
+    CACHE_PATH = Path(__file__).resolve().parents[3] / "cache" / "news_sentiment.sqlite"
+
     def __init__(self, cfg, tracer):
         self.cfg = cfg
         self.tracer = tracer
@@ -302,6 +316,60 @@ class NewsSentimentAgent:
         if symbol in self.cache:
             return self.cache[symbol]
 
+        cached = self._cached(symbol)
+        if cached is not None:
+            if cached["flags"] is not None:
+                self.event_flags.setdefault(symbol, cached["flags"])
+            self.cache[symbol] = cached["score"]
+            return cached["score"]
+
+        score = self._fetch(symbol)
+        self._store(symbol, score, self.event_flags.get(symbol))
+        return score
+
+    def _cached(self, symbol: str) -> dict | None:
+        """Unexpired shared entry for symbol, from memory first, then disk."""
+        now = time.time()
+        with self._cache_lock:
+            hit = NewsSentimentAgent._cache.get(symbol)
+        if hit and (now - hit["ts"]) < self.CACHE_TTL:
+            return hit
+
+        try:
+            with closing(sqlite3.connect(self.CACHE_PATH, timeout=5)) as conn:
+                row = conn.execute(
+                    "SELECT score, flags, fetched_at FROM news_sentiment WHERE symbol = ? AND fetched_at > ?",
+                    (symbol, now - self.CACHE_TTL),
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None:
+            return None
+        hit = {"ts": row[2], "score": row[0], "flags": json.loads(row[1]) if row[1] else None}
+        with self._cache_lock:
+            NewsSentimentAgent._cache[symbol] = hit
+        return hit
+
+    def _store(self, symbol: str, score: float, flags: dict | None) -> None:
+        now = time.time()
+        with self._cache_lock:
+            NewsSentimentAgent._cache[symbol] = {"ts": now, "score": score, "flags": flags}
+        try:
+            self.CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with closing(sqlite3.connect(self.CACHE_PATH, timeout=5)) as conn, conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS news_sentiment "
+                    "(symbol TEXT PRIMARY KEY, score REAL, flags TEXT, fetched_at REAL)"
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO news_sentiment VALUES (?, ?, ?, ?)",
+                    (symbol, score, json.dumps(flags) if flags is not None else None, now),
+                )
+        except (sqlite3.Error, OSError) as e:
+            logger.debug("News cache write failed for %s: %s", symbol, e)
+
+    def _fetch(self, symbol: str) -> float:
+        """Score symbol from the news sources (no caching across instances)."""
         headlines: list[str] = []
 
         finnhub_data = None
@@ -4,6 +4,8 @@ import sqlite3
 from datetime import datetime
 from pathlib import Path
 
+from trading_floor.db import day_bounds
+
 
 class NextDayReviewer:
     """
@@ -42,12 +44,14 @@ class NextDayReviewer:
             if not date_str:
                 date_str = datetime.now().strftime("%Y-%m-%d")
 
+        # Half-open day range so idx_trades_ts_pnl_sym / idx_signals_ts are used (LIKE can't)
+        day_range = day_bounds(date_str)
         trades = conn.execute(
-            "SELECT * FROM trades WHERE timestamp LIKE ?", (f"{date_str}%",)
+            "SELECT * FROM trades WHERE timestamp >= ? AND timestamp < ?", day_range
         ).fetchall()
 
         signals = conn.execute(
-            "SELECT * FROM signals WHERE timestamp LIKE ?", (f"{date_str}%",)
+            "SELECT * FROM signals WHERE timestamp >= ? AND timestamp < ?", day_range
         ).fetchall()
         conn.close()
 
@@ -2,8 +2,11 @@ from __future__ import annotations
 
 from typing import Dict, List
 
+import numpy as np
 import pandas as pd
 
+from trading_floor.agents.features import tail_panel
+
 
 class ScoutAgent:
     def __init__(self, cfg, tracer):
@@ -12,41 +15,56 @@ class ScoutAgent:
 
     def rank(self, market_data: Dict[str, pd.DataFrame]) -> List[Dict]:
         self.tracer.emit_span("scout.rank", {"symbols": list(market_data.keys())})
+        frames = {sym: df for sym, df in market_data.items() if not df.empty and len(df) >= 2}
+        if not frames:
+            return []
+        close_panel, lengths = tail_panel(list(frames.values()), dtype=np.float64)
+        avg_volume = np.array([
+            df["volume"].mean() if "volume" in df.columns else np.nan for df in frames.values()
+        ], dtype=np.float64)
+        return self._rank_arrays(list(frames), close_panel, lengths, avg_volume)
+
+    def rank_panel(self, symbols: List[str], close_panel: np.ndarray, lengths: np.ndarray,
+                   avg_volume: np.ndarray | None = None) -> List[Dict]:
+        """
+        Rank from a right-aligned (T, N) close panel (see features.tail_panel)
+        so trend and vol for every symbol come out of a few array ops.
+        `avg_volume` (one per symbol, NaN = unknown) drives the volume filter.
+        """
+        self.tracer.emit_span("scout.rank", {"symbols": list(symbols)})
+        return self._rank_arrays(symbols, close_panel, lengths, avg_volume)
+
+    def _rank_arrays(self, symbols, close_panel, lengths, avg_volume) -> List[Dict]:
         min_avg_volume = self.cfg.get("min_avg_volume", 100_000)
-        ranked = []
-        for sym, df in market_data.items():
-            if df.empty or len(df) < 2:
-                continue
-
-            # Early exit: skip low-volume stocks
-            if "volume" in df.columns:
-                avg_vol = df["volume"].mean()
-                if avg_vol < min_avg_volume:
-                    continue
-            
-            # Vectorized calculations are faster, but here we work on single series.
-            # Avoid full pct_change series if we just need vol of the whole window.
-            # Keeping pct_change() is fine as it's optimized in pandas.
-            
-            closes = df["close"]
-            
-            # Only calc vol if needed for ranking logic.
-            # Optim: Use iloc for ends to avoid index lookup overhead
-            start_price = closes.iloc[0]
-            end_price = closes.iloc[-1]
-            
-            if start_price == 0:
-                trend = 0.0
-            else:
-                trend = (end_price - start_price) / start_price
-
-            returns = closes.pct_change().dropna()
-            if returns.empty:
-                vol = 0.0
-            else:
-                vol = returns.std() * (252 ** 0.5)
-            
-            ranked.append({"symbol": sym, "trend": float(trend), "vol": float(vol)})
-            
+        lengths = np.asarray(lengths)
+        if not len(symbols) or close_panel.shape[0] == 0:
+            return []
+        closes = close_panel.astype(np.float64, copy=False)
+        T, n_cols = closes.shape
+        cols = np.arange(n_cols)
+
+        # Whole-window trend: first real bar (top padding skipped) to the last bar
+        start_price = closes[np.clip(T - lengths, 0, T - 1), cols]
+        end_price = closes[-1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            trend = np.where(start_price == 0, 0.0, (end_price - start_price) / start_price)
+            # pct_change().dropna().std(), for every column at once (NaN padding drops out)
+            returns = closes[1:] / closes[:-1] - 1.0
+        valid = ~np.isnan(returns)
+        count = valid.sum(axis=0)
+        mean = np.where(valid, returns, 0.0).sum(axis=0) / np.maximum(count, 1)
+        sq = np.where(valid, (returns - mean) ** 2, 0.0).sum(axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            std = np.where(count > 1, np.sqrt(sq / np.maximum(count - 1, 1)), np.nan)
+        vol = np.where(count == 0, 0.0, std * (252 ** 0.5))
+
+        # Early exit: skip low-volume stocks (NaN average = unknown, keep)
+        keep = lengths >= 2
+        if avg_volume is not None:
+            keep &= ~(np.asarray(avg_volume) < min_avg_volume)
+        ranked = [
+            {"symbol": symbols[j], "trend": float(trend[j]), "vol": float(vol[j])}
+            for j in np.flatnonzero(keep)
+        ]
         ranked.sort(key=lambda x: (x["trend"], -x["vol"]), reverse=True)
         return ranked
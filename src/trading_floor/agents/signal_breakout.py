@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import pandas as pd
 
+from trading_floor.agents import features
+
 
 class BreakoutSignalAgent:
     def __init__(self, cfg, tracer):
@@ -10,25 +12,21 @@ class BreakoutSignalAgent:
         self.lookback = cfg.get("signals", {}).get("breakout_lookback", 10)
 
     def score(self, df: pd.DataFrame) -> float:
-        self.tracer.emit_span("signal.breakout", {"rows": len(df)})
-        if df.empty or len(df) < self.lookback:
+        return self.score_from_features(features.compute(df, self.cfg))
+
+    def score_from_features(self, feats: dict) -> float:
+        self.tracer.emit_span("signal.breakout", {"rows": feats["n"]})
+        if feats["prior_high"] is None:
             return 0.0
-        
-        closes = df["close"]
-        last = closes.iloc[-1]
-
-        # Use lookback period EXCLUDING the current bar for the range.
-        # This way a breakout (price beyond prior range) gives |score| > 0
-        # and the signal isn't pinned to ±1.0 when the current bar IS the
-        # high or low of the window.
-        if len(closes) < self.lookback + 1:
-            # Not enough history to exclude current bar; use all available
-            prior = closes.iloc[-self.lookback:]
-        else:
-            prior = closes.iloc[-self.lookback - 1:-1]
-
-        prior_high = prior.max()
-        prior_low = prior.min()
+
+        last = float(feats["close"][-1])
+
+        # The prior range uses the lookback period EXCLUDING the current bar
+        # (see features.compute). This way a breakout (price beyond prior range)
+        # gives |score| > 0 and the signal isn't pinned to ±1.0 when the current
+        # bar IS the high or low of the window.
+        prior_high = feats["prior_high"]
+        prior_low = feats["prior_low"]
 
         if prior_high == prior_low or prior_high == 0:
             return 0.0
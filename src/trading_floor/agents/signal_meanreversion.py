@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import pandas as pd
 
+from trading_floor.agents import features
+
 
 class MeanReversionSignalAgent:
     def __init__(self, cfg, tracer):
@@ -10,14 +12,13 @@ class MeanReversionSignalAgent:
         self.long = cfg.get("signals", {}).get("meanrev_long", 20)
 
     def score(self, df: pd.DataFrame) -> float:
-        self.tracer.emit_span("signal.meanreversion", {"rows": len(df)})
-        if df.empty or len(df) < self.long:
+        return self.score_from_features(features.compute(df, self.cfg))
+
+    def score_from_features(self, feats: dict) -> float:
+        self.tracer.emit_span("signal.meanreversion", {"rows": feats["n"]})
+        sma = feats["sma_l"]
+        if sma is None:
             return 0.0
-        
-        # Optimize: direct mean of last N elements instead of full series rolling
-        closes = df["close"]
-        last_closes = closes.iloc[-self.long:]
-        sma = last_closes.mean()
-        
+
         if sma == 0: return 0.0
-        return float((sma - closes.iloc[-1]) / sma)
+        return (sma - float(feats["close"][-1])) / sma
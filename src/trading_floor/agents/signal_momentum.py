@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import pandas as pd
 
+from trading_floor.agents import features
+
 
 class MomentumSignalAgent:
     def __init__(self, cfg, tracer):
@@ -10,19 +12,14 @@ class MomentumSignalAgent:
         self.short = cfg.get("signals", {}).get("momentum_short", 10)
 
     def score(self, df: pd.DataFrame) -> float:
-        self.tracer.emit_span("signal.momentum", {"rows": len(df)})
-        if df.empty or len(df) < self.short:
+        return self.score_from_features(features.compute(df, self.cfg))
+
+    def score_from_features(self, feats: dict) -> float:
+        self.tracer.emit_span("signal.momentum", {"rows": feats["n"]})
+        sma = feats["sma_s"]
+        if sma is None:
             return 0.0
-        
-        # Optimize: Only calculate rolling mean for the last window needed
-        # We need the last `short` elements to compute the rolling mean of the *last* point.
-        # But rolling().mean() computes it for everyone.
-        # Just taking the last `short` values and computing their mean is faster/simpler 
-        # for a single point scalar return.
-        
-        closes = df["close"]
-        last_closes = closes.iloc[-self.short:]
-        sma = last_closes.mean()
-        
+
+        # SMA of the last `short` closes is precomputed; only the last point matters.
         if sma == 0: return 0.0
-        return float((closes.iloc[-1] - sma) / sma)
+        return (float(feats["close"][-1]) - sma) / sma
@@ -0,0 +1,57 @@
+"""Parse-once access to configs/workflow.yaml for the helper scripts."""
+from __future__ import annotations
+
+import copy
+import os
+import pickle
+from functools import lru_cache
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import yaml
+
+CONFIG_PATH = Path(__file__).resolve().parents[2] / "configs" / "workflow.yaml"
+
+# libyaml's C loader when PyYAML was built with it
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=None)
+def _parse(path: str) -> dict:
+    # Cron scripts start a fresh process every few minutes, so the parsed
+    # config is also kept in a pickle sidecar, valid while mtime/size match
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    sidecar = f"{path}.cache.pkl"
+    try:
+        with open(sidecar, "rb") as f:
+            cached_stamp, cfg = pickle.load(f)
+        if cached_stamp == stamp:
+            return cfg
+    except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+        pass
+
+    with open(path, "r", encoding="utf-8") as f:
+        cfg = yaml.load(f, Loader=_Loader)
+    try:
+        tmp = f"{sidecar}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump((stamp, cfg), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, sidecar)
+    except OSError:
+        pass
+    return cfg
+
+
+def load(path: str | Path = CONFIG_PATH) -> dict:
+    """
+    workflow.yaml as a dict. The file is parsed once per process; each call
+    gets its own copy so callers that tweak cfg cannot leak into each other.
+    """
+    return copy.deepcopy(_parse(str(Path(path).resolve())))
+
+
+@lru_cache(maxsize=None)
+def tz(path: str | Path = CONFIG_PATH) -> ZoneInfo:
+    """Market timezone from hours.tz."""
+    return ZoneInfo(_parse(str(Path(path).resolve()))["hours"]["tz"])
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
+from pathlib import Path
 from typing import Dict, List
 
 import time
@@ -9,6 +10,8 @@ import time
 import pandas as pd
 import yfinance as yf
 
+from trading_floor.config import load as load_config
+
 
 @dataclass
 class MarketData:
@@ -34,14 +37,17 @@ class YahooDataProvider:
         YahooDataProvider._cache[cache_key] = {"ts": time.time(), "data": result}
         return result
 
-    def _fetch_from_yahoo(self, symbols: List[str]) -> Dict[str, MarketData]:
+    def _fetch_from_yahoo(self, symbols: List[str], start=None, end=None) -> Dict[str, MarketData]:
         if not symbols:
             return {}
 
+        # Explicit start/end (PriceCache gap fills) overrides the period lookback
+        window = {"start": start, "end": end} if start is not None else {"period": self.lookback}
+
         # Bulk download is much faster than sequential
         raw_data = yf.download(
             symbols,
-            period=self.lookback,
+            **window,
             interval=self.interval,
             progress=False,
             auto_adjust=True,
@@ -88,6 +94,107 @@ class YahooDataProvider:
         return df
 
 
+class PriceCache:
+    """
+    On-disk bar cache shared by the scripts, one parquet file per completed
+    day: cache/{interval}/{symbol}/{yyyy-mm-dd}.parquet. Only days that are
+    missing (plus today, which is still forming) are downloaded, in a single
+    batched request. Returns the same {symbol: MarketData} as
+    YahooDataProvider.fetch.
+
+    lookback="Nd" means the last N sessions, like Yahoo's period: trading
+    days (weekdays minus hours.holidays) for stocks, calendar days for
+    crypto. Today only counts once the market has opened.
+    """
+
+    MARKET_TZ = "America/New_York"
+    MARKET_OPEN = "09:30"
+
+    def __init__(self, cache_dir: str | Path | None = None, holidays: List[str] | None = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else Path(__file__).resolve().parents[2] / "cache"
+        if holidays is None:
+            holidays = load_config().get("hours", {}).get("holidays", [])
+        self.trading_day = pd.offsets.CustomBusinessDay(holidays=list(holidays))
+
+    def _now(self) -> pd.Timestamp:
+        return pd.Timestamp.now(tz=self.MARKET_TZ)
+
+    def get(self, symbols: List[str], interval: str = "5m", lookback: str = "5d") -> Dict[str, MarketData]:
+        symbols = list(dict.fromkeys(symbols))
+        if not symbols:
+            return {}
+        if not (lookback.endswith("d") and lookback[:-1].isdigit()):
+            # Only day-count lookbacks map onto day files
+            return YahooDataProvider(interval=interval, lookback=lookback).fetch(symbols)
+
+        n_days = int(lookback[:-1])
+        now = self._now()
+        today = now.normalize().tz_localize(None)
+        opened = now.strftime("%H:%M") >= self.MARKET_OPEN
+        needed = {sym: self._needed_days(sym, n_days, today, opened) for sym in symbols}
+
+        frames: Dict[str, Dict[pd.Timestamp, pd.DataFrame]] = {sym: {} for sym in symbols}
+        missing: Dict[str, List[pd.Timestamp]] = {}
+        for sym, days in needed.items():
+            for day in days:
+                path = self._path(interval, sym, day)
+                if day < today and path.exists():
+                    frames[sym][day] = pd.read_parquet(path)
+                else:
+                    missing.setdefault(sym, []).append(day)
+
+        if missing:
+            start = min(min(days) for days in missing.values())
+            provider = YahooDataProvider(interval=interval)
+            fetched = provider._fetch_from_yahoo(
+                list(missing), start=start.date(), end=(today + pd.Timedelta(days=1)).date()
+            )
+            for sym, days in missing.items():
+                if sym not in fetched:
+                    continue  # failed download: cache nothing, retry next time
+                # Single-symbol downloads come back prefixed (e.g. meta_close); store plain names
+                prefix = f"{sym.lower()}_"
+                df = fetched[sym].df.rename(columns=lambda c: c[len(prefix):] if c.startswith(prefix) else c)
+                bar_day = self._bar_days(df["datetime"])
+                last_day = bar_day.max() if len(bar_day) else None
+                for day in days:
+                    day_df = df[bar_day == day].reset_index(drop=True)
+                    # An empty day is only final (a holiday) when the download
+                    # reaches past it; otherwise the response may be partial
+                    if day < today and (not day_df.empty or (last_day is not None and last_day > day)):
+                        path = self._path(interval, sym, day)
+                        path.parent.mkdir(parents=True, exist_ok=True)
+                        day_df.to_parquet(path, compression="zstd")
+                    frames[sym][day] = day_df
+
+        data: Dict[str, MarketData] = {}
+        for sym in symbols:
+            parts = [frames[sym][d] for d in sorted(frames[sym]) if not frames[sym][d].empty]
+            if parts:
+                data[sym] = MarketData(symbol=sym, df=pd.concat(parts, ignore_index=True))
+        return data
+
+    def _bar_days(self, stamps: pd.Series) -> pd.Series:
+        # Intraday bars are tz-aware; daily bars are naive dates already in market time
+        stamps = pd.to_datetime(stamps)
+        if stamps.dt.tz is None:
+            stamps = stamps.dt.tz_localize(self.MARKET_TZ)
+        else:
+            stamps = stamps.dt.tz_convert(self.MARKET_TZ)
+        return stamps.dt.normalize().dt.tz_localize(None)
+
+    def _needed_days(self, symbol: str, n_days: int, today: pd.Timestamp, opened: bool = True) -> List[pd.Timestamp]:
+        # Crypto trades every day
+        if symbol.endswith("-USD"):
+            return list(pd.date_range(end=today, periods=n_days))
+        # Before the open the newest session is the previous trading day
+        last = today if opened else today - pd.Timedelta(days=1)
+        return list(pd.date_range(end=last, periods=n_days, freq=self.trading_day))
+
+    def _path(self, interval: str, symbol: str, day: pd.Timestamp) -> Path:
+        return self.cache_dir / interval / symbol / f"{day:%Y-%m-%d}.parquet"
+
+
 def filter_trading_window(df: pd.DataFrame, tz: str, start: str, end: str) -> pd.DataFrame:
     if df.empty:
         return df
@@ -1,19 +1,29 @@
 import sqlite3
 from pathlib import Path
-from datetime import datetime
+from datetime import date, datetime, timedelta
 import json
 
+
+def day_bounds(day: str) -> tuple[str, str]:
+    """(day, next_day) ISO strings for a `timestamp >= ? AND timestamp < ?` range scan."""
+    return day, (date.fromisoformat(day) + timedelta(days=1)).isoformat()
+
+
 class Database:
     def __init__(self, db_path="trading.db"):
         self.db_path = Path(db_path)
         self._init_db()
 
     def _get_conn(self):
-        return sqlite3.connect(self.db_path)
+        conn = sqlite3.connect(self.db_path)
+        # WAL (set once in _init_db) makes NORMAL sync safe: fsync per checkpoint, not per commit
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
 
     def _init_db(self):
         conn = self._get_conn()
         cursor = conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
         
         # Trades Table
         cursor.execute("""
@@ -48,6 +58,15 @@ class Database:
             )
         """)
         
+        # Per-day reports range-scan these instead of LIKE 'YYYY-MM-DD%'. The
+        # trades one also covers DailyReviewAgent's symbol/pnl reads; it
+        # replaces the plain idx_trades_ts, which was a prefix of it
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_trades_ts_pnl_sym ON trades(timestamp, pnl, symbol)")
+        cursor.execute("DROP INDEX IF EXISTS idx_trades_ts")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_signals_ts ON signals(timestamp)")
+        # Covers morning_strategy's per-symbol P&L rollup (GROUP BY symbol over pnl)
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_trades_symbol_pnl ON trades(symbol, pnl)")
+        
         # Events Table (General Logs)
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS events (
@@ -81,6 +100,9 @@ class Database:
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_agent_memory_agent ON agent_memory(agent_name)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_agent_memory_regime ON agent_memory(regime_label)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_agent_memory_timestamp ON agent_memory(timestamp)")
+        # Covering indexes for AgentMemory's accuracy and memory-vs-default aggregates
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_agent_memory_outcome ON agent_memory(agent_name, outcome, timestamp, pnl)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_agent_memory_influenced ON agent_memory(agent_name, memory_influenced, outcome, pnl)")
 
         # Shadow Predictions Table (Kalman + HMM shadow mode)
         cursor.execute("""
@@ -245,49 +267,70 @@ class Database:
         conn.close()
 
     def log_trade(self, trade: dict):
+        self.log_trades([trade])
+
+    def log_trades(self, trades: list[dict]):
+        """Insert several trades in one transaction."""
+        if not trades:
+            return
         conn = self._get_conn()
-        cursor = conn.cursor()
-        cursor.execute("""
-            INSERT INTO trades (timestamp, symbol, side, quantity, price, pnl, score, strategy_data)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            trade.get("timestamp"),
-            trade.get("symbol"),
-            trade.get("side"),
-            trade.get("quantity", 0),
-            trade.get("price", 0.0),
-            trade.get("pnl", 0.0),
-            trade.get("score", 0.0),
-            json.dumps(trade.get("metadata", {}))
-        ))
-        conn.commit()
+        with conn:
+            conn.executemany("""
+                INSERT INTO trades (timestamp, symbol, side, quantity, price, pnl, score, strategy_data)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, [(
+                trade.get("timestamp"),
+                trade.get("symbol"),
+                trade.get("side"),
+                trade.get("quantity", 0),
+                trade.get("price", 0.0),
+                trade.get("pnl", 0.0),
+                trade.get("score", 0.0),
+                json.dumps(trade.get("metadata", {}))
+            ) for trade in trades])
         conn.close()
 
     def log_signal(self, signal: dict):
-        conn = self._get_conn()
-        cursor = conn.cursor()
-        cursor.execute("""
-            INSERT INTO signals (
-                timestamp, symbol, 
-                score_mom, score_mean, score_break, score_news,
-                weight_mom, weight_mean, weight_break, weight_news,
-                final_score
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        self.log_signals([signal])
+
+    def log_signals(self, signals: list[dict]):
+        """Insert several signals in one transaction."""
+        self.log_signal_rows([self.signal_row(signal) for signal in signals])
+
+    @staticmethod
+    def signal_row(signal: dict) -> tuple:
+        """The signals-table row for one signal dict, as log_signal_rows takes it."""
+        comps = signal.get("components", {})
+        weights = signal.get("weights_used", signal.get("weights", {}))
+        return (
             signal.get("timestamp"),
             signal.get("symbol"),
-            signal.get("components", {}).get("momentum", 0.0),
-            signal.get("components", {}).get("meanrev", 0.0),
-            signal.get("components", {}).get("breakout", 0.0),
-            signal.get("components", {}).get("news", 0.0),
-            signal.get("weights_used", signal.get("weights", {})).get("momentum", 0.0),
-            signal.get("weights_used", signal.get("weights", {})).get("meanrev", 0.0),
-            signal.get("weights_used", signal.get("weights", {})).get("breakout", 0.0),
-            signal.get("weights_used", signal.get("weights", {})).get("news", 0.0),
+            comps.get("momentum", 0.0),
+            comps.get("meanrev", 0.0),
+            comps.get("breakout", 0.0),
+            comps.get("news", 0.0),
+            weights.get("momentum", 0.0),
+            weights.get("meanrev", 0.0),
+            weights.get("breakout", 0.0),
+            weights.get("news", 0.0),
             signal.get("final_score", 0.0)
-        ))
-        conn.commit()
+        )
+
+    def log_signal_rows(self, rows: list[tuple]):
+        """Insert rows built by signal_row in one transaction."""
+        if not rows:
+            return
+        conn = self._get_conn()
+        with conn:
+            conn.executemany("""
+                INSERT INTO signals (
+                    timestamp, symbol, 
+                    score_mom, score_mean, score_break, score_news,
+                    weight_mom, weight_mean, weight_break, weight_news,
+                    final_score
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
         conn.close()
         
     def log_event(self, event: dict):
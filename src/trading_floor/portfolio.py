@@ -1,6 +1,7 @@
 import json
 import math
 import logging
+import os
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
@@ -78,7 +79,11 @@ class Portfolio:
                 } for sym, p in self.state.positions.items()
             }
         }
-        self.file_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        # Swap the file in atomically: the scripts read portfolio.json while the
+        # trader runs, and a half-written file would load as a fresh portfolio
+        tmp = self.file_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        os.replace(tmp, self.file_path)
 
     def mark_to_market(self, prices: Dict[str, float]):
         """Update current prices and equity"""
@@ -4,12 +4,17 @@ Queries Google News RSS for each sector, scores headlines, caches results.
 """
 from __future__ import annotations
 
+import json
 import logging
+import sqlite3
 import time
 import re
 import urllib.request
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from html import unescape
+from pathlib import Path
 from typing import Optional
 
 from trading_floor.sector_map import SECTOR_MAP, SECTOR_QUERIES, get_sector
@@ -21,8 +26,70 @@ logger = logging.getLogger(__name__)
 _CACHE_TTL = 600  # 10 minutes
 _sector_cache: dict[str, tuple[float, float]] = {}  # sector -> (score, timestamp)
 
+# Headlines per query, shorter-lived than the scores built from them
+_HEADLINE_TTL = 300
+_headline_cache: dict[str, tuple[list[str], int, float]] = {}  # query -> (headlines, max_headlines, timestamp)
+
+# Both caches are shared across processes (morning_strategy, premarket_prep, the
+# workflow) through a small SQLite file, like the news agent's cache
+_CACHE_PATH = Path(__file__).resolve().parents[2] / "cache" / "sector_sentiment.sqlite"
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS sector_sentiment (sector TEXT PRIMARY KEY, score REAL, fetched_at REAL)",
+    "CREATE TABLE IF NOT EXISTS sector_headlines "
+    "(query TEXT PRIMARY KEY, headlines TEXT, max_headlines INTEGER, fetched_at REAL)",
+)
+
+
+def _disk_get(sql: str, params: tuple) -> Optional[tuple]:
+    try:
+        with closing(sqlite3.connect(_CACHE_PATH, timeout=5)) as conn:
+            return conn.execute(sql, params).fetchone()
+    except sqlite3.Error:
+        return None
+
+
+def _disk_put(sql: str, params: tuple) -> None:
+    try:
+        _CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        # closing() releases the connection; the inner with commits
+        with closing(sqlite3.connect(_CACHE_PATH, timeout=5)) as conn, conn:
+            for ddl in _SCHEMA:
+                conn.execute(ddl)
+            conn.execute(sql, params)
+    except (sqlite3.Error, OSError) as e:
+        logger.debug("Sector cache write failed: %s", e)
+
 
 def _scrape_sector_news(query: str, max_headlines: int = 10) -> list[str]:
+    """
+    Google News RSS headlines for a query. Successful scrapes are cached for
+    _HEADLINE_TTL seconds; a cached scrape serves any request for up to as
+    many headlines as it fetched.
+    """
+    now = time.time()
+    hit = _headline_cache.get(query)
+    if hit is None or now - hit[2] >= _HEADLINE_TTL or hit[1] < max_headlines:
+        row = _disk_get(
+            "SELECT headlines, max_headlines, fetched_at FROM sector_headlines "
+            "WHERE query = ? AND fetched_at > ? AND max_headlines >= ?",
+            (query, now - _HEADLINE_TTL, max_headlines),
+        )
+        hit = (json.loads(row[0]), row[1], row[2]) if row else None
+    if hit is not None:
+        _headline_cache[query] = hit
+        return hit[0][:max_headlines]
+
+    headlines = _fetch_sector_news(query, max_headlines)
+    if headlines:
+        _headline_cache[query] = (headlines, max_headlines, now)
+        _disk_put(
+            "INSERT OR REPLACE INTO sector_headlines VALUES (?, ?, ?, ?)",
+            (query, json.dumps(headlines), max_headlines, now),
+        )
+    return headlines
+
+
+def _fetch_sector_news(query: str, max_headlines: int) -> list[str]:
     """Scrape Google News RSS for sector-level headlines."""
     try:
         encoded = urllib.parse.quote(query)
@@ -50,7 +117,7 @@ def _scrape_sector_news(query: str, max_headlines: int = 10) -> list[str]:
 def get_sector_sentiment(sector: str) -> float:
     """
     Get sector sentiment score [-1.0, +1.0].
-    Caches results for _CACHE_TTL seconds.
+    Caches results for _CACHE_TTL seconds, in memory and on disk.
     Returns 0.0 if sector not found in SECTOR_QUERIES.
     """
     now = time.time()
@@ -60,6 +127,13 @@ def get_sector_sentiment(sector: str) -> float:
         cached_score, cached_time = _sector_cache[sector]
         if now - cached_time < _CACHE_TTL:
             return cached_score
+    row = _disk_get(
+        "SELECT score, fetched_at FROM sector_sentiment WHERE sector = ? AND fetched_at > ?",
+        (sector, now - _CACHE_TTL),
+    )
+    if row:
+        _sector_cache[sector] = (row[0], row[1])
+        return row[0]
 
     query = SECTOR_QUERIES.get(sector)
     if not query:
@@ -67,6 +141,7 @@ def get_sector_sentiment(sector: str) -> float:
 
     headlines = _scrape_sector_news(query)
     if not headlines:
+        # Failed scrape: back off in this process only, other runs may retry
         _sector_cache[sector] = (0.0, now)
         return 0.0
 
@@ -79,10 +154,15 @@ def get_sector_sentiment(sector: str) -> float:
         headlines[0][:80] if headlines else "none"
     )
 
-    _sector_cache[sector] = (avg, now)
+    _store_sector(sector, avg, now)
     return avg
 
 
+def _store_sector(sector: str, score: float, now: float) -> None:
+    _sector_cache[sector] = (score, now)
+    _disk_put("INSERT OR REPLACE INTO sector_sentiment VALUES (?, ?, ?)", (sector, score, now))
+
+
 def check_sector_filter(symbol: str, threshold: float = -0.15) -> tuple[bool, str, float]:
     """
     Check if a symbol passes the sector news filter.
@@ -117,8 +197,12 @@ def check_sector_filter(symbol: str, threshold: float = -0.15) -> tuple[bool, st
 
 
 def get_all_sector_sentiments() -> dict[str, float]:
-    """Get sentiment scores for all sectors. Good for pre-market prep."""
-    results = {}
-    for sector in SECTOR_QUERIES:
-        results[sector] = get_sector_sentiment(sector)
-    return results
+    """
+    Get sentiment scores for all sectors. Good for pre-market prep.
+    Sectors are scraped concurrently; each is one independent HTTP request.
+    """
+    sectors = list(SECTOR_QUERIES)
+    if not sectors:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(16, len(sectors))) as pool:
+        return dict(zip(sectors, pool.map(get_sector_sentiment, sectors)))
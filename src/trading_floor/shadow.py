@@ -7,6 +7,7 @@ from pathlib import Path
 
 import numpy as np
 
+from trading_floor.db import day_bounds
 from trading_floor.kalman import KalmanFilter
 from trading_floor.hmm import HMMRegimeDetector
 
@@ -199,12 +200,14 @@ class ShadowRunner:
             date_str = datetime.now().strftime("%Y-%m-%d")
 
         try:
+            # A malformed date_str is reported like any other query failure
+            day_range = day_bounds(date_str)
             conn = sqlite3.connect(self.db_path)
             conn.row_factory = sqlite3.Row
             rows = conn.execute(
                 """SELECT * FROM shadow_predictions
-                   WHERE timestamp LIKE ? AND outcome_filled = 1""",
-                (f"{date_str}%",)
+                   WHERE timestamp >= ? AND timestamp < ? AND outcome_filled = 1""",
+                day_range
             ).fetchall()
             conn.close()
         except Exception:
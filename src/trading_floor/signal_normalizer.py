@@ -8,11 +8,17 @@ class SignalNormalizer:
     """
     Normalizes raw signal scores to [-1, +1] using a rolling z-score.
     Maintains a history buffer per signal component.
+
+    Mean and variance are updated incrementally (sliding-window Welford), so
+    each call is O(1) instead of re-summing the whole buffer. The stats are
+    re-synced from the buffer once per `lookback` updates (and whenever the
+    window is near-flat) to bound float drift.
     """
 
     def __init__(self, lookback: int = 100):
         self.lookback = lookback
         self._history: dict[str, deque] = {}  # key = "symbol:component"
+        self._stats: dict[str, list] = {}  # key -> [mean, m2, updates_since_resync]
 
     def normalize(self, symbol: str, component: str, raw_score: float) -> float:
         """
@@ -22,17 +28,44 @@ class SignalNormalizer:
         key = f"{component}"  # normalize across all symbols per component
         if key not in self._history:
             self._history[key] = deque(maxlen=self.lookback)
+            self._stats[key] = [0.0, 0.0, 0]
 
-        self._history[key].append(raw_score)
         buf = self._history[key]
+        stats = self._stats[key]
+        mean, m2, since = stats
+
+        if buf.maxlen is not None and len(buf) == buf.maxlen and buf:
+            # Window full: swap the oldest value for the new one
+            old = buf[0]
+            buf.append(raw_score)
+            new_mean = mean + (raw_score - old) / len(buf)
+            m2 += (raw_score - old) * (raw_score - new_mean + old - mean)
+            mean = new_mean
+        else:
+            buf.append(raw_score)
+            delta = raw_score - mean
+            mean += delta / len(buf)
+            m2 += delta * (raw_score - mean)
+
+        since += 1
+        if since >= max(1, self.lookback):
+            mean = sum(buf) / len(buf)
+            m2 = sum((x - mean) ** 2 for x in buf)
+            since = 0
+        stats[0], stats[1], stats[2] = mean, m2, since
 
         if len(buf) < 10:
             # Not enough history — use tanh scaling (maps any range to -1..+1)
             # Scale factor: multiply raw by 100 so typical 0.005 becomes 0.5 → tanh ≈ 0.46
             return math.tanh(raw_score * 100)
 
-        mean = sum(buf) / len(buf)
-        std = (sum((x - mean) ** 2 for x in buf) / len(buf)) ** 0.5
+        std = (max(m2, 0.0) / len(buf)) ** 0.5
+        if std < 1e-8:
+            # Near-flat window: leftover drift can straddle the cutoff, so recompute exactly
+            mean = sum(buf) / len(buf)
+            m2 = sum((x - mean) ** 2 for x in buf)
+            stats[0], stats[1], stats[2] = mean, m2, 0
+            std = (m2 / len(buf)) ** 0.5
 
         if std < 1e-10:
             return math.tanh(raw_score * 100)
@@ -1,23 +1,64 @@
 import csv
+import json
+import os
 from pathlib import Path
 
 
+def latest_path(csv_path: Path) -> Path:
+    """JSON snapshot of the newest rows of a log, next to the CSV."""
+    return Path(csv_path).with_suffix(".last.json")
+
+
+def _as_csv(row: dict) -> dict:
+    # Same text the CSV holds for each value
+    return {k: "" if v is None else str(v) for k, v in row.items()}
+
+
 class TradeLogger:
     def __init__(self, cfg):
         self.trades_csv = Path(cfg["logging"]["trades_csv"])
         self.events_csv = Path(cfg["logging"]["events_csv"])
+        self._last_trades = None  # (timestamp, rows) of the newest run
 
     def log_event(self, row: dict):
-        self._append(self.events_csv, row)
+        self._append(self.events_csv, [row])
+        self._write_latest(self.events_csv, {"row": _as_csv(row)})
 
     def log_trade(self, row: dict):
-        self._append(self.trades_csv, row)
+        self.log_trades([row])
+
+    def log_trades(self, rows: list[dict]):
+        """Append several trades with one open/write; the snapshot is refreshed once."""
+        if not rows:
+            return
+        self._append(self.trades_csv, rows)
+        for row in rows:
+            ts = row.get("timestamp")
+            if self._last_trades is None or self._last_trades[0] != ts:
+                self._last_trades = (ts, [])
+            self._last_trades[1].append(_as_csv(row))
+        self._write_latest(self.trades_csv, {"timestamp": self._last_trades[0], "rows": self._last_trades[1]})
 
-    def _append(self, path: Path, row: dict):
+    def _append(self, path: Path, rows: list[dict]):
         path.parent.mkdir(parents=True, exist_ok=True)
         exists = path.exists()
         with open(path, "a", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=list(row.keys()))
+            writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
             if not exists:
                 writer.writeheader()
-            writer.writerow(row)
+            writer.writerows(rows)
+
+    def _write_latest(self, path: Path, payload: dict):
+        """
+        Atomically replace the snapshot so readers (generate_report) can skip
+        parsing the CSV. csv_size records which version of the log it
+        describes; anything else appending to the CSV makes it stale.
+        """
+        try:
+            payload["csv_size"] = path.stat().st_size
+            target = latest_path(path)
+            tmp = target.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(payload), encoding="utf-8")
+            os.replace(tmp, target)
+        except OSError:
+            pass
@@ -428,15 +428,20 @@ class TradingFloor:
             })
 
             # --- Always log signals (even if approval pending) ---
+            db_rows = []
             for sym, details in all_signal_details.items():
                 details["timestamp"] = context["timestamp"]
                 details["symbol"] = sym
                 details["side"] = "BUY" if all_signals.get(sym, 0) > 0 else "SELL"
                 try:
                     self.signal_logger.log_signal(details)
-                    self.db.log_signal(details)
+                    db_rows.append(self.db.signal_row(details))
                 except Exception:
                     pass
+            try:
+                self.db.log_signal_rows(db_rows)  # one transaction for the whole scan
+            except Exception:
+                pass
 
             # --- Shadow Mode: Kalman + HMM ---
             kalman_results = {}
@@ -540,6 +545,7 @@ class TradingFloor:
                         # Reconstruct individual signal components if available
                         challenge_context["signal_details"][sym] = signal_details.get(sym, {}).get("components", {})
 
+                trade_records = []
                 for p in plan.get("plans", []):
                     sym = p["symbol"]
                     side = p["side"]
@@ -636,9 +642,10 @@ class TradingFloor:
                         "pnl": pnl,
                     }
 
-                    self.logger.log_trade(trade_record)
-                    self.db.log_trade(trade_record)
+                    trade_records.append(trade_record)
 
+                self.logger.log_trades(trade_records)
+                self.db.log_trades(trade_records)
                 self.portfolio.save()
 
             self.tracer.emit_reward({
@@ -10,13 +10,14 @@ import sqlite3
 import tempfile
 import unittest
 from unittest.mock import MagicMock, patch, PropertyMock
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
 
 # Ensure src is on path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
 from trading_floor.db import Database
+from trading_floor.agent_memory import AgentMemory
 from trading_floor.broker.alpaca_broker import AlpacaBroker, RateLimiter, _retry_with_backoff
 from trading_floor.broker.portfolio_state import PortfolioState
 from trading_floor.broker.order_ledger import OrderLedger
@@ -97,8 +98,15 @@ class TestDBSchema(unittest.TestCase):
             "idx_signal_accuracy_type",
             "idx_budget_reservations_strategy",
             "idx_config_history_field",
+            "idx_signals_ts",
+            "idx_trades_symbol_pnl",
+            "idx_trades_ts_pnl_sym",
+            "idx_agent_memory_outcome",
+            "idx_agent_memory_influenced",
         }
         self.assertTrue(expected_indexes.issubset(indexes), f"Missing: {expected_indexes - indexes}")
+        # Prefix of idx_trades_ts_pnl_sym, so it is no longer kept
+        self.assertNotIn("idx_trades_ts", indexes)
 
     def test_existing_tables_preserved(self):
         """Existing tables (trades, signals, etc.) must still work."""
@@ -112,6 +120,150 @@ class TestDBSchema(unittest.TestCase):
         self.assertEqual(cursor.fetchone()[0], 1)
         conn.close()
 
+    def test_batch_logging(self):
+        """log_signals / log_trades insert every row in one call."""
+        self.db.log_signals([
+            {"timestamp": "2026-01-01T00:00:00", "symbol": sym,
+             "components": {"momentum": 0.1}, "weights": {"momentum": 0.5}, "final_score": 0.05}
+            for sym in ("AAPL", "MSFT", "NVDA")
+        ])
+        self.db.log_trades([
+            {"timestamp": "2026-01-01T00:00:00", "symbol": "AAPL", "side": "buy", "quantity": 1, "price": 150.0},
+            {"timestamp": "2026-01-01T00:05:00", "symbol": "AAPL", "side": "sell", "quantity": 1, "price": 151.0},
+        ])
+        self.db.log_trades([])
+        conn = self.db._get_conn()
+        cursor = conn.cursor()
+        cursor.execute("SELECT symbol, score_mom, weight_mom FROM signals ORDER BY id")
+        self.assertEqual(cursor.fetchall(), [("AAPL", 0.1, 0.5), ("MSFT", 0.1, 0.5), ("NVDA", 0.1, 0.5)])
+        cursor.execute("SELECT COUNT(*) FROM trades")
+        self.assertEqual(cursor.fetchone()[0], 2)
+        conn.close()
+
+    def test_day_bounds(self):
+        """Half-open day range used by the per-day queries; bad dates are contained by callers."""
+        from trading_floor.db import day_bounds
+        from trading_floor.shadow import ShadowRunner
+        self.assertEqual(day_bounds("2026-02-28"), ("2026-02-28", "2026-03-01"))
+        result = ShadowRunner(os.path.join(self.tmp, "test.db"), {}).evaluate("not-a-date")
+        self.assertEqual(result["samples"], 0)
+
+    def test_signal_rows_built_per_signal(self):
+        """A malformed signal fails on its own row; the rest still go in one insert."""
+        rows = []
+        for comps in ({"momentum": 0.1}, None, {"news": 0.2}):
+            try:
+                rows.append(self.db.signal_row({"symbol": "AAPL", "components": comps}))
+            except AttributeError:
+                pass
+        self.db.log_signal_rows(rows)
+        conn = self.db._get_conn()
+        self.assertEqual(conn.execute("SELECT score_mom, score_news FROM signals ORDER BY id").fetchall(),
+                         [(0.1, 0.0), (0.0, 0.2)])
+        conn.close()
+
+
+# ═══════════════════════════════════════════════════════════
+# AgentMemory Tests
+# ═══════════════════════════════════════════════════════════
+
+class TestAgentMemory(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.mem = AgentMemory("news", os.path.join(self.tmp, "test.db"), {"rolling_window": 5})
+
+    def tearDown(self):
+        self.mem.close()
+
+    def test_concurrent_records_share_connection(self):
+        """record() from several threads goes through the one connection; prune keeps the window."""
+        from concurrent.futures import ThreadPoolExecutor
+        regime = {"spy_trend": "bull", "vix_level": "low", "label": "bull_low_vol"}
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(
+                lambda i: self.mem.record(
+                    {"symbol": "AAPL", "signal": "news_keyword", "signal_value": 0.1,
+                     "timestamp": f"2099-01-01T00:00:{i:02d}"}, regime),
+                range(12),
+            ))
+        self.assertEqual(self.mem.get_stats()["total_observations"], 5)
+        recalled = self.mem.recall(symbol="AAPL", regime=regime)
+        self.assertEqual([r["timestamp"][-2:] for r in recalled], ["11", "10", "09", "08", "07"])
+
+    def test_records_written_in_batches(self):
+        """Observations are buffered until flush_rows are pending (or a read flushes)."""
+        path = os.path.join(self.tmp, "batch.db")
+        mem = AgentMemory("pm", path, {"flush_rows": 3, "flush_seconds": 3600})
+        count = lambda: sqlite3.connect(path).execute("SELECT COUNT(*) FROM agent_memory").fetchone()[0]
+        mem.record({"symbol": "AAPL"}, {})
+        mem.record({"symbol": "MSFT"}, {})
+        self.assertEqual(count(), 0)
+        mem.record({"symbol": "NVDA"}, {})
+        self.assertEqual(count(), 3)
+        mem.record({"symbol": "TSLA"}, {})
+        self.assertEqual(mem.get_stats()["total_observations"], 4)
+        mem.close()
+
+    def test_accuracy_reads_do_not_flush_pending_rows(self):
+        """The news/PM pattern (accuracy read, then a pending record) still batches writes."""
+        path = os.path.join(self.tmp, "interleave.db")
+        mem = AgentMemory("news", path, {"flush_rows": 50, "flush_seconds": 3600})
+        inserts = []
+        mem._db.set_trace_callback(lambda sql: sql.lstrip().startswith("INSERT") and inserts.append(sql))
+        for i in range(20):
+            mem.get_signal_accuracy(signal_type="news_keyword")
+            mem.suggest_weight_adjustment(0.25)
+            mem.record({"symbol": f"S{i}", "signal": "news_keyword", "outcome": "pending"}, {})
+        self.assertEqual(inserts, [])
+        # A scored row is visible to the next accuracy read
+        mem.record({"symbol": "AAPL", "outcome": "win", "pnl": 1.0}, {})
+        mem.get_signal_accuracy()
+        self.assertEqual(mem.get_stats()["total_observations"], 21)
+        mem.close()
+        count = sqlite3.connect(path).execute("SELECT COUNT(*) FROM agent_memory").fetchone()[0]
+        self.assertEqual(count, 21)
+
+    def test_periodic_checkpoint_does_not_wait_for_readers(self):
+        """A reader holding a snapshot does not stall the checkpoint after a batch."""
+        path = os.path.join(self.tmp, "ckpt.db")
+        mem = AgentMemory("pm", path, {"flush_rows": 1})
+        mem.record({"symbol": "AAPL"}, {})
+        reader = sqlite3.connect(path)
+        reader.execute("BEGIN")
+        reader.execute("SELECT COUNT(*) FROM agent_memory").fetchone()
+        with patch("trading_floor.agent_memory._CHECKPOINT_ROWS", 1):
+            start = time.monotonic()
+            mem.record({"symbol": "MSFT"}, {})
+            self.assertLess(time.monotonic() - start, 1.0)
+        reader.rollback()
+        reader.close()
+        mem.close()
+
+    def test_signal_accuracy_decay_weighted(self):
+        """A win one half-life old counts half as much as a fresh loss."""
+        mem = AgentMemory("pm", os.path.join(self.tmp, "test.db"),
+                          {"min_samples": 2, "decay_halflife_days": 14})
+        now = datetime.utcnow()
+        for days, outcome, pnl in ((14, "win", 4.0), (0, "loss", -1.0), (0, "pending", 9.0)):
+            mem.record({"symbol": "AAPL", "outcome": outcome, "pnl": pnl,
+                        "timestamp": (now - timedelta(days=days)).isoformat()}, {})
+        acc = mem.get_signal_accuracy()
+        mem.close()
+        self.assertEqual(acc["sample_size"], 2)
+        self.assertAlmostEqual(acc["win_rate"], 1 / 3, places=3)
+        self.assertAlmostEqual(acc["avg_pnl"], (0.5 * 4.0 - 1.0) / 1.5, places=3)
+
+    def test_borrowed_connection_left_open(self):
+        """With conn= the memory uses the caller's connection as-is and close() does not close it."""
+        conn = sqlite3.connect(os.path.join(self.tmp, "shared.db"))
+        mem = AgentMemory("pm", os.path.join(self.tmp, "shared.db"), {}, conn=conn)
+        mem.record({"symbol": "AAPL", "outcome": "win", "pnl": 1.0}, {})
+        self.assertEqual(mem.recall()[0]["symbol"], "AAPL")
+        mem.close()
+        self.assertIsNone(conn.row_factory)
+        self.assertEqual(conn.execute("SELECT COUNT(*) FROM agent_memory").fetchone()[0], 1)
+        conn.close()
+
 
 # ═══════════════════════════════════════════════════════════
 # Rate Limiter Tests
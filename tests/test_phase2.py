@@ -482,5 +482,129 @@ class TestRunCLI(unittest.TestCase):
         self.assertTrue(args.swing_scan)
 
 
+# ── Shared signal features ───────────────────────────────────
+
+class TestSignalFeatures(unittest.TestCase):
+    def setUp(self):
+        import pandas as pd
+        from trading_floor.agents.signal_momentum import MomentumSignalAgent
+        from trading_floor.agents.signal_meanreversion import MeanReversionSignalAgent
+        from trading_floor.agents.signal_breakout import BreakoutSignalAgent
+        self.cfg = {"signals": {"momentum_short": 3, "meanrev_long": 5, "breakout_lookback": 4}}
+        tracer = MagicMock()
+        self.agents = [
+            MomentumSignalAgent(self.cfg, tracer),
+            MeanReversionSignalAgent(self.cfg, tracer),
+            BreakoutSignalAgent(self.cfg, tracer),
+        ]
+        self.df = pd.DataFrame({"close": [10.0, 11.0, 10.5, 12.0, 11.5, 13.0]})
+
+    def test_score_from_features_matches_score(self):
+        from trading_floor.agents.features import compute
+        feats = compute(self.df, self.cfg)
+        for agent in self.agents:
+            self.assertAlmostEqual(agent.score_from_features(feats), agent.score(self.df), places=12)
+
+    def test_known_values(self):
+        mom, mean, brk = (a.score(self.df) for a in self.agents)
+        sma3 = (11.5 + 12.0 + 13.0) / 3
+        sma5 = (11.0 + 10.5 + 12.0 + 11.5 + 13.0) / 5
+        self.assertAlmostEqual(mom, (13.0 - sma3) / sma3, places=12)
+        self.assertAlmostEqual(mean, (sma5 - 13.0) / sma5, places=12)
+        # Prior range [10.5, 12.0] excludes the current bar; 13.0 is a breakout up
+        self.assertEqual(brk, 1.0)
+
+    def test_float32_closes(self):
+        import numpy as np
+        df32 = self.df.astype({"close": np.float32})
+        for agent in self.agents:
+            score = agent.score(df32)
+            self.assertIsInstance(score, float)
+            self.assertAlmostEqual(score, agent.score(self.df), places=6)
+
+    def test_panel_matches_per_symbol(self):
+        import pandas as pd
+        from trading_floor.agents.features import compute, tail_panel, compute_panel
+        frames = [self.df, pd.DataFrame({"close": [10.0, 11.0]}), self.df.iloc[:4], pd.DataFrame({"close": []})]
+        panel, lengths = tail_panel(frames, dtype=float)
+        self.assertEqual(panel.shape, (6, 4))
+        for frame, feats in zip(frames, compute_panel(panel, lengths, self.cfg)):
+            expected = compute(frame, self.cfg)
+            self.assertEqual(feats["n"], expected["n"])
+            for key in ("sma_s", "sma_l", "prior_high", "prior_low"):
+                self.assertEqual(feats[key], expected[key], key)
+
+    def test_insufficient_history(self):
+        import pandas as pd
+        short = pd.DataFrame({"close": [10.0, 11.0]})
+        for agent in self.agents:
+            self.assertEqual(agent.score(short), 0.0)
+            self.assertEqual(agent.score(pd.DataFrame()), 0.0)
+
+
+# ── Scout ranking ────────────────────────────────────────────
+
+class TestScoutRankPanel(unittest.TestCase):
+    def test_rank_panel_matches_rank(self):
+        import numpy as np
+        import pandas as pd
+        from trading_floor.agents.scout import ScoutAgent
+        from trading_floor.agents.features import tail_panel
+        frames = {
+            "UP": pd.DataFrame({"close": [10.0, 10.5, 11.0, 12.0], "volume": [2e5] * 4}),
+            "DOWN": pd.DataFrame({"close": [20.0, 19.0, 18.5], "volume": [2e5] * 3}),
+            "THIN": pd.DataFrame({"close": [5.0, 6.0, 7.0], "volume": [10.0] * 3}),
+            "FLAT": pd.DataFrame({"close": [3.0, 3.0, 3.0]}),
+        }
+        scout = ScoutAgent({"min_avg_volume": 100_000}, MagicMock())
+        ranked = scout.rank(frames)
+        self.assertEqual([r["symbol"] for r in ranked], ["UP", "FLAT", "DOWN"])
+
+        syms = list(frames)
+        panel, lengths = tail_panel([frames[s] for s in syms], dtype=np.float64)
+        avg_vol = np.array([frames[s]["volume"].mean() if "volume" in frames[s] else np.nan for s in syms])
+        self.assertEqual(scout.rank_panel(syms, panel, lengths, avg_vol), ranked)
+        up = ranked[0]
+        self.assertAlmostEqual(up["trend"], 0.2)
+        self.assertAlmostEqual(up["vol"], frames["UP"]["close"].pct_change().dropna().std() * 252 ** 0.5)
+
+# ── Signal normalizer ────────────────────────────────────────
+
+class TestSignalNormalizer(unittest.TestCase):
+    @staticmethod
+    def _reference(buf, raw):
+        import math
+        if len(buf) < 10:
+            return math.tanh(raw * 100)
+        mean = sum(buf) / len(buf)
+        std = (sum((x - mean) ** 2 for x in buf) / len(buf)) ** 0.5
+        if std < 1e-10:
+            return math.tanh(raw * 100)
+        return max(-1.0, min(1.0, (raw - mean) / std / 3.0))
+
+    def test_incremental_matches_full_recompute(self):
+        import random
+        from collections import deque
+        from trading_floor.signal_normalizer import SignalNormalizer
+        rng = random.Random(7)
+        norm = SignalNormalizer(lookback=25)
+        window = deque(maxlen=25)
+        for i in range(300):
+            # Alternate noisy and flat stretches to exercise the drift resync
+            raw = rng.gauss(0.001, 0.005) if (i // 60) % 2 == 0 else 0.0042
+            window.append(raw)
+            self.assertAlmostEqual(norm.normalize("AAPL", "momentum", raw),
+                                   self._reference(window, raw), places=9)
+
+    def test_components_keep_separate_history(self):
+        from trading_floor.signal_normalizer import SignalNormalizer
+        norm = SignalNormalizer(lookback=20)
+        for i in range(15):
+            norm.normalize("AAPL", "momentum", 0.001 * i)
+        norm.normalize("AAPL", "breakout", 1.0)
+        self.assertEqual(len(norm._history["momentum"]), 15)
+        self.assertEqual(len(norm._history["breakout"]), 1)
+
+
 if __name__ == "__main__":
     unittest.main()
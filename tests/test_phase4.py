@@ -6,6 +6,7 @@ import sys
 import sqlite3
 import tempfile
 import shutil
+import time
 from datetime import datetime, date, timedelta, timezone
 from pathlib import Path
 from unittest import TestCase, main as unittest_main
@@ -312,6 +313,285 @@ class TestOverridesMerge(TestCase):
         self.assertEqual(cfg["strategies"]["intraday"]["threshold"], 0.25)
 
 
+class TestCachedConfig(TestCase):
+    """trading_floor.config parses once and hands out independent copies."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = Path(self.tmpdir) / "workflow.yaml"
+        self.path.write_text("hours:\n  tz: America/New_York\nuniverse: [AAPL]\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_load_returns_copies(self):
+        from trading_floor import config
+        a = config.load(self.path)
+        a["universe"].append("MSFT")
+        self.assertEqual(config.load(self.path)["universe"], ["AAPL"])
+
+    def test_tz(self):
+        from trading_floor import config
+        self.assertEqual(str(config.tz(self.path)), "America/New_York")
+
+    def test_sidecar_refreshes_on_edit(self):
+        from trading_floor import config
+        self.assertEqual(config.load(self.path)["universe"], ["AAPL"])
+        self.assertTrue(Path(f"{self.path.resolve()}.cache.pkl").exists())
+        self.path.write_text("hours:\n  tz: America/New_York\nuniverse: [AAPL, MSFT]\n")
+        config._parse.cache_clear()
+        self.assertEqual(config.load(self.path)["universe"], ["AAPL", "MSFT"])
+
+
+class TestTradeLoggerSnapshot(TestCase):
+    """TradeLogger mirrors the newest rows to a .last.json next to each CSV."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.cfg = {"logging": {"trades_csv": str(self.tmpdir / "trades.csv"),
+                                "events_csv": str(self.tmpdir / "events.csv")}}
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_snapshots_follow_latest_run(self):
+        from trading_floor.trade_logging import TradeLogger, latest_path
+        tl = TradeLogger(self.cfg)
+        tl.log_event({"timestamp": "t1", "risk_ok": True, "risk_notes": None})
+        tl.log_trade({"timestamp": "t1", "symbol": "AAPL", "score": 0.5})
+        tl.log_trade({"timestamp": "t2", "symbol": "MSFT", "score": 0.25})
+        tl.log_trade({"timestamp": "t2", "symbol": "NVDA", "score": 0.75})
+
+        event = json.loads(latest_path(tl.events_csv).read_text())
+        self.assertEqual(event["row"], {"timestamp": "t1", "risk_ok": "True", "risk_notes": ""})
+        self.assertEqual(event["csv_size"], tl.events_csv.stat().st_size)
+        trades = json.loads(latest_path(tl.trades_csv).read_text())
+        self.assertEqual(trades["timestamp"], "t2")
+        self.assertEqual([r["symbol"] for r in trades["rows"]], ["MSFT", "NVDA"])
+
+    def test_log_trades_batch(self):
+        from trading_floor.trade_logging import TradeLogger, latest_path
+        tl = TradeLogger(self.cfg)
+        tl.log_trades([{"timestamp": "t1", "symbol": s, "score": 0.5} for s in ("AAPL", "MSFT")])
+        tl.log_trades([{"timestamp": "t1", "symbol": "NVDA", "score": 0.5}])
+        lines = tl.trades_csv.read_text(encoding="utf-8").splitlines()
+        self.assertEqual(lines[0], "timestamp,symbol,score")
+        self.assertEqual(len(lines), 4)
+        trades = json.loads(latest_path(tl.trades_csv).read_text())
+        self.assertEqual([r["symbol"] for r in trades["rows"]], ["AAPL", "MSFT", "NVDA"])
+
+
+class TestPortfolioSave(TestCase):
+    """Portfolio.save replaces portfolio.json in one step."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_save_round_trip(self):
+        from trading_floor.portfolio import Portfolio, Position
+        p = Portfolio(_make_cfg())
+        p.file_path = self.tmpdir / "portfolio.json"
+        p.state.cash = 1234.5
+        p.state.positions["AAPL"] = Position(symbol="AAPL", quantity=3, avg_price=150.0)
+        p.save()
+        self.assertEqual([f.name for f in self.tmpdir.iterdir()], ["portfolio.json"])
+
+        q = Portfolio(_make_cfg())
+        q.file_path = p.file_path
+        state = q._load()
+        self.assertEqual(state.cash, 1234.5)
+        self.assertEqual(state.positions["AAPL"].quantity, 3)
+
+
+class TestSectorSentimentCache(TestCase):
+    """Sector scores and headlines are shared between processes via the disk cache."""
+
+    def setUp(self):
+        from trading_floor import sector_filter
+        self.sf = sector_filter
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.patches = [
+            patch.object(sector_filter, "_CACHE_PATH", self.tmpdir / "sector_sentiment.sqlite"),
+            patch.dict(sector_filter._sector_cache, clear=True),
+            patch.dict(sector_filter._headline_cache, clear=True),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in reversed(self.patches):
+            p.stop()
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_fresh_process_reads_disk(self):
+        sector = next(iter(self.sf.SECTOR_QUERIES))
+        with patch.object(self.sf, "_fetch_sector_news", return_value=["Stocks rally on strong earnings"]) as fetch:
+            score = self.sf.get_sector_sentiment(sector)
+            self.sf._sector_cache.clear()
+            self.sf._headline_cache.clear()
+            self.assertEqual(self.sf.get_sector_sentiment(sector), score)
+        fetch.assert_called_once()
+
+    def test_headlines_serve_smaller_requests(self):
+        with patch.object(self.sf, "_fetch_sector_news", side_effect=lambda q, n: [f"h{i}" for i in range(n)]) as fetch:
+            self.assertEqual(len(self.sf._scrape_sector_news("q", max_headlines=5)), 5)
+            self.assertEqual(self.sf._scrape_sector_news("q", max_headlines=3), ["h0", "h1", "h2"])
+            self.assertEqual(len(self.sf._scrape_sector_news("q", max_headlines=10)), 10)
+        self.assertEqual(fetch.call_count, 2)
+
+    def test_failed_scrape_not_shared(self):
+        sector = next(iter(self.sf.SECTOR_QUERIES))
+        with patch.object(self.sf, "_fetch_sector_news", return_value=[]):
+            self.assertEqual(self.sf.get_sector_sentiment(sector), 0.0)
+        self.sf._sector_cache.clear()
+        with patch.object(self.sf, "_fetch_sector_news", return_value=["Stocks rally on strong earnings"]) as fetch:
+            self.sf.get_sector_sentiment(sector)
+        fetch.assert_called_once()
+
+    def test_all_sectors_scraped_concurrently(self):
+        with patch.object(self.sf, "_fetch_sector_news", side_effect=lambda q, n: [q]) as fetch:
+            scores = self.sf.get_all_sector_sentiments()
+        self.assertEqual(list(scores), list(self.sf.SECTOR_QUERIES))
+        self.assertEqual(fetch.call_count, len(self.sf.SECTOR_QUERIES))
+
+
+class TestNewsSentimentCache(TestCase):
+    """News scores are shared across instances for CACHE_TTL and mirrored to disk."""
+
+    def setUp(self):
+        from trading_floor.agents.news import NewsSentimentAgent
+        self.Agent = NewsSentimentAgent
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.patches = [
+            patch.object(NewsSentimentAgent, "CACHE_PATH", self.tmpdir / "news_sentiment.sqlite"),
+            patch.dict(NewsSentimentAgent._cache, clear=True),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in reversed(self.patches):
+            p.stop()
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _agent(self):
+        return self.Agent({}, MagicMock())
+
+    def test_shared_within_ttl(self):
+        with patch.object(self.Agent, "_fetch", return_value=0.4) as fetch:
+            self.assertEqual(self._agent().get_sentiment("AAPL"), 0.4)
+            self.assertEqual(self._agent().get_sentiment("AAPL"), 0.4)
+        fetch.assert_called_once()
+
+    def test_fresh_process_reads_disk(self):
+        with patch.object(self.Agent, "_fetch", return_value=0.4) as fetch:
+            self._agent().get_sentiment("AAPL")
+            self.Agent._cache.clear()
+            self.assertEqual(self._agent().get_sentiment("AAPL"), 0.4)
+        fetch.assert_called_once()
+
+    def test_expired_entry_refetched(self):
+        with patch.object(self.Agent, "_fetch", side_effect=[0.4, -0.2]) as fetch:
+            self._agent().get_sentiment("AAPL")
+            with patch("trading_floor.agents.news.time.time", return_value=time.time() + self.Agent.CACHE_TTL + 1):
+                self.assertEqual(self._agent().get_sentiment("AAPL"), -0.2)
+        self.assertEqual(fetch.call_count, 2)
+
+
+class TestPriceCache(TestCase):
+    """PriceCache keeps one parquet per completed day and refetches only what is missing."""
+
+    NOW = "2026-10-16 12:00"  # a Friday, market open
+
+    def setUp(self):
+        from trading_floor import data
+        self.data = data
+        self.tmpdir = Path(tempfile.mkdtemp())
+        self.available = [date(2026, 10, d) for d in (12, 13, 14, 15, 16)]
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _cache(self, now=NOW, holidays=()):
+        import pandas as pd
+        cache = self.data.PriceCache(cache_dir=self.tmpdir, holidays=list(holidays))
+        cache._now = lambda: pd.Timestamp(now, tz="America/New_York")
+        return cache
+
+    def _fake_fetch(self, interval="5m", prefixed=False):
+        import pandas as pd
+
+        def fetch(symbols, start=None, end=None):
+            out = {}
+            for sym in symbols:
+                days = [d for d in self.available if start <= d < end]
+                if interval == "1d":
+                    stamps = [pd.Timestamp(d) for d in days]
+                else:
+                    stamps = [t for d in days for t in pd.date_range(
+                        f"{d} 09:30", periods=3, freq="5min", tz="America/New_York")]
+                col = f"{sym.lower()}_close" if prefixed else "close"
+                df = pd.DataFrame({"datetime": stamps, col: [float(t.day) for t in stamps]})
+                out[sym] = self.data.MarketData(symbol=sym, df=df)
+            return out
+        return patch.object(self.data.YahooDataProvider, "_fetch_from_yahoo", side_effect=fetch)
+
+    def _cached_days(self, interval, sym):
+        return sorted(p.stem for p in (self.tmpdir / interval / sym).glob("*.parquet"))
+
+    def test_cached_days_reused_and_today_refetched(self):
+        with self._fake_fetch() as fetch:
+            first = self._cache().get(["AAPL", "MSFT"], lookback="3d")
+            second = self._cache().get(["AAPL", "MSFT"], lookback="3d")
+        self.assertEqual(fetch.call_count, 2)
+        self.assertEqual(fetch.call_args_list[0].kwargs["start"], date(2026, 10, 14))
+        self.assertEqual(fetch.call_args_list[1].kwargs["start"], date(2026, 10, 16))
+        self.assertEqual(self._cached_days("5m", "AAPL"), ["2026-10-14", "2026-10-15"])
+        for res in (first, second):
+            self.assertEqual(len(res["AAPL"].df), 9)
+            self.assertEqual(sorted(set(res["MSFT"].df["close"])), [14.0, 15.0, 16.0])
+
+    def test_single_symbol_prefix_stripped(self):
+        import pandas as pd
+        with self._fake_fetch(prefixed=True):
+            res = self._cache().get(["META"], lookback="2d")
+        self.assertIn("close", res["META"].df.columns)
+        cached = pd.read_parquet(self.tmpdir / "5m" / "META" / "2026-10-15.parquet")
+        self.assertEqual(list(cached.columns), ["datetime", "close"])
+
+    def test_daily_bars_bucketed_by_market_day(self):
+        import pandas as pd
+        with self._fake_fetch(interval="1d"):
+            res = self._cache().get(["SPY"], interval="1d", lookback="3d")
+        self.assertEqual(list(res["SPY"].df["close"]), [14.0, 15.0, 16.0])
+        cached = pd.read_parquet(self.tmpdir / "1d" / "SPY" / "2026-10-14.parquet")
+        self.assertEqual(list(cached["close"]), [14.0])
+
+    def test_partial_response_not_cached_as_empty(self):
+        self.available = [date(2026, 10, 14)]
+        with self._fake_fetch():
+            self._cache().get(["AAPL"], lookback="3d")
+        # Oct 15 might just be missing from this response, so it stays uncached
+        self.assertEqual(self._cached_days("5m", "AAPL"), ["2026-10-14"])
+        self.available = [date(2026, 10, 14), date(2026, 10, 16)]
+        with self._fake_fetch():
+            self._cache().get(["AAPL"], lookback="3d")
+        self.assertEqual(self._cached_days("5m", "AAPL"), ["2026-10-14", "2026-10-15"])
+
+    def test_needed_days(self):
+        import pandas as pd
+        monday = pd.Timestamp("2026-10-19")
+        days = lambda cache, sym, opened=True: [f"{d:%m-%d}" for d in cache._needed_days(sym, 3, monday, opened)]
+        cache = self._cache(holidays=["2026-10-15"])
+        self.assertEqual(days(cache, "BTC-USD"), ["10-17", "10-18", "10-19"])
+        self.assertEqual(days(cache, "AAPL"), ["10-14", "10-16", "10-19"])
+        # Before the open the latest session is the previous trading day
+        self.assertEqual(days(cache, "AAPL", opened=False), ["10-13", "10-14", "10-16"])
+
+
 class TestFridayDetection(TestCase):
     """Test that weekly_apply is triggered on Fridays."""
 